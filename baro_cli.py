@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Headless command line interface for Baro Path Quick Access Indicator
+(gi/Gtk 를 import 하지 않음)
+
+사용법:
+    baro list
+    baro path <alias>
+    baro open <alias> [--terminal]
+    baro migrate [--force]
+    baro export [-o FILE]
+    baro switch
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import List, Optional
+
+from settings_manager import SettingsManager
+from launchers import LauncherRegistry, is_gvfs_path
+from i18n import t, set_language
+
+COMMANDS = ("list", "path", "open", "migrate", "export", "switch")
+
+
+def is_cli_command(argv: List[str]) -> bool:
+    """명령줄 인자가 CLI 하위 명령인지 여부"""
+    return len(argv) > 1 and argv[1] in COMMANDS
+
+
+def cmd_list(settings: SettingsManager, args) -> int:
+    """별칭과 경로를 탭으로 구분하여 출력"""
+    for p in settings.get_sorted_paths():
+        print(f"{p.get('alias', '')}\t{p.get('path', '')}")
+    return 0
+
+
+def cmd_path(settings: SettingsManager, args) -> int:
+    """별칭에 해당하는 경로 출력"""
+    entry = settings.get_path(args.alias)
+    if entry is None:
+        print(t("msg_alias_not_found", args.alias), file=sys.stderr)
+        return 1
+    print(entry.get("path", ""))
+    return 0
+
+
+def cmd_open(settings: SettingsManager, args) -> int:
+    """파일 관리자 또는 터미널로 열기 (트레이와 같은 실행 규칙 사용)"""
+    entry = settings.get_path(args.alias)
+    if entry is None:
+        print(t("msg_alias_not_found", args.alias), file=sys.stderr)
+        return 1
+
+    path = entry.get("path", "")
+    if not is_gvfs_path(path) and not os.path.exists(path):
+        print(t("msg_folder_not_found", path), file=sys.stderr)
+        return 1
+
+    launchers = LauncherRegistry()
+    if args.terminal:
+        launch = launchers.terminal_command(path, settings.terminal)
+        error_key = "msg_cannot_open_terminal"
+    else:
+        launch = launchers.folder_command(path, settings.file_manager)
+        error_key = "msg_cannot_open_folder"
+
+    try:
+        # CLI 는 바로 종료하므로 자식은 새 세션으로 분리
+        subprocess.Popen(launch.argv, cwd=launch.cwd, start_new_session=True,
+                         stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                         stderr=subprocess.DEVNULL)
+    except OSError as e:
+        print(t(error_key, str(e)), file=sys.stderr)
+        return 1
+    settings.record_usage(path)
+    return 0
+
+
+def cmd_migrate(settings: SettingsManager, args) -> int:
+    """settings.json 을 SQLite 저장소 (settings.db) 로 옮김 (settings.json 은 그대로 둠)"""
+    from sqlite_store import SQLiteStore
+    if settings.db_file.exists() and not args.force:
+        print(t("msg_db_exists", str(settings.db_file)), file=sys.stderr)
+        return 1
+    
+    data = settings.to_dict()
+    store = SQLiteStore(settings.db_file)
+    try:
+        store.import_settings(data)
+        # 다시 읽어 원본과 같은지 확인
+        if store.export_settings() != data:
+            print(t("msg_migrate_mismatch", str(settings.db_file)), file=sys.stderr)
+            return 1
+    finally:
+        store.close()
+    print(t("msg_migrated", len(data["paths"]), str(settings.db_file)))
+    return 0
+
+
+def cmd_export(settings: SettingsManager, args) -> int:
+    """현재 설정을 settings.json 형식으로 출력 (-o 지정 시 파일로 저장)"""
+    text = json.dumps(settings.to_dict(), ensure_ascii=False, indent=2)
+    if not args.output:
+        print(text)
+        return 0
+    with open(args.output, "w", encoding="utf-8") as f:
+        f.write(text)
+    return 0
+
+
+def cmd_switch(settings: SettingsManager, args) -> int:
+    """실행 중인 트레이의 빠른 전환 창 열기 (D-Bus, Gtk 는 import 하지 않음)"""
+    from dbus_service import call_running_instance
+    if call_running_instance("QuickSwitch") is None:
+        print(t("msg_not_running"), file=sys.stderr)
+        return 1
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog="baro", description="Baro - Path Quick Access")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("list", help="list bookmarks (alias<TAB>path)")
+
+    path_parser = sub.add_parser("path", help="print the path of a bookmark")
+    path_parser.add_argument("alias")
+
+    open_parser = sub.add_parser("open", help="open a bookmark")
+    open_parser.add_argument("alias")
+    open_parser.add_argument("--terminal", action="store_true", help="open in terminal")
+
+    migrate_parser = sub.add_parser("migrate", help="move settings.json into settings.db (SQLite)")
+    migrate_parser.add_argument("--force", action="store_true", help="overwrite an existing settings.db")
+
+    export_parser = sub.add_parser("export", help="export settings in settings.json format")
+    export_parser.add_argument("-o", "--output", help="write to FILE instead of stdout")
+
+    sub.add_parser("switch", help="open the quick switcher of the running tray")
+
+    args = parser.parse_args(argv)
+
+    # migrate 는 항상 settings.json 에서 읽음
+    settings = SettingsManager(backend="json" if args.command == "migrate" else None)
+    set_language(settings.language)
+
+    handlers = {"list": cmd_list, "path": cmd_path, "open": cmd_open,
+                "migrate": cmd_migrate, "export": cmd_export, "switch": cmd_switch}
+    return handlers[args.command](settings, args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
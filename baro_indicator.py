@@ -9,9 +9,17 @@ Baro - Path Quick Access Indicator for Ubuntu
 """
 
 import os
-import subprocess
 import signal
 import sys
+import time
+
+_STARTED_AT = time.perf_counter()
+
+# 명령줄 하위 명령 (list/path/open) 은 Gtk 를 초기화하지 않고 바로 처리
+if __name__ == "__main__":
+    import baro_cli
+    if baro_cli.is_cli_command(sys.argv):
+        sys.exit(baro_cli.main(sys.argv[1:]))
 
 import gi
 gi.require_version('Gtk', '3.0')
@@ -19,25 +27,68 @@ gi.require_version('AppIndicator3', '0.1')
 from gi.repository import Gtk, AppIndicator3, GLib
 
 from settings_manager import SettingsManager
-from settings_dialog import SettingsDialog
+from menu_model import build_model
+from menu_renderer import MenuRenderer
+from icon_cache import IconCache
+from path_checker import PathChecker
+from health_scanner import HealthScanner
+from mount_monitor import MountTable
+from launchers import LauncherRegistry, is_gvfs_path
+from spawner import Spawner
+from dbus_service import BaroService, call_running_instance
+from config_watcher import ConfigWatcher
+from profiling import PROFILER
 from i18n import t, set_language
 
+_IMPORTED_AT = time.perf_counter()
+
 
 class BaroIndicator:
     """Baro 시스템 트레이 인디케이터"""
     
     APPINDICATOR_ID = "baro-path-indicator"
     
+    # 메뉴 구성에 영향을 주는 일반 설정
+    MENU_SETTINGS = {"language", "sort_mode", "menu_grouping", "menu_item_cap", "browse_depth", "profiling"}
+    
+    PROFILE_FILE = SettingsManager.CONFIG_DIR / "profile.pstats"
+    
     def __init__(self):
         self.settings = SettingsManager()
         
+        # 계측 (BARO_PROFILE 환경 변수 또는 "profiling" 설정)
+        PROFILER.configure_from_env(self.settings.profiling)
+        
         # 언어 설정 적용
         set_language(self.settings.language)
         
+        # 경로 확인은 작업 스레드에서 (네트워크 마운트가 메인 루프를 막지 않도록)
+        self.path_checker = PathChecker(timeout=self.settings.path_check_timeout)
+        
+        # 터미널/파일 관리자는 시작할 때 한 번만 검색
+        self.launchers = LauncherRegistry()
+        self.spawner = Spawner()
+        
+        # 마운트 표 (GVFS/이동식 미디어 경로는 파일 시스템 대신 마운트 이벤트로 판단)
+        self.mounts = MountTable(self._on_mounts_changed)
+        self.mounts.start()
+        
+        # 백그라운드 경로 상태 확인 (접근 불가 항목은 메뉴에서 흐리게 표시)
+        # 응답 없는 마운트가 클릭 확인용 작업 스레드를 막지 않도록 작업 스레드 하나를 따로 사용
+        self.scan_checker = PathChecker(timeout=self.settings.path_check_timeout, cache_ttl=0,
+                                        workers=1, max_abandoned=4, name="baro-scan")
+        self.health_scanner = HealthScanner(
+            self.scan_checker,
+            self._scanned_paths,
+            self._on_health_changed,
+            interval=self.settings.health_scan_interval,
+        )
+        
         # 아이콘 경로 설정
         script_dir = os.path.dirname(os.path.abspath(__file__))
         self.icons_dir = os.path.join(script_dir, "icons")
         app_icon = os.path.join(self.icons_dir, "appicon.png")
+        self.icons = IconCache(self.icons_dir)
         
         # AppIndicator 생성
         self.indicator = AppIndicator3.Indicator.new(
@@ -48,199 +99,233 @@ class BaroIndicator:
         self.indicator.set_status(AppIndicator3.IndicatorStatus.ACTIVE)
         self.indicator.set_title("Baro")
         
-        # 메뉴 생성
-        self.build_menu()
-    
-    def build_menu(self):
-        """메뉴 구성"""
-        menu = Gtk.Menu()
-        
-        # 아이콘 파일 경로
-        folder_icon_path = os.path.join(self.icons_dir, "folder.png")
-        terminal_icon_path = os.path.join(self.icons_dir, "terminal.png")
-        settings_icon_path = os.path.join(self.icons_dir, "settings.png")
-        refresh_icon_path = os.path.join(self.icons_dir, "refresh.png")
-        quit_icon_path = os.path.join(self.icons_dir, "quit.png")
+        # 빠른 전환 창과 검색 색인 (처음 열 때 생성)
+        self.search_index = None
+        self._switcher = None
         
-        # 경로 목록 추가
-        paths = self.settings.get_sorted_paths()
+        # 열려 있는 설정 창 (한 번에 하나만)
+        self._settings_dialog = None
         
-        if paths:
-            for path_item in paths:
-                alias = path_item.get("alias", "")
-                path = path_item.get("path", "")
-                
-                # 메인 항목: 별칭 (클릭 시 파일 브라우저 열기)
-                folder_item = Gtk.ImageMenuItem()
-                folder_item.set_label(alias)
-                folder_item.set_always_show_image(True)
-                
-                # 폴더 아이콘
-                if os.path.exists(folder_icon_path):
-                    icon = Gtk.Image.new_from_file(folder_icon_path)
-                    folder_item.set_image(icon)
-                
-                folder_item.connect("activate", self.on_open_folder, path)
-                menu.append(folder_item)
-            
-            # 구분선
-            menu.append(Gtk.SeparatorMenuItem())
-            
-            # 터미널 서브메뉴
-            term_menu_item = Gtk.ImageMenuItem()
-            term_menu_item.set_label(t("menu_open_in_terminal"))
-            term_menu_item.set_always_show_image(True)
-            if os.path.exists(terminal_icon_path):
-                icon = Gtk.Image.new_from_file(terminal_icon_path)
-                term_menu_item.set_image(icon)
-            
-            term_submenu = Gtk.Menu()
-            
-            for path_item in paths:
-                alias = path_item.get("alias", "")
-                path = path_item.get("path", "")
-                
-                term_item = Gtk.ImageMenuItem()
-                term_item.set_label(alias)
-                term_item.set_always_show_image(True)
-                if os.path.exists(terminal_icon_path):
-                    icon = Gtk.Image.new_from_file(terminal_icon_path)
-                    term_item.set_image(icon)
-                term_item.connect("activate", self.on_open_terminal, path)
-                term_submenu.append(term_item)
-            
-            term_menu_item.set_submenu(term_submenu)
-            menu.append(term_menu_item)
-            
-            # 구분선
-            menu.append(Gtk.SeparatorMenuItem())
-        else:
-            # 경로가 없을 때
-            empty_item = Gtk.MenuItem(label=t("menu_no_paths"))
-            empty_item.set_sensitive(False)
-            menu.append(empty_item)
-            menu.append(Gtk.SeparatorMenuItem())
+        # 메뉴 생성 (골격은 한 번 만들고 이후에는 모델이 바뀐 경우 바뀐 항목만 갱신)
+        self.renderer = MenuRenderer(self.icons, {
+            "open_folder": self.on_open_folder,
+            "open_terminal": self.on_open_terminal,
+            "quick_switch": self.on_quick_switch,
+            "settings": self.on_settings,
+            "refresh": self.on_refresh,
+            "diagnostics": self.on_diagnostics,
+            "about": self.on_about,
+            "quit": self.on_quit,
+        })
+        self.menu = self.renderer.menu
+        self.indicator.set_menu(self.menu)
+        self.build_menu()
+        self.health_scanner.start()
         
-        # 설정 메뉴
-        settings_item = Gtk.ImageMenuItem()
-        settings_item.set_label(t("menu_settings"))
-        settings_item.set_always_show_image(True)
-        if os.path.exists(settings_icon_path):
-            icon = Gtk.Image.new_from_file(settings_icon_path)
-            settings_item.set_image(icon)
-        settings_item.connect("activate", self.on_settings)
-        menu.append(settings_item)
+        # 설정 변경 (설정 창, 외부 편집, D-Bus) 은 ChangeSet 으로 받아 필요한 부분만 반영
+        self.settings.add_listener(self._on_settings_changed)
         
-        # 새로고침 메뉴
-        refresh_item = Gtk.ImageMenuItem()
-        refresh_item.set_label(t("menu_refresh"))
-        refresh_item.set_always_show_image(True)
-        if os.path.exists(refresh_icon_path):
-            icon = Gtk.Image.new_from_file(refresh_icon_path)
-            refresh_item.set_image(icon)
-        refresh_item.connect("activate", self.on_refresh)
-        menu.append(refresh_item)
-
-        # 정보 메뉴 (About)
-        about_item = Gtk.ImageMenuItem()
-        about_item.set_label("About Baro")
-        about_item.set_always_show_image(True)
-        # 아이콘은 appicon 사용 (작게)
-        app_icon_path = os.path.join(self.icons_dir, "appicon.png")
-        if os.path.exists(app_icon_path):
-            # Scale simply by loading into Gtk.Image (might be big, but Gtk usually handles menu icons ok or we can accept it)
-            # Or use pixbuf to scale. For simplicity provided standard Gtk behavior:
-            icon = Gtk.Image.new_from_file(app_icon_path)
-            about_item.set_image(icon)
-        about_item.connect("activate", self.on_about)
-        menu.append(about_item)
+        # 설정 파일이 외부에서 바뀌면 자동으로 다시 로드
+        self.config_watcher = ConfigWatcher(self.settings.storage_file, self._reload_settings)
+        self.config_watcher.start()
+    
+    def build_menu(self):
+        """메뉴 모델을 만들어 위젯에 반영 (이전과 같은 메뉴면 위젯은 건드리지 않음)"""
+        with PROFILER.span("menu.build"):
+            model = build_model(self.settings, self.is_reachable, diagnostics=PROFILER.enabled)
+            self.renderer.render(model)
+    
+    def is_reachable(self, path):
+        """메뉴에 표시할 접근 가능 여부 (마운트 경로는 마운트 표, 나머지는 백그라운드 확인 결과)"""
+        mounted = self.mounts.reachability(path)
+        if mounted is not None:
+            return mounted
+        return self.health_scanner.is_reachable(path)
+    
+    def _scanned_paths(self):
+        """백그라운드 확인 대상 (마운트 표로 판단하는 경로는 파일 시스템을 건드리지 않음)"""
+        paths = (p.get("path", "") for p in self.settings.paths)
+        return [path for path in paths if self.mounts.reachability(path) is None]
+    
+    def _on_mounts_changed(self, roots):
+        """마운트 추가/해제: 해당 마운트 아래 북마크가 있을 때만 메뉴 갱신 (바뀐 항목만 반영)"""
+        affected = [
+            p.get("path", "") for p in self.settings.paths
+            if self.mounts.mount_root(p.get("path", "")) in roots
+        ]
+        for path in affected:
+            self.path_checker.invalidate(path)
+        if affected:
+            self.build_menu()
+    
+    def _with_existing_path(self, path, action):
+        """경로 존재를 작업 스레드에서 확인한 뒤 action(path, 클릭 시각) 실행"""
+        started_at = time.monotonic()
         
-        # 구분선
-        menu.append(Gtk.SeparatorMenuItem())
+        # GVFS 경로는 마운트 표로만 판단 (마운트되어 있으면 확인 없이 바로 실행)
+        if is_gvfs_path(path):
+            if self.mounts.reachability(path):
+                action(path, started_at)
+            else:
+                self._show_error(t("msg_not_mounted", path))
+            return
         
-        # 종료 메뉴
-        quit_item = Gtk.ImageMenuItem()
-        quit_item.set_label(t("menu_quit"))
-        quit_item.set_always_show_image(True)
-        if os.path.exists(quit_icon_path):
-            icon = Gtk.Image.new_from_file(quit_icon_path)
-            quit_item.set_image(icon)
-        quit_item.connect("activate", self.on_quit)
-        menu.append(quit_item)
+        def on_checked(path, exists):
+            if exists:
+                action(path, started_at)
+            elif exists is None:
+                self._show_error(t("msg_path_timeout", path))
+            else:
+                self._show_error(t("msg_folder_not_found", path))
         
-        menu.show_all()
-        self.indicator.set_menu(menu)
+        self.path_checker.timeout = self.settings.path_check_timeout
+        self.path_checker.check(path, on_checked)
+    
+    def _on_health_changed(self, changed_paths):
+        """접근 가능 상태가 바뀐 경로가 북마크에 있을 때만 메뉴 갱신 (바뀐 항목만 반영)"""
+        if any(p.get("path", "") in changed_paths for p in self.settings.paths):
+            self.build_menu()
     
     def on_open_folder(self, widget, path):
         """파일 브라우저로 폴더 열기"""
-        # GVFS 경로 (sftp, smb 등) 또는 로컬 경로 지원
-        is_gvfs = path.startswith("/run/user/") and "/gvfs/" in path
-        
-        if is_gvfs or os.path.exists(path):
-            try:
-                if is_gvfs:
-                    # GVFS 경로는 파일 관리자를 직접 호출 (가장 확실한 방법)
-                    file_managers = ["nautilus", "nemo", "thunar", "dolphin", "pcmanfm"]
-                    opened = False
-                    
-                    for fm in file_managers:
-                        try:
-                            subprocess.Popen([fm, path])
-                            opened = True
-                            break
-                        except FileNotFoundError:
-                            continue
-                    
-                    if not opened:
-                        # 최후의 수단: xdg-open with file:// URI
-                        file_uri = "file://" + path
-                        subprocess.Popen(["xdg-open", file_uri])
-                else:
-                    subprocess.Popen([self.settings.file_manager, path])
-            except Exception as e:
-                self._show_error(t("msg_cannot_open_folder", str(e)))
-        else:
-            self._show_error(t("msg_folder_not_found", path))
+        self._with_existing_path(path, self._launch_folder)
+    
+    def _launch_folder(self, path, started_at=None):
+        launch = self.launchers.folder_command(path, self.settings.file_manager)
+        pid = self.spawner.spawn(
+            launch.argv, launch.cwd, started_at,
+            on_error=lambda msg: self._show_error(t("msg_cannot_open_folder", msg)),
+            name="launch.folder"
+        )
+        if pid is not None:
+            GLib.idle_add(self._record_usage, path)
     
     def on_open_terminal(self, widget, path):
         """터미널로 폴더 열기"""
-        # GVFS 경로 (sftp, smb 등) 또는 로컬 경로 지원
-        is_gvfs = path.startswith("/run/user/") and "/gvfs/" in path
-        
-        if is_gvfs or os.path.exists(path):
-            try:
-                terminal = self.settings.terminal
-                # 다양한 터미널 지원
-                if "gnome-terminal" in terminal:
-                    subprocess.Popen([terminal, "--working-directory", path])
-                elif "konsole" in terminal:
-                    subprocess.Popen([terminal, "--workdir", path])
-                elif "xfce4-terminal" in terminal:
-                    subprocess.Popen([terminal, "--working-directory", path])
-                elif "tilix" in terminal:
-                    subprocess.Popen([terminal, "--directory", path])
-                elif "alacritty" in terminal:
-                    subprocess.Popen([terminal, "--working-directory", path])
-                elif "kitty" in terminal:
-                    subprocess.Popen([terminal, "--directory", path])
-                else:
-                    # 기본: 해당 디렉토리로 이동 후 터미널 실행
-                    subprocess.Popen(terminal, cwd=path, shell=True)
-            except Exception as e:
-                self._show_error(t("msg_cannot_open_terminal", str(e)))
+        self._with_existing_path(path, self._launch_terminal)
+    
+    def _launch_terminal(self, path, started_at=None):
+        launch = self.launchers.terminal_command(path, self.settings.terminal)
+        pid = self.spawner.spawn(
+            launch.argv, launch.cwd, started_at,
+            on_error=lambda msg: self._show_error(t("msg_cannot_open_terminal", msg)),
+            name="launch.terminal"
+        )
+        if pid is not None:
+            GLib.idle_add(self._record_usage, path)
+    
+    def _record_usage(self, path):
+        """사용 기록 추가 (실행 후 idle 에서 처리, frecency 정렬이면 바뀐 순서만 반영)"""
+        self.settings.record_usage(path)
+        if self.settings.sort_mode == "frecency":
+            self.build_menu()
+        return False
+    
+    def open_alias(self, alias, terminal=False):
+        """별칭으로 폴더/터미널 열기 (D-Bus 원격 명령용, 별칭이 없으면 False)
+
+        오류 다이얼로그 (dialog.run) 가 D-Bus 응답을 붙잡지 않도록 별칭만 확인해
+        바로 반환하고, 실제 열기는 idle 에서 처리한다.
+        """
+        path_item = self.settings.get_path(alias)
+        if path_item is None:
+            return False
+        GLib.idle_add(self._open_path, path_item.get("path", ""), terminal)
+        return True
+    
+    def _open_path(self, path, terminal):
+        if terminal:
+            self.on_open_terminal(None, path)
         else:
-            self._show_error(t("msg_folder_not_found", path))
+            self.on_open_folder(None, path)
+        return False
+    
+    def list_paths(self):
+        """(별칭, 경로) 목록 반환 (D-Bus 원격 명령용)"""
+        return [(p.get("alias", ""), p.get("path", "")) for p in self.settings.get_sorted_paths()]
+    
+    def on_quick_switch(self, widget):
+        """빠른 전환 창 열기 (검색 색인은 처음 한 번 만들고 이후에는 변경분만 반영)"""
+        with PROFILER.span("dialog.quick_switch"):
+            from search_index import SearchIndex
+            from quick_switcher import QuickSwitcher
+            if self.search_index is None:
+                self.search_index = SearchIndex(self.settings.paths)
+            if self._switcher is None:
+                self._switcher = QuickSwitcher(
+                    self.search_index, lambda alias, terminal: self.open_alias(alias, terminal)
+                )
+            self._switcher.popup()
     
     def on_settings(self, widget):
-        """설정 창 열기"""
-        dialog = SettingsDialog(self.settings, on_save_callback=self.build_menu)
-        dialog.show_all()
+        """설정 창 열기 (이미 열려 있으면 새로 만들지 않고 앞으로 가져옴)"""
+        if self._settings_dialog is not None:
+            self._settings_dialog.present()
+            return
+        with PROFILER.span("dialog.settings"):
+            # 설정 창은 자주 열리지 않으므로 처음 열 때 import (시작 시간 단축)
+            from settings_dialog import SettingsDialog
+            dialog = SettingsDialog(self.settings)
+            dialog.connect("destroy", self._on_settings_dialog_destroy)
+            self._settings_dialog = dialog
+            dialog.show_all()
+    
+    def _on_settings_dialog_destroy(self, dialog):
+        """닫힌 설정 창 참조 해제 (다음에 열 때 새로 생성)"""
+        if self._settings_dialog is dialog:
+            self._settings_dialog = None
+    
+    def _on_settings_changed(self, changes):
+        """설정 변경 반영 (경로 목록/정렬/언어가 바뀐 경우에만 메뉴 동기화)"""
+        if "language" in changes.settings:
+            set_language(self.settings.language)
+        if "path_check_timeout" in changes.settings:
+            self.path_checker.timeout = self.settings.path_check_timeout
+            self.scan_checker.timeout = self.settings.path_check_timeout
+        if "health_scan_interval" in changes.settings:
+            self.health_scanner.interval = self.settings.health_scan_interval
+            self.health_scanner.start()
+        if "profiling" in changes.settings:
+            PROFILER.configure_from_env(self.settings.profiling)
+        if changes.paths_changed or changes.settings & self.MENU_SETTINGS:
+            self.build_menu()
+        if self.search_index is not None and changes.paths_changed:
+            self.search_index.sync(changes, self.settings)
+            if self._switcher is not None and self._switcher.get_visible():
+                self._switcher.refresh()
+    
+    def _reload_settings(self):
+        """설정 파일이 실제로 바뀐 경우에만 다시 읽음 (메뉴는 변경 리스너가 갱신)"""
+        self.settings.reload_if_changed()
     
     def on_refresh(self, widget):
         """메뉴 새로고침"""
-        self.settings.load()
-        self.build_menu()
+        self.path_checker.invalidate()
+        self.health_scanner.invalidate()
+        self.health_scanner.scan()
+        self._reload_settings()
 
+    def on_diagnostics(self, widget):
+        """계측 결과 요약 표시 (cProfile 실행 중이면 결과 파일도 저장)"""
+        lines = PROFILER.summary() if PROFILER.names() else [t("diagnostics_empty")]
+        lines.append("")
+        lines.append(t("diagnostics_children", self.spawner.running))
+        if PROFILER.dump(self.PROFILE_FILE) is not None:
+            lines.append(t("diagnostics_profile_saved", str(self.PROFILE_FILE)))
+        
+        dialog = Gtk.MessageDialog(
+            parent=None,
+            modal=True,
+            message_type=Gtk.MessageType.INFO,
+            buttons=Gtk.ButtonsType.CLOSE,
+            text=t("diagnostics_title")
+        )
+        dialog.format_secondary_markup(
+            "<tt>" + GLib.markup_escape_text("\n".join(lines)) + "</tt>"
+        )
+        dialog.run()
+        dialog.destroy()
+    
     def on_about(self, widget):
         """앱 정보 대화상자 표시"""
         about = Gtk.AboutDialog()
@@ -249,20 +334,17 @@ class BaroIndicator:
         about.set_copyright("Copyright (C) 2026 DINKI'ssTyle")
         about.set_comments("Path Quick Access Indicator for Ubuntu")
         
-        app_icon_path = os.path.join(self.icons_dir, "appicon.png")
-        if os.path.exists(app_icon_path):
-            try:
-                from gi.repository import GdkPixbuf
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_scale(app_icon_path, 128, 128, True)
-                about.set_logo(pixbuf)
-            except Exception as e:
-                print(f"Error loading logo: {e}")
+        logo = self.icons.get_pixbuf("appicon.png", IconCache.LOGO_SIZE)
+        if logo is not None:
+            about.set_logo(logo)
 
         about.run()
         about.destroy()
     
     def on_quit(self, widget):
         """앱 종료"""
+        self.settings.flush()
+        PROFILER.dump(self.PROFILE_FILE)
         Gtk.main_quit()
     
     def _show_error(self, message):
@@ -282,8 +364,30 @@ def main():
     # SIGINT 시그널 처리 (Ctrl+C)
     signal.signal(signal.SIGINT, signal.SIG_DFL)
     
+    # 이미 실행 중이면 새 인스턴스를 만들지 않고 기존 인스턴스에 새로고침만 요청
+    if not os.environ.get("BARO_STARTUP_BENCH") and call_running_instance("Reload") is not None:
+        print("Baro is already running")
+        return
+    
     # GTK 메인 루프 실행
     indicator = BaroIndicator()
+    
+    # 단일 인스턴스 D-Bus 서비스 (동시에 시작된 다른 인스턴스에 이름을 뺏기면 종료)
+    service = BaroService({
+        "Open": lambda alias: indicator.open_alias(alias),
+        "OpenTerminal": lambda alias: indicator.open_alias(alias, terminal=True),
+        "Reload": lambda: indicator.on_refresh(None),
+        "List": indicator.list_paths,
+        "QuickSwitch": lambda: indicator.on_quick_switch(None),
+    }, on_name_lost=Gtk.main_quit)
+    service.start()
+    
+    # 시작 시간 측정 모드 (benchmarks/bench_startup.py)
+    if os.environ.get("BARO_STARTUP_BENCH"):
+        print(f"BARO_STARTUP import_ms={(_IMPORTED_AT - _STARTED_AT) * 1000:.2f} "
+              f"registered_ms={(time.perf_counter() - _STARTED_AT) * 1000:.2f}", flush=True)
+        GLib.idle_add(Gtk.main_quit)
+    
     Gtk.main()
 
 
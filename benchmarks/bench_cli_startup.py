@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Benchmark: cold start of the headless CLI vs the tray indicator
+
+사용법: python3 benchmarks/bench_cli_startup.py [--runs 10] [--paths 50]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from bench_startup import SCRIPT, make_home, run_once
+
+
+def run_cli(home, *args):
+    """CLI 를 한 번 실행하여 전체 소요 시간 (ms) 반환"""
+    env = dict(os.environ, HOME=home)
+    start = time.perf_counter()
+    subprocess.run([sys.executable, SCRIPT, *args], env=env, check=True,
+                   stdout=subprocess.DEVNULL, timeout=60)
+    return (time.perf_counter() - start) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="CLI vs tray cold start")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--paths", type=int, default=50)
+    args = parser.parse_args()
+
+    home = make_home(args.paths)
+    run_cli(home, "list")  # 디스크 캐시 준비
+
+    results = {
+        "cli list": statistics.median(run_cli(home, "list") for _ in range(args.runs)),
+        "cli path": statistics.median(run_cli(home, "path", "project-0000")
+                                      for _ in range(args.runs)),
+        "tray startup": statistics.median(run_once(home)[0] for _ in range(args.runs)),
+    }
+    for name, value in results.items():
+        print(f"{name:>14}: {value:8.2f} ms")
+    print(f"{'speedup':>14}: {results['tray startup'] / results['cli path']:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Benchmark: subfolder listing for browse submenus
+
+큰 폴더 (파일 + 하위 폴더) 를 만들고 작업 스레드의 scandir 시간 (처음 / 상한 적용),
+메인 루프에서 캐시된 목록을 돌려주는 시간을 측정한다.
+
+사용법: python3 benchmarks/bench_dir_lister.py [--files 20000] [--dirs 2000]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from gi.repository import GLib
+
+from dir_lister import DirLister
+
+
+def make_tree(root, files, dirs):
+    for i in range(dirs):
+        os.mkdir(os.path.join(root, f"dir-{i:05d}"))
+    for i in range(files):
+        open(os.path.join(root, f"file-{i:05d}.txt"), "w").close()
+
+
+def wait(done):
+    context = GLib.MainContext.default()
+    deadline = time.monotonic() + 10
+    while not done and time.monotonic() < deadline:
+        if not context.iteration(False):
+            time.sleep(0.001)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="dir lister benchmark")
+    parser.add_argument("--files", type=int, default=20000)
+    parser.add_argument("--dirs", type=int, default=2000)
+    args = parser.parse_args()
+
+    root = tempfile.mkdtemp(prefix="baro-browse-")
+    make_tree(root, args.files, args.dirs)
+
+    unlimited = DirLister(max_entries=10 ** 9, scan_limit=10 ** 9)
+    start = time.perf_counter()
+    full = unlimited._scan(root)
+    full_ms = (time.perf_counter() - start) * 1000
+
+    lister = DirLister()
+    start = time.perf_counter()
+    capped = lister._scan(root)
+    capped_ms = (time.perf_counter() - start) * 1000
+
+    # 처음 요청 → 작업 스레드 결과 도착, 이후 캐시 (메인 루프에서 바로 콜백)
+    results = []
+    lister.list(root, lambda p, l: results.append(l))
+    wait(results)
+    start = time.perf_counter()
+    for _ in range(1000):
+        lister.list(root, lambda p, l: None)
+    hit_us = (time.perf_counter() - start) / 1000 * 1e6
+
+    print(f"scan (no cap)  : {full_ms:8.1f} ms ({len(full.names)} dirs, {args.files + args.dirs} entries)")
+    print(f"scan (capped)  : {capped_ms:8.1f} ms ({len(capped.names)} dirs, truncated={capped.truncated})")
+    print(f"cache hit      : {hit_us:8.1f} us on the main loop")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Benchmark: frecency usage log and sort
+
+큰 사용 기록에서 로그 읽기, 실행 기록 추가, frecency 정렬 시간과 압축 후 로그 크기를 측정한다.
+
+사용법: python3 benchmarks/bench_frecency.py [--entries 10000] [--launches 100000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+os.environ["HOME"] = tempfile.mkdtemp(prefix="baro-frecency-")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from settings_manager import SettingsManager
+from usage_log import UsageLog
+
+
+def main():
+    parser = argparse.ArgumentParser(description="frecency benchmark")
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--launches", type=int, default=100000)
+    parser.add_argument("--records", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    manager = SettingsManager()
+    manager.set_paths([{"alias": f"p{i}", "path": f"/srv/p{i}"} for i in range(args.entries)])
+    manager.sort_mode = "frecency"
+
+    # 90 일에 걸친 실행 기록 (일부 경로에 편중)
+    log_file = manager.CONFIG_FILE.with_name("usage.log")
+    now = time.time()
+    with open(log_file, "w", encoding="utf-8") as f:
+        for _ in range(args.launches):
+            i = min(int(rng.paretovariate(1.2)), args.entries) - 1
+            f.write(f"{now - rng.uniform(0, 90 * 86400):.0f}\t1\t/srv/p{i}\n")
+    size_before = os.path.getsize(log_file)
+
+    start = time.perf_counter()
+    usage = UsageLog(log_file)
+    load_ms = (time.perf_counter() - start) * 1000
+    size_after = os.path.getsize(log_file)
+
+    start = time.perf_counter()
+    for _ in range(args.records):
+        manager.record_usage(f"/srv/p{rng.randrange(args.entries)}")
+    record_us = (time.perf_counter() - start) / args.records * 1e6
+
+    start = time.perf_counter()
+    for _ in range(20):
+        ordered = manager.get_sorted_paths()
+    sort_ms = (time.perf_counter() - start) / 20 * 1000
+
+    print(f"log load+compact : {load_ms:8.1f} ms ({args.launches} lines, {len(usage)} paths)")
+    print(f"log size         : {size_before / 1024:8.1f} KiB -> {size_after / 1024:.1f} KiB")
+    print(f"record           : {record_us:8.1f} us/launch")
+    print(f"frecency sort    : {sort_ms:8.2f} ms ({len(ordered)} entries)")
+    print(f"top              : {[p['alias'] for p in ordered[:5]]}")
+
+
+if __name__ == "__main__":
+    main()
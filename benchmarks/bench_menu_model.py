@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Benchmark: headless menu model build and change detection
+
+디스플레이나 gi 없이 메뉴 모델 생성 시간 (묶기/항목 수 제한 포함) 과
+같은 메뉴 비교 (digest 후 구조 비교), 한 항목이 바뀐 메뉴 비교 (digest) 시간을 측정한다.
+
+사용법: python3 benchmarks/bench_menu_model.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+os.environ["HOME"] = tempfile.mkdtemp(prefix="baro-model-")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from settings_manager import SettingsManager
+from menu_model import build_model
+
+SIZES = (100, 1000, 10000, 50000)
+
+
+def timed(fn, *args, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000, result
+
+
+def main():
+    print(f"{'entries':>8} {'grouping':>9} {'build(ms)':>10} {'same(us)':>9} {'changed(us)':>12} {'top items':>10}")
+    for n in SIZES:
+        manager = SettingsManager()
+        manager.menu_item_cap = 30
+        manager.set_paths([
+            {"alias": f"project-{i:05d}", "path": f"/home/user/team-{i % 40}/project-{i:05d}"}
+            for i in range(n)
+        ])
+        for grouping in ("none", "prefix"):
+            manager.menu_grouping = grouping
+            build_ms, model = timed(build_model, manager)
+            _, same = timed(build_model, manager, repeat=1)
+
+            # 같은 메뉴 (구조까지 비교) / 한 항목만 바뀐 메뉴 (digest 만 비교)
+            manager.update_path("project-00000", "project-00000", "/srv/renamed")
+            _, changed = timed(build_model, manager, repeat=1)
+            manager.update_path("project-00000", "project-00000", "/home/user/team-0/project-00000")
+
+            same_us = timed(lambda: model == same, repeat=1000)[0] * 1000
+            changed_us = timed(lambda: model == changed, repeat=1000)[0] * 1000
+            assert model == same and model != changed
+            print(f"{n:>8} {grouping:>9} {build_ms:>10.2f} {same_us:>9.2f} {changed_us:>12.2f} "
+                  f"{len(model.folders):>10}")
+    assert "gi" not in sys.modules
+
+
+if __name__ == "__main__":
+    main()
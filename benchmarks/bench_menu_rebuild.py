@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Benchmark: full menu rebuild vs keyed incremental sync
+
+사용법: python3 benchmarks/bench_menu_rebuild.py
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gi
+gi.require_version('Gtk', '3.0')
+from gi.repository import Gtk
+
+from menu_diff import KeyedMenu, keyed_entries
+
+SIZES = (10, 100, 1000, 5000)
+
+
+def make_paths(n):
+    return [{"alias": f"project-{i:05d}", "path": f"/home/user/work/project-{i:05d}", "order": i}
+            for i in range(n)]
+
+
+def spec_of(p):
+    return (p["alias"], p["path"])
+
+
+def create_item(key, spec):
+    item = Gtk.ImageMenuItem()
+    item.set_label(spec[0])
+    return item
+
+
+def update_item(item, spec, old_spec):
+    item.set_label(spec[0])
+
+
+def full_rebuild(paths):
+    """기존 방식: 매번 메뉴 전체를 새로 생성"""
+    menu = Gtk.Menu()
+    for p in paths:
+        menu.append(create_item(None, spec_of(p)))
+    term_menu = Gtk.Menu()
+    for p in paths:
+        term_menu.append(create_item(None, spec_of(p)))
+    return menu
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return (time.perf_counter() - start) * 1000, result
+
+
+def main():
+    print(f"{'entries':>8} {'full(ms)':>10} {'nochange(ms)':>13} {'rename(ms)':>11} "
+          f"{'add(ms)':>9} {'move(ms)':>9} {'ops(move)':>10}")
+    for n in SIZES:
+        paths = make_paths(n)
+        full_ms, _ = timed(full_rebuild, paths)
+
+        section = KeyedMenu(Gtk.Menu(), create_item, update_item)
+        section.sync(keyed_entries(paths, spec_of))
+
+        nochange_ms, _ = timed(section.sync, keyed_entries(paths, spec_of))
+
+        renamed = [dict(p) for p in paths]
+        renamed[n // 2]["path"] += "-renamed"
+        rename_ms, _ = timed(section.sync, keyed_entries(renamed, spec_of))
+
+        added = renamed + [{"alias": "new", "path": "/tmp/new", "order": n}]
+        add_ms, _ = timed(section.sync, keyed_entries(added, spec_of))
+
+        moved = [added[-1]] + added[:-1]
+        move_ms, stats = timed(section.sync, keyed_entries(moved, spec_of))
+        ops = sum(stats.values())
+
+        print(f"{n:>8} {full_ms:>10.2f} {nochange_ms:>13.2f} {rename_ms:>11.2f} "
+              f"{add_ms:>9.2f} {move_ms:>9.2f} {ops:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Benchmark: widget count / memory of the tray menu, eager vs lazy terminal submenu,
+with and without the per-menu item cap ("More…" pages)
+
+사용법: python3 benchmarks/bench_menu_widgets.py
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+# 실제 ~/.config/baro 를 건드리지 않도록 임시 HOME 사용
+os.environ["HOME"] = tempfile.mkdtemp(prefix="baro-bench-")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from baro_indicator import BaroIndicator
+
+SIZES = (10, 100, 1000)
+
+
+def rss_kb():
+    """현재 프로세스 RSS (KB)"""
+    with open("/proc/self/statm") as f:
+        pages = int(f.read().split()[1])
+    return pages * os.sysconf("SC_PAGE_SIZE") // 1024
+
+
+def count_widgets(menu):
+    """메뉴 트리의 위젯 수 (서브메뉴 포함)"""
+    total = 0
+    for child in menu.get_children():
+        total += 1
+        submenu = child.get_submenu() if hasattr(child, "get_submenu") else None
+        if submenu is not None:
+            total += 1 + count_widgets(submenu)
+    return total
+
+
+def measure(n, eager, cap):
+    indicator = BaroIndicator()
+    indicator.settings.menu_item_cap = cap
+    indicator.settings.set_paths([
+        {"alias": f"project-{i:05d}", "path": f"/home/user/work/project-{i:05d}"}
+        for i in range(n)
+    ])
+    before = rss_kb()
+    start = time.perf_counter()
+    indicator.build_menu()
+    if eager:
+        indicator.renderer.terminal_menu.materialize()
+    elapsed = (time.perf_counter() - start) * 1000
+    return count_widgets(indicator.menu), rss_kb() - before, elapsed
+
+
+def main():
+    print(f"{'entries':>8} {'mode':>6} {'cap':>4} {'widgets':>8} {'rss(KB)':>8} {'build(ms)':>10}")
+    for n in SIZES:
+        for cap in (0, 30):
+            for eager in (True, False):
+                widgets, rss, elapsed = measure(n, eager, cap)
+                mode = "eager" if eager else "lazy"
+                print(f"{n:>8} {mode:>6} {cap:>4} {widgets:>8} {rss:>8} {elapsed:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Benchmark: quick switcher search index
+
+10k 북마크 색인을 만들고, 별칭을 한 글자씩 입력하는 검색 / 경로 조각 검색 / 두 단어 검색의
+지연 시간 분포와 증분 갱신 (추가/삭제) 시간을 측정한다.
+
+사용법: python3 benchmarks/bench_search.py [--entries 10000] [--queries 5000]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from search_index import SearchIndex
+
+
+def make_word(rng):
+    return "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 8)))
+
+
+def make_entries(rng, count):
+    teams = [make_word(rng) for _ in range(20)]
+    projects = [make_word(rng) for _ in range(count // 10)]
+    parts = ["src", "docs", "build", "web", "api", "data", "infra", "tools", "tests", "scripts"]
+    entries, seen = [], set()
+    while len(entries) < count:
+        project, part = rng.choice(projects), rng.choice(parts)
+        alias = f"{project}-{part}"
+        if alias in seen:
+            alias = f"{alias}{len(entries)}"
+        seen.add(alias)
+        entries.append({"alias": alias, "path": f"/home/user/{rng.choice(teams)}/{project}/{part}"})
+    return entries
+
+
+def make_queries(rng, entries, count):
+    queries = []
+    while len(queries) < count:
+        entry = rng.choice(entries)
+        kind = rng.random()
+        if kind < 0.6:
+            # 별칭을 한 글자씩 입력
+            alias = entry["alias"]
+            queries.extend(alias[:n] for n in range(1, min(len(alias), 8) + 1))
+        elif kind < 0.85:
+            path = entry["path"]
+            start = rng.randrange(len(path) - 4)
+            queries.append(path[start:start + rng.randint(3, 8)])
+        else:
+            project, _, part = entry["alias"].partition("-")
+            queries.append(f"{project[:rng.randint(2, len(project))]} {part[:2]}")
+    return queries[:count]
+
+
+def percentile(values, p):
+    return sorted(values)[min(len(values) - 1, int(len(values) * p))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="search index benchmark")
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--queries", type=int, default=5000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    entries = make_entries(rng, args.entries)
+
+    start = time.perf_counter()
+    index = SearchIndex(entries)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    times = []
+    for query in make_queries(rng, entries, args.queries):
+        start = time.perf_counter()
+        index.search(query)
+        times.append((time.perf_counter() - start) * 1e6)
+
+    start = time.perf_counter()
+    for i in range(1000):
+        index.add({"alias": f"new{i}", "path": f"/srv/new/{i}"})
+    for i in range(1000):
+        index.remove(f"new{i}")
+    update_us = (time.perf_counter() - start) / 2000 * 1e6
+
+    print(f"build          : {build_ms:8.1f} ms ({len(index)} entries)")
+    print(f"query p50      : {statistics.median(times):8.1f} us")
+    print(f"query p95      : {percentile(times, 0.95):8.1f} us")
+    print(f"query p99      : {percentile(times, 0.99):8.1f} us")
+    print(f"query max      : {max(times):8.1f} us ({len(times)} queries)")
+    print(f"add/remove     : {update_us:8.1f} us per op")
+
+
+if __name__ == "__main__":
+    main()
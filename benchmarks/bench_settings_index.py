@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Benchmark: SettingsManager path mutations over a large list
+
+10k 항목 목록에서 add/update/remove/move 를 섞은 50k 번의 변경 시간을 측정한다.
+
+사용법: python3 benchmarks/bench_settings_index.py [--entries 10000] [--mutations 50000]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+os.environ["HOME"] = tempfile.mkdtemp(prefix="baro-index-")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from settings_manager import SettingsManager
+
+
+def main():
+    parser = argparse.ArgumentParser(description="settings index benchmark")
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--mutations", type=int, default=50000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    manager = SettingsManager()
+    manager.set_paths([{"alias": f"p{i}", "path": f"/tmp/p{i}"} for i in range(args.entries)])
+
+    counts = {"add": 0, "update": 0, "remove": 0, "move": 0, "lookup": 0}
+    next_id = args.entries
+    start = time.perf_counter()
+    for _ in range(args.mutations):
+        alias = f"p{rng.randrange(next_id)}"
+        op = rng.random()
+        if op < 0.25:
+            manager.add_path(f"p{next_id}", f"/tmp/p{next_id}")
+            next_id += 1
+            counts["add"] += 1
+        elif op < 0.45:
+            manager.update_path(alias, alias, f"/tmp/{alias}/renamed")
+            counts["update"] += 1
+        elif op < 0.65:
+            manager.remove_path(alias)
+            counts["remove"] += 1
+        elif op < 0.85:
+            manager.move_path(alias, rng.choice((-1, 1)))
+            counts["move"] += 1
+        else:
+            manager.get_path(alias)
+            manager.has_path(f"/tmp/{alias}")
+            counts["lookup"] += 1
+    mutate_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    paths = manager.get_sorted_paths()
+    materialize_ms = (time.perf_counter() - start) * 1000
+
+    print(f"entries        : {args.entries} -> {len(paths)}")
+    print(f"operations     : {args.mutations} ({', '.join(f'{k}={v}' for k, v in counts.items())})")
+    print(f"mutations      : {mutate_ms:.1f} ms ({mutate_ms * 1000 / args.mutations:.2f} us/op)")
+    print(f"sorted list    : {materialize_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
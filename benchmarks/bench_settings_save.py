@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Stress test: thousands of rapid mutations + save() through the write-behind layer
+
+- 변경마다 save() 를 호출해도 실제 파일 쓰기 횟수가 적은지 (coalescing)
+- 쓰는 동안 다른 스레드가 읽어도 항상 완전한 JSON 인지 (atomic rename)
+- 최종 파일 내용이 메모리 상태와 같은지 (integrity)
+
+사용법: python3 benchmarks/bench_settings_save.py [--mutations 5000]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import threading
+import time
+
+os.environ["HOME"] = tempfile.mkdtemp(prefix="baro-save-")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from settings_manager import SettingsManager
+
+
+def reader(path, stop, stats):
+    """저장 중에 파일을 계속 읽어 깨진 JSON 이 보이는지 확인"""
+    while not stop.is_set():
+        try:
+            with open(path, "rb") as f:
+                json.loads(f.read())
+            stats["reads"] += 1
+        except FileNotFoundError:
+            stats["missing"] += 1
+        except ValueError:
+            stats["corrupt"] += 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="settings write-behind stress test")
+    parser.add_argument("--mutations", type=int, default=5000)
+    parser.add_argument("--delay", type=float, default=0.05, help="SAVE_DELAY (초)")
+    args = parser.parse_args()
+
+    SettingsManager.SAVE_DELAY = args.delay
+    manager = SettingsManager()
+    initial_writes = manager.write_count
+
+    stats = {"reads": 0, "missing": 0, "corrupt": 0}
+    stop = threading.Event()
+    thread = threading.Thread(target=reader, args=(manager.CONFIG_FILE, stop, stats))
+    thread.start()
+
+    start = time.perf_counter()
+    for i in range(args.mutations):
+        alias = f"p{i % 500}"
+        if i % 7 == 3:
+            manager.remove_path(alias)
+        elif not manager.add_path(alias, f"/tmp/{alias}"):
+            manager.update_path(alias, alias, f"/tmp/{alias}/{i}")
+        manager.save()
+        if i % 1000 == 999:
+            time.sleep(args.delay * 2)  # 중간중간 쉬어서 실제 쓰기 발생
+    elapsed = (time.perf_counter() - start) * 1000
+    manager.flush()
+
+    stop.set()
+    thread.join()
+
+    with open(manager.CONFIG_FILE, encoding="utf-8") as f:
+        on_disk = json.load(f)
+    intact = on_disk["paths"] == manager.paths
+    writes = manager.write_count - initial_writes
+
+    print(f"mutations      : {args.mutations}")
+    print(f"elapsed        : {elapsed:.1f} ms")
+    print(f"file writes    : {writes}")
+    print(f"reader checks  : {stats['reads']} ok, {stats['missing']} missing, {stats['corrupt']} corrupt")
+    print(f"final intact   : {intact}")
+    backups = sorted(p.name for p in manager.CONFIG_DIR.glob("settings.json.bak.*"))
+    print(f"backups        : {', '.join(backups)}")
+
+    ok = intact and stats["corrupt"] == 0 and stats["missing"] == 0 and writes < args.mutations // 10
+    print("PASS" if ok else "FAIL")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Benchmark: JSON vs SQLite settings backend on a large bookmark list
+
+같은 목록을 두 저장소에 넣고 로드 시간과 "한 항목 변경 + flush" 시간을 비교한다.
+
+사용법: python3 benchmarks/bench_settings_sqlite.py [--entries 10000] [--edits 200]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+os.environ["HOME"] = tempfile.mkdtemp(prefix="baro-sqlite-")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from settings_manager import SettingsManager
+
+
+def run(backend: str, entries: int, edits: int, seed: int):
+    manager = SettingsManager(backend=backend)
+    manager.set_paths([{"alias": f"p{i}", "path": f"/srv/projects/p{i}"} for i in range(entries)])
+    manager.save()
+    manager.flush()
+
+    start = time.perf_counter()
+    manager = SettingsManager(backend=backend)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    rng = random.Random(seed)
+    times = []
+    for n in range(edits):
+        alias = f"p{rng.randrange(entries)}"
+        if n % 2:
+            manager.update_path(alias, alias, f"/srv/projects/{alias}/{n}")
+        else:
+            manager.move_path(alias, rng.choice((-1, 1)))
+        manager.save()
+        start = time.perf_counter()
+        manager.flush()
+        times.append((time.perf_counter() - start) * 1000)
+    return load_ms, times, manager
+
+
+def main():
+    parser = argparse.ArgumentParser(description="settings backend benchmark")
+    parser.add_argument("--entries", type=int, default=10000)
+    parser.add_argument("--edits", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    results = {}
+    for backend in ("json", "sqlite"):
+        load_ms, times, manager = run(backend, args.entries, args.edits, args.seed)
+        results[backend] = manager.to_dict()["paths"]
+        print(f"{backend:6s} load {load_ms:8.1f} ms   edit+flush mean {statistics.mean(times):7.2f} ms"
+              f"   p95 {sorted(times)[int(len(times) * 0.95)]:7.2f} ms")
+
+    same = results["json"] == results["sqlite"]
+    print(f"same result    : {same}")
+    sys.exit(0 if same else 1)
+
+
+if __name__ == "__main__":
+    main()
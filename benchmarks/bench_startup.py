@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Benchmark: indicator startup (import time and time-to-indicator-registered)
+
+매 실행마다 새 프로세스로 baro_indicator.py 를 BARO_STARTUP_BENCH=1 로
+실행하고, 고정된 임시 설정(북마크 N 개)에서 측정한 중앙값을 출력한다.
+
+사용법: python3 benchmarks/bench_startup.py [--runs 10] [--paths 50] [--json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, "baro_indicator.py")
+
+
+def make_home(n_paths):
+    """북마크 n_paths 개가 있는 임시 HOME 생성"""
+    home = tempfile.mkdtemp(prefix="baro-startup-")
+    config_dir = os.path.join(home, ".config", "baro")
+    os.makedirs(config_dir)
+    settings = {
+        "language": "en",
+        "sort_mode": "custom",
+        "terminal": "gnome-terminal",
+        "file_manager": "xdg-open",
+        "paths": [{"alias": f"project-{i:04d}", "path": f"/tmp/project-{i:04d}", "order": i}
+                  for i in range(n_paths)],
+    }
+    with open(os.path.join(config_dir, "settings.json"), "w", encoding="utf-8") as f:
+        json.dump(settings, f)
+    return home
+
+
+def run_once(home):
+    """한 번 실행하여 (전체 ms, import ms, registered ms) 반환"""
+    env = dict(os.environ, HOME=home, BARO_STARTUP_BENCH="1")
+    start = time.perf_counter()
+    proc = subprocess.run([sys.executable, SCRIPT], env=env, capture_output=True,
+                          text=True, timeout=60)
+    wall = (time.perf_counter() - start) * 1000
+    for line in proc.stdout.splitlines():
+        if line.startswith("BARO_STARTUP "):
+            fields = dict(kv.split("=") for kv in line.split()[1:])
+            return wall, float(fields["import_ms"]), float(fields["registered_ms"])
+    raise RuntimeError(f"startup marker not found:\n{proc.stdout}\n{proc.stderr}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[-1])
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--paths", type=int, default=50)
+    parser.add_argument("--json", action="store_true", help="결과를 JSON 으로 출력")
+    args = parser.parse_args()
+
+    home = make_home(args.paths)
+    run_once(home)  # 첫 실행은 디스크 캐시 준비용으로 버림
+    samples = [run_once(home) for _ in range(args.runs)]
+
+    result = {
+        "runs": args.runs,
+        "paths": args.paths,
+        "process_ms": statistics.median(s[0] for s in samples),
+        "import_ms": statistics.median(s[1] for s in samples),
+        "registered_ms": statistics.median(s[2] for s in samples),
+    }
+    if args.json:
+        print(json.dumps(result, indent=2))
+    else:
+        for key, value in result.items():
+            print(f"{key:>14}: {value:.2f}" if isinstance(value, float) else f"{key:>14}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Minimal PyGObject stand-in for headless benchmarks (benchmarks/suite.py)
+
+디스플레이나 PyGObject 가 없는 환경에서 Baro 모듈을 import 하고 메뉴를 만들 수
+있도록 gi.repository 의 필요한 부분만 흉내 낸다. 실제 앱에서는 사용하지 않는다.
+"""
+
+STUB = True
+
+
+def require_version(namespace: str, version: str):
+    """실제 gi 와 같은 호출을 받기만 함"""
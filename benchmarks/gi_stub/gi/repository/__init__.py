@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Stub Gtk / AppIndicator3 / GLib / Gio namespaces for headless benchmarks
+
+위젯은 자식 목록, 라벨, 표시/활성 상태, 서브메뉴, 시그널만 기억하고, live_widgets() 로
+destroy() 되지 않은 채 남아 있는 위젯 수를 셀 수 있다 (누수 확인용). 실제 PyGObject 에서
+시그널 핸들러가 위젯을 붙잡아 두는 것처럼, 핸들러가 연결된 위젯은 destroy() 전까지 해제되지 않는다.
+GLib.idle_add 는 큐에 넣었다가 GLib.MainContext.default().iteration() 이나
+drain() 에서 실행하고, 타이머는 등록만 한다. 프로세스 실행은 하지 않는다.
+"""
+
+import gc
+import html
+import itertools
+import sys
+import types
+import weakref
+from collections import deque
+
+
+_LIVE = weakref.WeakSet()
+_CONNECTED = set()  # 핸들러가 연결된 위젯 (destroy() 때 해제)
+
+
+def live_widgets():
+    """아직 참조되고 있고 destroy() 되지 않은 위젯 수"""
+    gc.collect()
+    return sum(1 for widget in list(_LIVE) if not widget._destroyed)
+
+
+class _Widget:
+    """모든 Gtk/Gio 객체의 대용 (알 수 없는 메서드는 새 _Widget 을 돌려줌)"""
+
+    def __init__(self, *args, **kwargs):
+        self._label = kwargs.get("label", "")
+        self._children = []
+        self._handlers = {}
+        self._visible = False
+        self._sensitive = True
+        self._submenu = None
+        self._image = None
+        self._destroyed = False
+        _LIVE.add(self)
+
+    # 시그널
+    def connect(self, signal, callback, *data):
+        handler = next(_ids)
+        self._handlers.setdefault(signal, []).append((handler, callback, data))
+        _CONNECTED.add(self)
+        return handler
+
+    def disconnect(self, handler):
+        for handlers in self._handlers.values():
+            handlers[:] = [h for h in handlers if h[0] != handler]
+
+    def handler_is_connected(self, handler):
+        return any(h[0] == handler for handlers in self._handlers.values() for h in handlers)
+
+    def emit(self, signal, *args):
+        for _, callback, data in list(self._handlers.get(signal, ())):
+            callback(self, *args, *data)
+
+    # 라벨/상태
+    def set_label(self, label):
+        self._label = label
+
+    def get_label(self):
+        return self._label
+
+    # Gtk.Entry 는 라벨 자리에 텍스트를 기억
+    set_text = set_label
+    get_text = get_label
+
+    def set_sensitive(self, sensitive):
+        self._sensitive = sensitive
+
+    def get_sensitive(self):
+        return self._sensitive
+
+    def set_visible(self, visible):
+        self._visible = visible
+
+    def get_visible(self):
+        return self._visible
+
+    def show(self):
+        self._visible = True
+
+    def hide(self):
+        self._visible = False
+
+    def show_all(self):
+        self._visible = True
+        for child in self._children:
+            child.show_all()
+
+    # 컨테이너
+    def set_submenu(self, menu):
+        self._submenu = menu
+
+    def get_submenu(self):
+        return self._submenu
+
+    def set_image(self, image):
+        self._image = image
+
+    def get_image(self):
+        return self._image
+
+    def append(self, child, *args):
+        # ComboBoxText.append(id, text) 는 문자열이므로 기록하지 않음
+        if isinstance(child, _Widget):
+            self._children.append(child)
+
+    # Box/Container/TreeView 에 넣은 위젯도 함께 destroy 되도록 자식으로 기록
+    pack_start = pack_end = add = append_column = append
+
+    def get_content_area(self):
+        area = self.__dict__.get("_content_area")
+        if area is None:
+            area = self._content_area = _Widget()
+            self._children.append(area)
+        return area
+
+    def insert(self, child, position):
+        self._children.insert(position, child)
+
+    def remove(self, child):
+        self._children.remove(child)
+
+    def reorder_child(self, child, position):
+        self._children.remove(child)
+        self._children.insert(position, child)
+
+    def get_children(self):
+        return list(self._children)
+
+    def destroy(self):
+        if self._destroyed:
+            return
+        self._destroyed = True
+        self.emit("destroy")
+        self._handlers.clear()  # 실제 GObject 처럼 destroy 후에는 시그널 핸들러 해제
+        _CONNECTED.discard(self)
+        for widget in (self._submenu, self._image, *self._children):
+            if widget is not None:
+                widget.destroy()
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return lambda *args, **kwargs: _Widget()
+
+
+class _Type(type):
+    """Gtk.Menu, Gtk.IconSize.MENU, GdkPixbuf.Pixbuf.new_from_file_at_size 등 자동 생성"""
+
+    def __getattr__(cls, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if name.isupper():
+            return 0
+        if name[0].isupper():
+            nested = _Type(name, (_Widget,), {})
+            setattr(cls, name, nested)
+            return nested
+        return lambda *args, **kwargs: cls()
+
+
+class _Namespace(types.ModuleType):
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        if name.isupper():
+            return 0
+        if name[0].isupper():
+            cls = _Type(name, (_Widget,), {})
+            setattr(self, name, cls)
+            return cls
+        return lambda *args, **kwargs: _Widget()
+
+
+def _namespace(name):
+    module = _Namespace(f"{__name__}.{name}")
+    sys.modules[module.__name__] = module
+    globals()[name] = module
+    return module
+
+
+for _name in ("Gtk", "Gdk", "GdkPixbuf", "Pango", "AppIndicator3", "GObject", "GLib", "Gio"):
+    _namespace(_name)
+
+
+# GLib 메인 루프 (idle 콜백만 실행)
+_ids = itertools.count(1)
+_idle = deque()
+_removed = set()  # 아직 큐에 있는 제거된 idle 콜백
+_timers = set()  # 등록만 된 타이머
+
+
+def _idle_add(callback, *args, **kwargs):
+    source = next(_ids)
+    _idle.append((source, callback, args))
+    return source
+
+
+def _timeout_add(interval, callback, *args, **kwargs):
+    source = next(_ids)
+    _timers.add(source)
+    return source
+
+
+def _source_remove(source):
+    if source in _timers:
+        _timers.discard(source)
+    else:
+        _removed.add(source)
+    return True
+
+
+def _iteration(may_block=False):
+    """대기 중인 idle 콜백 하나 실행 (True 를 돌려준 콜백은 다시 큐에 넣음)"""
+    while _idle:
+        source, callback, args = _idle.popleft()
+        if source in _removed:
+            _removed.discard(source)
+            continue
+        if callback(*args):
+            _idle.append((source, callback, args))
+        return True
+    return False
+
+
+def drain(limit=100000):
+    """idle 콜백을 모두 실행 (실행한 수 반환)"""
+    count = 0
+    while count < limit and _iteration():
+        count += 1
+    return count
+
+
+class _MainContext(_Widget):
+    @staticmethod
+    def default():
+        return _CONTEXT
+
+    def iteration(self, may_block=False):
+        return _iteration(may_block)
+
+    def pending(self):
+        return bool(_idle)
+
+
+_CONTEXT = _MainContext()
+
+
+def _spawn_async(argv, envp=None, working_directory=None, flags=0, **kwargs):
+    """실제로 실행하지 않고 가짜 pid 반환"""
+    return next(_ids), None, None, None
+
+
+GLib.Error = type("Error", (Exception,), {"message": ""})
+GLib.MainContext = _MainContext
+GLib.idle_add = _idle_add
+GLib.timeout_add = _timeout_add
+GLib.timeout_add_seconds = _timeout_add
+GLib.child_watch_add = lambda *args, **kwargs: next(_ids)
+GLib.source_remove = _source_remove
+GLib.spawn_async = _spawn_async
+GLib.Variant = lambda signature, value: value
+GLib.markup_escape_text = lambda text, length=-1: html.escape(text, quote=False)
+
+Gtk.icon_size_lookup = lambda size: (True, 16, 16)
+Gtk.main = lambda: None
+Gtk.main_quit = lambda *args: None
+
+
+class _ListStore(list):
+    """행 목록 (store[path][column] 접근만 지원)"""
+
+    def __init__(self, *column_types):
+        super().__init__()
+
+    def append(self, row):
+        list.append(self, list(row))
+
+    def __getitem__(self, path):
+        if not isinstance(path, int):
+            path = path.get_indices()[0] if hasattr(path, "get_indices") else 0
+        return list.__getitem__(self, path)
+
+
+Gtk.ListStore = _ListStore
+
+
+class _Mount(_Widget):
+    """루트 경로와 이름만 있는 마운트"""
+
+    def __init__(self, root_path="", name=""):
+        super().__init__()
+        self._root_path = root_path
+        self._name = name
+
+    def get_root(self):
+        return types.SimpleNamespace(get_path=lambda: self._root_path)
+
+    def get_name(self):
+        return self._name
+
+
+class _VolumeMonitor(_Widget):
+    """마운트 목록 (add_mount / remove_mount 로 mount-added / mount-removed 발생)"""
+
+    _instance = None
+
+    @classmethod
+    def get(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        super().__init__()
+        self._mounts = []
+
+    def get_mounts(self):
+        return list(self._mounts)
+
+    def add_mount(self, root_path, name=""):
+        mount = _Mount(root_path, name)
+        self._mounts.append(mount)
+        self.emit("mount-added", mount)
+        return mount
+
+    def remove_mount(self, mount):
+        self._mounts.remove(mount)
+        self.emit("mount-removed", mount)
+
+
+Gio.VolumeMonitor = _VolumeMonitor
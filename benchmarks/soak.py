@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Soak test: menu rebuilds must not leak widgets or memory
+
+디스플레이 없이 (benchmarks/gi_stub) 인디케이터를 만든 뒤 수천 번 설정을 바꿨다가
+되돌리며 메뉴를 다시 구성하고 (이름/경로/아이콘/하위 폴더 메뉴/묶기/언어 변경, 항목
+추가/삭제, 서브메뉴 열기, 설정 창/빠른 전환 창 열기), 매 회 끝에는 처음과 같은 설정이
+되도록 한다. 일정 간격마다 살아 있는 위젯 수와 RSS 를 재서 준비 구간 이후 늘어나면
+종료 코드 1 을 돌려준다.
+
+사용법:
+    python3 benchmarks/soak.py
+    python3 benchmarks/soak.py --iterations 10000 --paths 500 --rss-slack-mb 8
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Baro menu soak test")
+    parser.add_argument("--iterations", type=int, default=3000)
+    parser.add_argument("--paths", type=int, default=200, help="북마크 수")
+    parser.add_argument("--check-every", type=int, default=250, help="측정 간격 (회)")
+    parser.add_argument("--warmup", type=int, default=500, help="측정 기준을 잡기 전 반복 수")
+    parser.add_argument("--widget-slack", type=int, default=0, help="허용하는 위젯 증가 수")
+    parser.add_argument("--rss-slack-mb", type=float, default=4.0, help="허용하는 RSS 증가 (MB)")
+    return parser.parse_args(argv)
+
+
+ARGS = parse_args()
+
+# 실제 ~/.config/baro 를 건드리지 않도록 HOME 을 바꾸고 gi 대용 모듈 사용
+os.environ["HOME"] = tempfile.mkdtemp(prefix="baro-soak-")
+os.environ.pop("BARO_PROFILE", None)
+sys.path.insert(0, os.path.join(BENCH_DIR, "gi_stub"))
+sys.path.insert(1, ROOT)
+
+from gi import repository as stub  # noqa: E402
+from settings_manager import SettingsManager  # noqa: E402
+from baro_indicator import BaroIndicator  # noqa: E402
+from menu_groups import MenuGroup  # noqa: E402
+import i18n  # noqa: E402
+
+
+def rss_mb() -> float:
+    """현재 RSS (MB, /proc 이 없으면 0)"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+    except (OSError, IndexError, ValueError):
+        return 0.0
+    return pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def make_tree(root, count=12):
+    """하위 폴더 메뉴용 폴더 (2 단계)"""
+    for i in range(count):
+        for j in range(3):
+            os.makedirs(os.path.join(root, f"dir-{i:02d}", f"sub-{j}"), exist_ok=True)
+    return root
+
+
+def wait_listing(browse_menu, timeout=2.0):
+    """작업 스레드의 폴더 목록이 메뉴에 반영될 때까지 idle 콜백 실행"""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        stub.drain()
+        if browse_menu.status.get_label() != "…" or not browse_menu.status.get_visible():
+            return
+        time.sleep(0.001)
+
+
+def open_submenus(renderer):
+    """터미널/그룹/더 보기 서브메뉴를 열어 위젯 생성"""
+    renderer.terminal_section.menu.emit("show")
+    for key in renderer.folder_section.keys():
+        if isinstance(renderer.folder_section.spec_for(key), MenuGroup):
+            renderer.folder_section.widget_for(key).lazy_menu.section.menu.emit("show")
+
+
+class Soak:
+    def __init__(self, paths: int):
+        self.tree = make_tree(tempfile.mkdtemp(prefix="baro-soak-tree-"))
+        manager = SettingsManager()
+        manager.set_paths([
+            {"alias": f"project-{i:04d}", "path": f"/home/user/team-{i % 20}/project-{i:04d}"}
+            for i in range(paths)
+        ])
+        manager.save()
+        manager.flush()
+        self.indicator = BaroIndicator()
+        stub.drain()
+        self.settings = self.indicator.settings
+        self.target = self.settings.paths[min(10, paths - 1)]["alias"]  # 첫 페이지 항목
+        self.ops = [
+            self.rename, self.move, self.add_remove, self.icon, self.browse,
+            self.grouping, self.language, self.refresh, self.dialogs,
+        ]
+
+    def apply(self, change, revert):
+        """변경 -> 메뉴 반영 -> 서브메뉴 열기 -> 되돌리기"""
+        change()
+        stub.drain()
+        open_submenus(self.indicator.renderer)
+        revert()
+        stub.drain()
+
+    def rename(self, i):
+        item = self.settings.get_path(self.target)
+        alias, path = self.target, item["path"]
+        renamed = f"renamed-{i % 7}"
+        self.apply(lambda: self.settings.update_path(alias, renamed, "/srv/renamed"),
+                   lambda: self.settings.update_path(renamed, alias, path))
+
+    def move(self, i):
+        self.apply(lambda: self.settings.move_path(self.target, -1),
+                   lambda: self.settings.move_path(self.target, 1))
+
+    def add_remove(self, i):
+        alias = f"temp-{i % 5}"
+        self.apply(lambda: self.settings.add_path(alias, f"/tmp/{alias}"),
+                   lambda: self.settings.remove_path(alias))
+
+    def _set_field(self, key, value):
+        paths = [dict(p) for p in self.settings.paths]
+        for p in paths:
+            if p["alias"] == self.target:
+                if value is None:
+                    p.pop(key, None)
+                else:
+                    p[key] = value
+        self.settings.set_paths(paths)
+
+    def icon(self, i):
+        self.apply(lambda: self._set_field("icon", "/usr/share/icons/custom.png"),
+                   lambda: self._set_field("icon", None))
+
+    def browse(self, i):
+        def change():
+            self._set_field("path", self.tree)
+            self._set_field("browse", True)
+            stub.drain()
+            key = next(k for k in self.indicator.renderer.folder_section.keys() if k[0] == self.target)
+            browse_menu = self.indicator.renderer.folder_section.widget_for(key).browse_menu
+            browse_menu.menu.emit("show")
+            wait_listing(browse_menu)
+            # 한 단계 더 열기
+            first = browse_menu.section.keys()[:1]
+            if first:
+                child = browse_menu.section.widget_for(first[0]).browse_menu
+                child.menu.emit("show")
+                wait_listing(child)
+
+        path = self.settings.get_path(self.target)["path"]
+        self.apply(change, lambda: (self._set_field("browse", None), self._set_field("path", path)))
+
+    def grouping(self, i):
+        self.apply(lambda: setattr(self.settings, "menu_grouping", "prefix"),
+                   lambda: setattr(self.settings, "menu_grouping", "none"))
+
+    def language(self, i):
+        languages = [code for code in i18n.LANGUAGES if code != "en"]
+        self.apply(lambda: setattr(self.settings, "language", languages[i % len(languages)]),
+                   lambda: setattr(self.settings, "language", "en"))
+
+    def refresh(self, i):
+        self.indicator.on_refresh(None)
+        stub.drain()
+
+    def dialogs(self, i):
+        """설정 창은 두 번 열어도 하나만 생기고, 닫으면 해제되어야 함"""
+        self.indicator.on_settings(None)
+        first = self.indicator._settings_dialog
+        self.indicator.on_settings(None)
+        assert self.indicator._settings_dialog is first, "settings window opened twice"
+        first.destroy()
+        assert self.indicator._settings_dialog is None
+        self.indicator.on_quick_switch(None)
+        self.indicator._switcher.hide()
+
+    def step(self, i):
+        self.ops[i % len(self.ops)](i)
+
+
+def main():
+    soak = Soak(ARGS.paths)
+    print(f"{'iteration':>9} {'widgets':>8} {'rss(MB)':>8}")
+    base_widgets = base_rss = None
+    failures = []
+    start = time.perf_counter()
+    for i in range(1, ARGS.iterations + 1):
+        soak.step(i)
+        if i % ARGS.check_every:
+            continue
+        open_submenus(soak.indicator.renderer)  # 같은 상태에서 비교
+        widgets, rss = stub.live_widgets(), rss_mb()
+        print(f"{i:>9} {widgets:>8} {rss:>8.1f}")
+        if i < ARGS.warmup:
+            continue
+        if base_widgets is None:
+            base_widgets, base_rss = widgets, rss
+            continue
+        if widgets > base_widgets + ARGS.widget_slack:
+            failures.append(f"widgets {base_widgets} -> {widgets} at {i}")
+        if rss > base_rss + ARGS.rss_slack_mb:
+            failures.append(f"rss {base_rss:.1f} MB -> {rss:.1f} MB at {i}")
+
+    soak.settings.flush()
+    elapsed = time.perf_counter() - start
+    for failure in failures:
+        print(f"LEAK {failure}")
+    if failures:
+        return 1
+    print(f"통과 ({ARGS.iterations} 회, {elapsed:.1f} s)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
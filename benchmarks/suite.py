@@ -0,0 +1,418 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Headless benchmark and regression suite
+
+디스플레이 없이 (benchmarks/gi_stub 의 gi 대용 모듈 사용) 목록 크기별로 다음을 측정하고
+baseline.json 과 비교하여 허용치보다 느려진 항목이 있으면 종료 코드 1 을 돌려준다.
+
+- settings.*: SettingsManager 로드, 저장 (flush), 정렬, 변경 (추가/수정/이동/삭제)
+- menu.*: build_menu() 처음 생성, 같은 메뉴 다시 구성, 한 항목 변경 후 구성 ("더 보기" 30 개씩),
+  제한 없는 메뉴 처음 생성과 전체 순서 뒤집기 (5000/10000 개)
+- i18n.t: 번역 조회
+- launch.*: 실행 명령 결정 (+ gi 대용 모듈에서는 Spawner 까지)
+- mounts.change: 마운트 추가/해제 이벤트 처리 (해당 마운트 아래 북마크만 메뉴에 반영)
+
+사용법:
+    python3 benchmarks/suite.py                    # 실행 후 baseline 과 비교
+    python3 benchmarks/suite.py --update           # 현재 결과를 baseline 으로 저장
+    python3 benchmarks/suite.py --sizes 100,1000 --tolerance 0.3 --only settings
+    python3 benchmarks/suite.py --real-gi          # 설치된 PyGObject 사용 (baseline 과 비교하지 않음)
+
+각 항목은 타이머 해상도보다 충분히 긴 표본 (MIN_SAMPLE_MS 이상) 여러 개의 중앙값으로
+잰다. --update 는 전체 항목을 UPDATE_PASSES 번 돌아가며 잰 중앙값을 저장하고, 비교할 때
+허용치를 넘은 항목은 RECHECK_PASSES 번 다시 재서 계속 느린 경우에만 실패로 본다.
+
+baseline.json 의 "tolerance" 는 기본 허용치 (0.3 = 30% 까지 느려져도 통과),
+"tolerances" 에 항목 ("menu.build") 또는 항목 묶음 ("menu") 별 허용치를 따로 둘 수 있다
+(--tolerance 를 주면 둘 다 무시하고 모든 항목에 사용). 잡음 때문에 실패하면 허용치를
+늘리기보다 --repeat 를 늘리거나 해당 항목의 작업량을 늘린다.
+측정 환경이 바뀌거나 측정 대상 코드가 바뀌면 --update 로 다시 만든다.
+"""
+
+import argparse
+import gc
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT = os.path.dirname(BENCH_DIR)
+BASELINE_FILE = os.path.join(BENCH_DIR, "baseline.json")
+
+DEFAULT_SIZES = (100, 1000, 5000)
+DEFAULT_TOLERANCE = 0.3
+NOISE_FLOOR_MS = 0.05  # 이보다 작은 차이는 허용치와 관계없이 통과
+MIN_SAMPLE_MS = 5.0  # 표본 하나의 최소 측정 시간 (짧은 항목은 여러 번 실행)
+MAX_NUMBER = 1000
+MAX_CASE_MS = 5000.0  # 한 번에 이보다 오래 걸리는 항목은 표본 수를 줄임 (최소 3 개)
+UPDATE_PASSES = 3  # --update 때 전체 항목을 돌아가며 재는 횟수 (항목별 중앙값 저장)
+RECHECK_PASSES = 2  # 허용치를 넘은 항목을 다시 재는 횟수 (가장 낮은 값 사용)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Baro headless benchmark suite")
+    parser.add_argument("--sizes", default="",
+                        help="목록 크기 (쉼표로 구분, 없으면 항목별 기본 크기)")
+    parser.add_argument("--repeat", type=int, default=9, help="항목마다 표본 수 (중앙값 사용)")
+    parser.add_argument("--only", default="", help="이름이 이 문자열로 시작하는 항목만 실행")
+    parser.add_argument("--baseline", default=BASELINE_FILE)
+    parser.add_argument("--tolerance", type=float, default=None,
+                        help="모든 항목의 허용치 (baseline 의 tolerance/tolerances 대신 사용)")
+    parser.add_argument("--update", action="store_true", help="결과를 baseline 으로 저장")
+    parser.add_argument("--real-gi", action="store_true", help="gi 대용 모듈 대신 설치된 PyGObject 사용")
+    return parser.parse_args(argv)
+
+
+ARGS = parse_args()
+
+# Baro 모듈을 import 하기 전에 HOME 과 gi 를 바꿔 둔다 (실제 ~/.config/baro 를 건드리지 않음)
+os.environ["HOME"] = tempfile.mkdtemp(prefix="baro-suite-")
+if not ARGS.real_gi:
+    sys.path.insert(0, os.path.join(BENCH_DIR, "gi_stub"))
+sys.path.insert(1 if not ARGS.real_gi else 0, ROOT)
+
+import gi  # noqa: E402
+from gi.repository import GLib  # noqa: E402
+
+STUB = getattr(gi, "STUB", False)
+
+from settings_manager import SettingsManager  # noqa: E402
+from baro_indicator import BaroIndicator  # noqa: E402
+from menu_renderer import MenuRenderer  # noqa: E402
+from launchers import LauncherRegistry  # noqa: E402
+from spawner import Spawner  # noqa: E402
+import i18n  # noqa: E402
+
+
+def drain():
+    """대기 중인 idle 콜백 실행"""
+    context = GLib.MainContext.default()
+    while context.iteration(False):
+        pass
+
+
+def median_ms(fn, repeat, setup=None):
+    """fn() 1 회 소요 시간의 중앙값 (ms)
+
+    한 번 미리 실행해 본 시간으로 표본마다 MIN_SAMPLE_MS 이상이 되도록 fn() 을
+    여러 번 실행하고 (setup() 은 매번 fn() 전에, 시간에서 제외), 그런 표본 repeat 개의
+    중앙값을 쓴다 (한 번에 오래 걸려 MAX_CASE_MS 를 넘는 항목은 표본을 3 개까지 줄임).
+    가장 빠른 값은 드물게 빠른 표본에 따라 실행마다 크게 달라지므로 쓰지 않는다.
+    timeit 처럼 측정 중에는 GC 를 멈춘다.
+    """
+    if setup is not None:
+        setup()
+    start = time.perf_counter()
+    fn()
+    first_ms = (time.perf_counter() - start) * 1000
+    number = min(MAX_NUMBER, max(1, math.ceil(MIN_SAMPLE_MS / max(first_ms, 1e-6))))
+    repeat = min(repeat, max(3, int(MAX_CASE_MS / max(first_ms * number, 1e-6))))
+
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            elapsed = 0.0
+            for _ in range(number):
+                if setup is not None:
+                    setup()
+                start = time.perf_counter()
+                fn()
+                elapsed += time.perf_counter() - start
+        finally:
+            gc.enable()
+        samples.append(elapsed * 1000 / number)
+    return statistics.median(samples)
+
+
+def make_paths(n):
+    return [{"alias": f"project-{i:05d}", "path": f"/home/user/team-{i % 40}/project-{i:05d}"}
+            for i in range(n)]
+
+
+def fresh_manager(n):
+    """n 개 경로가 저장된 설정 파일을 만들고 새 SettingsManager 반환"""
+    for name in ("settings.json", "usage.log"):
+        try:
+            os.remove(SettingsManager.CONFIG_FILE.with_name(name))
+        except FileNotFoundError:
+            pass
+    manager = SettingsManager(backend="json")
+    manager.set_paths(make_paths(n))
+    manager.save()
+    manager.flush()
+    return manager
+
+
+# 측정 항목: 이름 -> fn(size, repeat) -> ms
+def bench_settings_load(n, repeat):
+    fresh_manager(n)
+    return median_ms(lambda: SettingsManager(backend="json"), repeat)
+
+
+def bench_settings_save(n, repeat):
+    manager = fresh_manager(n)
+    alias = manager.paths[n // 2]["alias"]
+    counter = iter(range(10 ** 9))
+
+    def change():
+        # 목록 크기가 그대로 유지되도록 한 항목의 경로만 바꿈
+        manager.update_path(alias, alias, f"/tmp/saved-{next(counter) % 2}")
+        manager.save()
+    return median_ms(manager.flush, repeat, setup=change)
+
+
+def bench_settings_sort(n, repeat):
+    manager = fresh_manager(n)
+    manager.sort_mode = "name"
+    return median_ms(manager.get_sorted_paths, repeat)
+
+
+def bench_settings_mutate(n, repeat):
+    """추가, 수정, 이동, 삭제 각 100 번"""
+    manager = fresh_manager(n)
+
+    def mutate():
+        for i in range(100):
+            manager.add_path(f"tmp-{i}", f"/tmp/{i}")
+            manager.update_path(f"tmp-{i}", f"tmp-{i}", f"/tmp/new-{i}")
+            manager.move_path(f"tmp-{i}", -1)
+            manager.remove_path(f"tmp-{i}")
+    return median_ms(mutate, repeat)
+
+
+def _indicator(n, cap=30):
+    fresh_manager(n)
+    indicator = BaroIndicator()
+    indicator.settings.menu_item_cap = cap
+    drain()
+    return indicator
+
+
+def _build_from_empty(indicator, repeat):
+    def reset():
+        old = indicator.renderer
+        indicator.renderer = MenuRenderer(indicator.icons, old.actions)
+        old.destroy()
+    return median_ms(indicator.build_menu, repeat, setup=reset)
+
+
+def bench_menu_build(n, repeat):
+    """빈 메뉴 골격에서 전체 경로 항목 생성"""
+    return _build_from_empty(_indicator(n), repeat)
+
+
+def bench_menu_uncapped(n, repeat):
+    """항목 수 제한 없이 (menu_item_cap = 0) 빈 메뉴 골격에서 전체 경로 항목 생성"""
+    return _build_from_empty(_indicator(n, cap=0), repeat)
+
+
+def bench_menu_reverse(n, repeat):
+    """제한 없는 메뉴의 전체 순서 뒤집기 (모든 항목 이동)"""
+    section = _indicator(n, cap=0).renderer.folder_section
+    entries = [(key, section.spec_for(key)) for key in section.keys()]
+
+    def reverse():
+        entries.reverse()
+        section.sync(entries)
+    return median_ms(reverse, repeat)
+
+
+def bench_menu_same(n, repeat):
+    """바뀐 것이 없는 메뉴 다시 구성 (모델 비교만)"""
+    indicator = _indicator(n)
+    return median_ms(indicator.build_menu, repeat)
+
+
+def bench_menu_change(n, repeat):
+    """한 항목의 경로가 바뀐 뒤 메뉴 구성 (바뀐 항목만 갱신)"""
+    indicator = _indicator(n)
+    settings = indicator.settings
+    alias = settings.paths[n // 2]["alias"]
+    counter = iter(range(10 ** 9))
+    settings.remove_listener(indicator._on_settings_changed)
+    return median_ms(indicator.build_menu, repeat,
+                   setup=lambda: settings.update_path(alias, alias, f"/tmp/changed-{next(counter)}"))
+
+
+def bench_i18n(n, repeat):
+    """n 번 번역 조회 (언어를 돌아가며)"""
+    keys = list(i18n.TRANSLATIONS["en"])
+    languages = list(i18n.LANGUAGES)
+
+    def lookups():
+        for i in range(n):
+            i18n.set_language(languages[i % len(languages)])
+            i18n.t(keys[i % len(keys)])
+        i18n.set_language("en")
+    return median_ms(lookups, repeat)
+
+
+def bench_launch(n, repeat):
+    """n 개 경로의 폴더/터미널 실행 명령 결정 (gi 대용 모듈에서는 Spawner 로 실행 요청까지)"""
+    registry = LauncherRegistry()
+    paths = [p["path"] for p in make_paths(n)]
+    spawners = []
+
+    def reset():
+        # 대용 모듈에서는 자식 종료 알림이 없으므로 반복마다 새 Spawner 사용
+        spawners[:] = [Spawner()] if STUB else []
+
+    def dispatch():
+        for path in paths:
+            launch = registry.folder_command(path, "xdg-open")
+            registry.terminal_command(path, "gnome-terminal")
+            for spawner in spawners:
+                spawner.spawn(launch.argv, launch.cwd)
+        drain()
+    return median_ms(dispatch, repeat, setup=reset)
+
+
+def bench_mounts(n, repeat):
+    """북마크의 1/10 이 있는 GVFS 마운트를 연결했다가 해제 (대용 모듈에서만)"""
+    if not STUB:
+        return 0.0
+    from gi.repository import Gio
+    root = "/run/user/1000/gvfs/sftp:host=bench"
+    paths = make_paths(n)
+    for p in paths[::10]:
+        p["path"] = root + p["path"]
+    Gio.VolumeMonitor._instance = None  # 앞의 항목에서 만든 인디케이터의 핸들러 제외
+    manager = fresh_manager(0)
+    manager.set_paths(paths)
+    manager.save()
+    manager.flush()
+    indicator = BaroIndicator()
+    indicator.settings.menu_item_cap = 0  # 모든 항목을 메뉴에 표시
+    drain()
+    monitor = Gio.VolumeMonitor.get()
+
+    def toggle():
+        monitor.remove_mount(monitor.add_mount(root, "bench"))
+    return median_ms(toggle, repeat)
+
+
+CASES = [
+    ("settings.load", bench_settings_load),
+    ("settings.save", bench_settings_save),
+    ("settings.sort", bench_settings_sort),
+    ("settings.mutate", bench_settings_mutate),
+    ("menu.build", bench_menu_build),
+    ("menu.same", bench_menu_same),
+    ("menu.change", bench_menu_change),
+    ("menu.uncapped", bench_menu_uncapped, (5000, 10000)),
+    ("menu.reverse", bench_menu_reverse, (5000, 10000)),
+    ("i18n.t", bench_i18n),
+    ("launch.dispatch", bench_launch),
+    ("mounts.change", bench_mounts),
+]
+
+
+def load_baseline(path):
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def compare(results, baseline, tolerance, tolerances):
+    """baseline 대비 느려진 항목 목록 [(이름, 기준, 현재, 허용치)] (tolerances: 항목별 허용치)"""
+    regressions = []
+    base_results = baseline.get("results", {})
+    for name, value in results.items():
+        base = base_results.get(name)
+        if base is None:
+            continue
+        case = name.split("[")[0]
+        allowed = tolerances.get(case, tolerances.get(case.split(".")[0], tolerance))
+        if value > base * (1 + allowed) and value - base > NOISE_FLOOR_MS:
+            regressions.append((name, base, value, allowed))
+    return regressions
+
+
+def main():
+    sizes = [int(s) for s in ARGS.sizes.split(",") if s.strip()]
+    baseline = load_baseline(ARGS.baseline)
+    base_results = (baseline or {}).get("results", {})
+
+    runs = {}
+    for name, case, *case_sizes in CASES:
+        if name.startswith(ARGS.only):
+            for n in sizes or (case_sizes[0] if case_sizes else DEFAULT_SIZES):
+                runs[f"{name}[{n}]"] = (case, n)
+
+    # 측정 환경의 속도는 몇 초~몇 분 단위로 바뀌므로 baseline 은 전체 항목을 여러 번 돌아가며
+    # 잰 중앙값으로 저장 (한 항목을 연달아 재면 모두 같은 느린 구간에 걸릴 수 있음)
+    samples = {key: [] for key in runs}
+    for _ in range(UPDATE_PASSES if ARGS.update else 1):
+        for key, (case, n) in runs.items():
+            samples[key].append(case(n, ARGS.repeat))
+
+    results = {}
+    print(f"{'case':<26} {'ms':>10} {'baseline':>10} {'change':>8}")
+    for key, values in samples.items():
+        results[key] = value = statistics.median(values)
+        base = base_results.get(key)
+        change = f"{(value / base - 1) * 100:+7.1f}%" if base else ""
+        base_text = f"{base:10.3f}" if base else ""
+        print(f"{key:<26} {value:10.3f} {base_text:>10} {change:>8}")
+
+    if ARGS.update:
+        data = dict(baseline or {})
+        data.setdefault("tolerance", DEFAULT_TOLERANCE)
+        data.setdefault("tolerances", {})
+        data["environment"] = {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "gi": "stub" if STUB else "real",
+        }
+        data["results"] = {**data.get("results", {}), **{k: round(v, 4) for k, v in results.items()}}
+        with open(ARGS.baseline, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"baseline 저장: {ARGS.baseline}")
+        return 0
+
+    if baseline is None:
+        print("baseline 이 없습니다 (--update 로 생성)")
+        return 0
+    if not STUB:
+        print("설치된 PyGObject 로 측정한 결과는 baseline 과 비교하지 않습니다")
+        return 0
+
+    if ARGS.tolerance is not None:
+        tolerance, tolerances = ARGS.tolerance, {}
+    else:
+        tolerance = baseline.get("tolerance", DEFAULT_TOLERANCE)
+        tolerances = baseline.get("tolerances", {})
+    regressions = compare(results, baseline, tolerance, tolerances)
+    for _ in range(RECHECK_PASSES):
+        if not regressions:
+            break
+        # 잠깐 느려진 것인지 확인하도록 허용치를 넘은 항목만 다시 재서 낮은 값 사용
+        for name, *_ in regressions:
+            case, n = runs[name]
+            results[name] = min(results[name], case(n, ARGS.repeat))
+            print(f"{name + ' (다시)':<26} {results[name]:10.3f}")
+        regressions = compare(results, baseline, tolerance, tolerances)
+    for name, base, value, allowed in regressions:
+        print(f"REGRESSION {name}: {base:.3f} ms -> {value:.3f} ms (허용 +{allowed * 100:.0f}%)")
+    if regressions:
+        return 1
+    print(f"통과 ({len(results)} 항목, 허용 +{tolerance * 100:.0f}%)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
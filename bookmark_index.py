@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Indexed, ordered bookmark store for Baro Path Quick Access Indicator
+"""
+
+import os
+from typing import Dict, Iterable, Iterator, List, Optional
+
+
+def normalize_path(path: str) -> str:
+    """중복 검사용 경로 정규화"""
+    return os.path.normpath(os.path.expanduser(path)) if path else ""
+
+
+class BookmarkIndex:
+    """순서가 있는 북마크 목록 + 별칭/경로 색인
+
+    항목은 이중 연결 리스트로 순서를 유지하므로 추가/삭제/이동이 O(1) 이고,
+    "order" 번호와 목록은 읽을 때 한 번만 다시 만든다 (변경마다 전체 재번호 없음).
+    별칭은 보통 유일하지만 set_paths 로 중복이 들어올 수 있어 목록으로 색인한다.
+    """
+
+    def __init__(self, entries: Iterable[Dict] = ()):
+        self.reset(entries)
+
+    def reset(self, entries: Iterable[Dict]):
+        """목록 전체 교체 ("order" 기준 안정 정렬)"""
+        self._entries: Dict[int, Dict] = {}
+        self._prev: Dict[int, Optional[int]] = {}
+        self._next: Dict[int, Optional[int]] = {}
+        self._head: Optional[int] = None
+        self._tail: Optional[int] = None
+        self._by_alias: Dict[str, List[int]] = {}
+        self._by_path: Dict[str, List[int]] = {}
+        self._next_id = 0
+        self._cache: Optional[List[Dict]] = None
+        for entry in sorted(entries, key=lambda x: x.get("order", 0)):
+            self._link(entry)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[Dict]:
+        node = self._head
+        while node is not None:
+            yield self._entries[node]
+            node = self._next[node]
+
+    def to_list(self) -> List[Dict]:
+        """순서대로 정렬된 항목 목록 (변경 후 처음 호출될 때만 order 재번호)"""
+        if self._cache is None:
+            self._cache = list(self)
+            for i, entry in enumerate(self._cache):
+                entry["order"] = i
+        return self._cache
+
+    # 조회
+    def _first(self, alias: str) -> Optional[int]:
+        """별칭에 해당하는 노드 중 목록에서 가장 앞의 것"""
+        nodes = self._by_alias.get(alias)
+        if not nodes:
+            return None
+        if len(nodes) == 1:
+            return nodes[0]
+        # 중복 별칭 (드묾): 목록 순서대로 찾음
+        candidates = set(nodes)
+        node = self._head
+        while node not in candidates:
+            node = self._next[node]
+        return node
+
+    def get(self, alias: str) -> Optional[Dict]:
+        """별칭으로 항목 조회 (중복 시 첫 번째)"""
+        node = self._first(alias)
+        return self._entries[node] if node is not None else None
+
+    def find_by_path(self, path: str) -> List[Dict]:
+        """경로(정규화 비교)로 항목 조회"""
+        return [self._entries[n] for n in self._by_path.get(normalize_path(path), [])]
+
+    def has_alias(self, alias: str) -> bool:
+        return alias in self._by_alias
+
+    def count_alias(self, alias: str) -> int:
+        return len(self._by_alias.get(alias, ()))
+
+    def has_duplicate_aliases(self) -> bool:
+        return len(self._by_alias) < len(self._entries)
+
+    def has_path(self, path: str) -> bool:
+        return normalize_path(path) in self._by_path
+
+    # 변경
+    def append(self, entry: Dict):
+        """맨 뒤에 추가"""
+        entry["order"] = len(self._entries)
+        self._link(entry)
+
+    def remove(self, alias: str) -> Optional[Dict]:
+        """별칭으로 삭제 (삭제된 항목 반환)"""
+        node = self._first(alias)
+        if node is None:
+            return None
+        return self._unlink(node)
+
+    def update(self, alias: str, new_alias: str, new_path: str) -> Optional[Dict]:
+        """별칭/경로 변경 (색인 갱신)"""
+        node = self._first(alias)
+        if node is None:
+            return None
+        entry = self._entries[node]
+        self._unindex(node)
+        entry["alias"] = new_alias
+        entry["path"] = new_path
+        self._index(node)
+        return entry
+
+    def move(self, alias: str, direction: int) -> Optional[Dict]:
+        """direction 칸 위(-)/아래(+)의 항목과 자리 바꾸기 (자리를 바꾼 상대 항목 반환)"""
+        node = self._first(alias)
+        if node is None or direction == 0:
+            return None
+        other = node
+        links = self._prev if direction < 0 else self._next
+        for _ in range(abs(direction)):
+            other = links[other]
+            if other is None:
+                return None
+        self._swap(node, other)
+        return self._entries[node]
+
+    # 내부 구현
+    def _index(self, node: int):
+        entry = self._entries[node]
+        self._by_alias.setdefault(entry.get("alias", ""), []).append(node)
+        self._by_path.setdefault(normalize_path(entry.get("path", "")), []).append(node)
+
+    def _unindex(self, node: int):
+        entry = self._entries[node]
+        for table, key in ((self._by_alias, entry.get("alias", "")),
+                           (self._by_path, normalize_path(entry.get("path", "")))):
+            nodes = table[key]
+            nodes.remove(node)
+            if not nodes:
+                del table[key]
+
+    def _link(self, entry: Dict):
+        node = self._next_id
+        self._next_id += 1
+        self._entries[node] = entry
+        self._prev[node] = self._tail
+        self._next[node] = None
+        if self._tail is None:
+            self._head = node
+        else:
+            self._next[self._tail] = node
+        self._tail = node
+        self._index(node)
+        self._cache = None
+
+    def _unlink(self, node: int) -> Dict:
+        self._unindex(node)
+        prev, nxt = self._prev.pop(node), self._next.pop(node)
+        if prev is None:
+            self._head = nxt
+        else:
+            self._next[prev] = nxt
+        if nxt is None:
+            self._tail = prev
+        else:
+            self._prev[nxt] = prev
+        self._cache = None
+        return self._entries.pop(node)
+
+    def _swap(self, a: int, b: int):
+        """두 노드의 위치 교환 (항목 자체를 맞바꾸고 색인 갱신)"""
+        entry_a, entry_b = self._entries[a], self._entries[b]
+        self._unindex(a)
+        self._unindex(b)
+        self._entries[a], self._entries[b] = entry_b, entry_a
+        self._index(a)
+        self._index(b)
+        self._cache = None
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Subfolder browsing submenus for Baro Path Quick Access Indicator
+"""
+
+import os
+from typing import Callable
+
+import gi
+gi.require_version('Gtk', '3.0')
+from gi.repository import Gtk
+
+from dir_lister import DirLister, Listing
+from menu_diff import KeyedMenu
+from i18n import t
+
+
+class BrowseMenu:
+    """폴더의 하위 폴더를 보여 주는 서브메뉴
+
+    "이 폴더 열기" 항목 아래에 하위 폴더를 나열하며, 목록은 서브메뉴가 열릴 때
+    DirLister 로 작업 스레드에서 읽는다. depth 가 남아 있으면 하위 폴더도
+    같은 방식의 서브메뉴가 된다 (역시 열릴 때 읽음).
+    """
+
+    def __init__(self, parent_item, path: str, depth: int, lister: DirLister,
+                 on_open: Callable[[str], None], make_item: Callable[[str, str], Gtk.MenuItem]):
+        self.path = path
+        self.depth = depth
+        self.lister = lister
+        self.on_open = on_open
+        self.make_item = make_item
+        self._destroyed = False
+
+        menu = Gtk.Menu()
+        self.open_item = make_item(t("menu_browse_open"), "folder.png")
+        self.open_item.connect("activate", lambda w: self.on_open(self.path))
+        menu.append(self.open_item)
+        menu.append(Gtk.SeparatorMenuItem())
+
+        # 하위 폴더 구역 (열기 항목과 구분선 다음, 상태 항목 앞)
+        self.section = KeyedMenu(menu, self._create_item, lambda item, spec, old: None, offset=2)
+        self.status = Gtk.MenuItem(label="…")
+        self.status.set_sensitive(False)
+        menu.append(self.status)
+        menu.show_all()
+
+        self.menu = menu
+        self.parent_item = parent_item
+        parent_item.set_submenu(menu)
+        # 서브메뉴가 바뀌어도 같은 항목에 남지 않도록 destroy 때 해제
+        self._select_handler = parent_item.connect("select", self._on_open)
+        menu.connect("show", self._on_open)
+        menu.connect("destroy", self._on_destroy)
+
+    def set_path(self, path: str):
+        """다른 폴더를 보여 주도록 변경 (다음에 열릴 때 다시 읽음)"""
+        if path != self.path:
+            self.path = path
+            self.section.clear()
+            self._set_status("…")
+
+    def _create_item(self, name, spec):
+        child = os.path.join(self.path, name)
+        item = self.make_item(name, "folder.png")
+        if self.depth > 1:
+            item.browse_menu = BrowseMenu(item, child, self.depth - 1, self.lister,
+                                          self.on_open, self.make_item)
+        else:
+            item.connect("activate", lambda w: self.on_open(child))
+        item.show()
+        return item
+
+    def _set_status(self, label):
+        """상태 항목 (읽는 중, 비어 있음, 오류, 일부만 표시) 갱신"""
+        if label is None:
+            self.status.hide()
+            return
+        if self.status.get_label() != label:
+            self.status.set_label(label)
+        self.status.show()
+
+    def _on_open(self, *args):
+        if self.open_item.get_label() != t("menu_browse_open"):
+            self.open_item.set_label(t("menu_browse_open"))
+        self.lister.list(self.path, self._on_listed)
+
+    def _on_listed(self, path: str, listing: Listing):
+        if self._destroyed or path != self.path:
+            return
+        self.section.sync([(name, name) for name in listing.names])
+        if listing.error is not None:
+            self._set_status(t("menu_browse_error"))
+        elif not listing.names:
+            self._set_status(t("menu_browse_empty"))
+        elif listing.truncated:
+            self._set_status(t("menu_browse_truncated"))
+        else:
+            self._set_status(None)
+
+    def _on_destroy(self, widget):
+        self._destroyed = True
+        if self.parent_item.handler_is_connected(self._select_handler):
+            self.parent_item.disconnect(self._select_handler)
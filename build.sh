@@ -60,6 +60,7 @@ pyinstaller \
     --hidden-import=gi.repository.GdkPixbuf \
     --add-data="settings_manager.py:." \
     --add-data="settings_dialog.py:." \
+    --add-data="locales:locales" \
     "$MAIN_SCRIPT"
 
 # 결과 확인
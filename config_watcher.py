@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Settings file watcher for Baro Path Quick Access Indicator
+"""
+
+from typing import Callable, Optional
+
+from gi.repository import Gio, GLib
+
+
+class ConfigWatcher:
+    """Gio.FileMonitor 로 설정 파일을 감시하고 연속된 쓰기를 묶어 한 번만 알리는 클래스"""
+
+    def __init__(self, path: str, on_change: Callable[[], None], debounce_ms: int = 300):
+        self.path = path
+        self.on_change = on_change
+        self.debounce_ms = debounce_ms
+        self._monitor: Optional[Gio.FileMonitor] = None
+        self._timer: Optional[int] = None
+
+    def start(self):
+        """감시 시작"""
+        self.stop()
+        gfile = Gio.File.new_for_path(str(self.path))
+        try:
+            # 임시 파일 + rename 방식의 저장도 감지하도록 WATCH_MOVES 사용
+            self._monitor = gfile.monitor_file(Gio.FileMonitorFlags.WATCH_MOVES, None)
+        except GLib.Error as e:
+            print(f"설정 파일 감시 오류: {e}")
+            return
+        self._monitor.connect("changed", self._on_event)
+
+    def stop(self):
+        """감시 중지"""
+        if self._timer is not None:
+            GLib.source_remove(self._timer)
+            self._timer = None
+        if self._monitor is not None:
+            self._monitor.cancel()
+            self._monitor = None
+
+    def _on_event(self, monitor, file, other_file, event_type):
+        if event_type == Gio.FileMonitorEvent.ATTRIBUTE_CHANGED:
+            return
+        # 마지막 이벤트 후 debounce_ms 동안 조용하면 한 번만 알림
+        if self._timer is not None:
+            GLib.source_remove(self._timer)
+        self._timer = GLib.timeout_add(self.debounce_ms, self._fire)
+
+    def _fire(self):
+        self._timer = None
+        self.on_change()
+        return False
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Single-instance D-Bus service for Baro Path Quick Access Indicator
+
+예:
+    gdbus call --session --dest com.dinkisstyle.Baro \\
+        --object-path /com/dinkisstyle/Baro --method com.dinkisstyle.Baro.Open "문서"
+"""
+
+from typing import Callable, Dict, Optional
+
+from gi.repository import Gio, GLib
+
+BUS_NAME = "com.dinkisstyle.Baro"
+OBJECT_PATH = "/com/dinkisstyle/Baro"
+INTERFACE = "com.dinkisstyle.Baro"
+
+INTROSPECTION_XML = f"""
+<node>
+  <interface name="{INTERFACE}">
+    <method name="Open">
+      <arg type="s" name="alias" direction="in"/>
+      <arg type="b" name="found" direction="out"/>
+    </method>
+    <method name="OpenTerminal">
+      <arg type="s" name="alias" direction="in"/>
+      <arg type="b" name="found" direction="out"/>
+    </method>
+    <method name="Reload"/>
+    <method name="List">
+      <arg type="a(ss)" name="paths" direction="out"/>
+    </method>
+    <method name="QuickSwitch"/>
+  </interface>
+</node>
+"""
+
+
+def call_running_instance(method: str, parameters: Optional[GLib.Variant] = None,
+                          timeout_ms: int = 1000) -> Optional[GLib.Variant]:
+    """이미 실행 중인 인스턴스의 메서드 호출 (실행 중이 아니면 None)"""
+    try:
+        bus = Gio.bus_get_sync(Gio.BusType.SESSION, None)
+        return bus.call_sync(
+            BUS_NAME, OBJECT_PATH, INTERFACE, method, parameters, None,
+            Gio.DBusCallFlags.NO_AUTO_START, timeout_ms, None
+        )
+    except GLib.Error:
+        return None
+
+
+class BaroService:
+    """세션 버스 이름을 소유하고 원격 명령을 처리하는 클래스
+
+    handlers: {"Open": fn(alias) -> bool, "OpenTerminal": fn(alias) -> bool,
+               "Reload": fn() -> None, "List": fn() -> [(alias, path)],
+               "QuickSwitch": fn() -> None}
+    on_name_lost: 다른 인스턴스가 이름을 가져간 경우 호출
+    """
+
+    def __init__(self, handlers: Dict[str, Callable], on_name_lost: Optional[Callable[[], None]] = None):
+        self.handlers = handlers
+        self.on_name_lost = on_name_lost
+        self._node_info = Gio.DBusNodeInfo.new_for_xml(INTROSPECTION_XML)
+        self._owner_id: Optional[int] = None
+        self._registration_id: Optional[int] = None
+
+    def start(self):
+        """버스 이름 소유 요청"""
+        self._owner_id = Gio.bus_own_name(
+            Gio.BusType.SESSION, BUS_NAME, Gio.BusNameOwnerFlags.DO_NOT_QUEUE,
+            self._on_bus_acquired, None, self._on_name_lost
+        )
+
+    def stop(self):
+        """버스 이름 해제"""
+        if self._owner_id is not None:
+            Gio.bus_unown_name(self._owner_id)
+            self._owner_id = None
+
+    def _on_bus_acquired(self, connection, name):
+        self._registration_id = connection.register_object_with_closures(
+            OBJECT_PATH, self._node_info.interfaces[0], self._on_method_call, None, None
+        )
+
+    def _on_name_lost(self, connection, name):
+        if connection is None:
+            # 세션 버스가 없는 환경: 단일 인스턴스 기능 없이 계속 실행
+            print("D-Bus 세션 버스에 연결할 수 없습니다")
+            return
+        if self.on_name_lost is not None:
+            self.on_name_lost()
+
+    def _on_method_call(self, connection, sender, object_path, interface_name,
+                        method_name, parameters, invocation):
+        handler = self.handlers.get(method_name)
+        if handler is None:
+            invocation.return_dbus_error(
+                "org.freedesktop.DBus.Error.UnknownMethod", f"Unknown method: {method_name}"
+            )
+            return
+        try:
+            result = handler(*parameters.unpack())
+        except Exception as e:
+            invocation.return_dbus_error(f"{INTERFACE}.Error.Failed", str(e))
+            return
+
+        if method_name in ("Open", "OpenTerminal"):
+            invocation.return_value(GLib.Variant("(b)", (bool(result),)))
+        elif method_name == "List":
+            invocation.return_value(GLib.Variant("(a(ss))", (list(result),)))
+        else:
+            invocation.return_value(None)
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Non-blocking subdirectory listing for Baro Path Quick Access Indicator
+"""
+
+import errno
+import os
+from collections import OrderedDict
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+from gi.repository import GLib
+
+from worker_pool import WorkerPool
+
+
+class Listing(NamedTuple):
+    """폴더의 하위 폴더 목록 (이름순, 숨김 폴더 제외)"""
+    names: Tuple[str, ...]
+    truncated: bool = False  # max_entries / scan_limit 에 걸려 일부만 읽음
+    error: Optional[str] = None  # 읽을 수 없는 경우 오류 메시지
+
+
+ListCallback = Callable[[str, Listing], None]
+
+
+class DirLister:
+    """하위 폴더 목록을 작업 스레드에서 os.scandir 로 읽고 결과를 메인 루프로 전달하는 클래스
+
+    결과는 폴더 mtime 과 함께 LRU 방식으로 cache_size 개까지 캐시한다.
+    캐시된 폴더는 바로 콜백을 호출한 뒤 작업 스레드에서 mtime 을 다시 확인하고,
+    바뀐 경우에만 다시 읽어 한 번 더 콜백을 호출한다. 큰 폴더는 max_entries 개의
+    하위 폴더 또는 scan_limit 개의 항목을 확인한 곳에서 멈춘다. timeout 초 안에
+    끝나지 않으면 오류 목록으로 응답하고, 멈춘 스레드는 새 스레드로 대신한다
+    (최대 max_abandoned 개).
+    """
+
+    def __init__(self, max_entries: int = 200, scan_limit: int = 5000,
+                 cache_size: int = 256, workers: int = 2,
+                 timeout: float = 5.0, max_abandoned: int = 8):
+        self.max_entries = max_entries
+        self.scan_limit = scan_limit
+        self.cache_size = cache_size
+        self.timeout = timeout
+        # 경로 -> (mtime_ns, Listing)
+        self._cache: "OrderedDict[str, Tuple[int, Listing]]" = OrderedDict()
+        # 경로 -> [(콜백, 캐시 결과를 이미 받았는지)]
+        self._waiters: Dict[str, List[Tuple[ListCallback, bool]]] = {}
+        self._timeouts: Dict[str, int] = {}  # 경로별 시간 초과 타이머 source id
+        self._pool = WorkerPool("baro-scandir", self._read, self._resolve, workers, max_abandoned)
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def cached(self, path: str) -> Optional[Listing]:
+        """캐시된 목록 반환 (mtime 확인 없음)"""
+        entry = self._cache.get(path)
+        return entry[1] if entry is not None else None
+
+    def invalidate(self, path: Optional[str] = None):
+        """캐시 무효화 (path 지정 시 해당 폴더만)"""
+        if path is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(path, None)
+
+    def list(self, path: str, callback: ListCallback):
+        """하위 폴더 목록 요청 (callback 은 항상 메인 루프에서 호출)
+
+        같은 콜백이 이미 결과를 기다리고 있으면 (서브메뉴의 select 와 show 처럼
+        한 번 열 때 두 번 요청하는 경우) 아무것도 하지 않는다.
+        """
+        waiters = self._waiters.get(path)
+        if waiters is not None and any(waiting == callback for waiting, _ in waiters):
+            return
+        entry = self._cache.get(path)
+        if entry is not None:
+            self._cache.move_to_end(path)
+            callback(path, entry[1])
+
+        if path in self._waiters:
+            # 이미 읽는 중이면 결과를 함께 기다림
+            self._waiters[path].append((callback, entry is not None))
+            return
+        self._waiters[path] = [(callback, entry is not None)]
+        # 시간 초과 후에도 아직 읽는 중이면 그 결과를 기다림 (같은 경로로 스레드를 더 막지 않음)
+        self._pool.put(path, entry[0] if entry is not None else None)
+        self._timeouts[path] = GLib.timeout_add(int(self.timeout * 1000), self._on_timeout, path)
+
+    def _read(self, path, known_mtime) -> Tuple[Optional[int], Optional[Listing]]:
+        """(mtime, 목록) 반환 (mtime 이 그대로면 목록은 None, 읽을 수 없으면 mtime 이 None)"""
+        try:
+            mtime = os.stat(path).st_mtime_ns
+            return mtime, None if mtime == known_mtime else self._scan(path)
+        except OSError as e:
+            return None, Listing((), error=e.strerror or str(e))
+
+    def _on_timeout(self, path):
+        """응답 없는 폴더: 캐시 결과를 못 받은 콜백에 오류 목록 전달 (늦은 결과는 캐시만 갱신)"""
+        self._timeouts.pop(path, None)
+        self._pool.abandon(path)
+        timed_out = Listing((), error=os.strerror(errno.ETIMEDOUT))
+        for callback, served in self._waiters.pop(path, []):
+            if not served:
+                callback(path, timed_out)
+        return False
+
+    def _scan(self, path: str) -> Listing:
+        names = []
+        truncated = False
+        with os.scandir(path) as it:
+            for checked, entry in enumerate(it):
+                if checked >= self.scan_limit or len(names) >= self.max_entries:
+                    truncated = True
+                    break
+                if entry.name.startswith("."):
+                    continue
+                try:
+                    if entry.is_dir():
+                        names.append(entry.name)
+                except OSError:
+                    continue
+        names.sort(key=str.lower)
+        return Listing(tuple(names), truncated)
+
+    def _resolve(self, path, result):
+        """결과를 캐시하고 대기 중인 콜백 호출 (바뀌지 않았으면 캐시 결과를 못 받은 콜백만)"""
+        mtime, listing = result
+        waiters = self._waiters.pop(path, [])
+        source = self._timeouts.pop(path, None)
+        if source is not None:
+            GLib.source_remove(source)
+        if listing is None:
+            entry = self._cache.get(path)
+            if entry is None:
+                # 확인하는 사이 캐시에서 밀려남: 다시 읽음
+                for callback, _ in waiters:
+                    self.list(path, callback)
+                return False
+            for callback, served in waiters:
+                if not served:
+                    callback(path, entry[1])
+            return False
+
+        if mtime is None:
+            self._cache.pop(path, None)
+        else:
+            self._cache[path] = (mtime, listing)
+            self._cache.move_to_end(path)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        for callback, _ in waiters:
+            callback(path, listing)
+        return False
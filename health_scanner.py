@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Background bookmark health scanner for Baro Path Quick Access Indicator
+"""
+
+import time
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from gi.repository import GLib
+
+from path_checker import PathChecker
+
+
+class HealthScanner:
+    """북마크 경로의 접근 가능 여부를 주기적으로 확인하는 클래스
+
+    한 번에 batch_size 개의 오래된(stale) 경로만 PathChecker 로 확인하므로
+    북마크가 수천 개여도 주기당 작업량이 제한된다. 상태가 바뀐 경로는 모아서
+    on_change(changed_paths) 로 한 번에 알린다.
+
+    checker 는 클릭 확인용과 따로 둔 (작업 스레드가 적은) PathChecker 를 사용하며,
+    빈 작업 스레드가 있을 때만 하나씩 요청하고 이전 stat 이 아직 끝나지 않은
+    (응답 없는 마운트) 경로는 건너뛰므로 멈춘 경로가 쌓여 다른 확인을 막지 않는다.
+    작업 스레드가 모두 멈춰 있으면 남은 경로는 다음 주기로 미룬다.
+    """
+
+    def __init__(self, checker: PathChecker, get_paths: Callable[[], Iterable[str]],
+                 on_change: Callable[[Set[str]], None],
+                 interval: int = 60, batch_size: int = 64):
+        self.checker = checker
+        self.get_paths = get_paths
+        self.on_change = on_change
+        self.interval = interval
+        self.batch_size = batch_size
+        # 경로 -> (결과, 확인 시각). 결과: True(정상), False(없음), None(응답 없음)
+        self._states: Dict[str, Tuple[Optional[bool], float]] = {}
+        self._paths: Set[str] = set()
+        self._in_flight: Set[str] = set()
+        self._round: List[str] = []  # 이번 주기에 남은 확인 대상
+        self._changed: Set[str] = set()
+        self._timer: Optional[int] = None
+        self._notify_source: Optional[int] = None
+
+    def start(self):
+        """주기적 확인 시작"""
+        self.stop()
+        if self.interval > 0:
+            self._timer = GLib.timeout_add_seconds(self.interval, self._on_timer)
+            GLib.idle_add(self._on_idle)
+
+    def stop(self):
+        """주기적 확인 중지"""
+        if self._timer is not None:
+            GLib.source_remove(self._timer)
+            self._timer = None
+
+    def is_reachable(self, path: str) -> bool:
+        """접근 가능 여부 (아직 확인하지 않은 경로는 가능으로 간주)"""
+        state = self._states.get(path)
+        return state is None or state[0] is True
+
+    def invalidate(self, path: Optional[str] = None):
+        """다음 확인 때 다시 검사하도록 표시"""
+        if path is None:
+            self._states = {p: (s[0], 0.0) for p, s in self._states.items()}
+        elif path in self._states:
+            self._states[path] = (self._states[path][0], 0.0)
+
+    def scan(self) -> int:
+        """오래된 경로 중 최대 batch_size 개 확인 예약 (예약 수 반환)"""
+        now = time.monotonic()
+        paths = self._paths = set(self.get_paths())
+
+        # 더 이상 북마크에 없는 경로는 상태에서 제거
+        for path in [p for p in self._states if p not in paths]:
+            del self._states[path]
+
+        stale = [
+            p for p in paths
+            if p not in self._in_flight
+            and not self.checker.pending(p)  # 이전 주기의 stat 이 아직 멈춰 있음
+            and now - self._states.get(p, (None, 0.0))[1] >= self.interval
+        ]
+        stale.sort(key=lambda p: self._states.get(p, (None, 0.0))[1])
+
+        self._round = stale[:self.batch_size]
+        count = len(self._round)
+        self._submit()
+        return count
+
+    def _submit(self):
+        """빈 작업 스레드 수만큼 이번 주기의 경로 확인 요청 (대기열에서 시간 초과되지 않도록)"""
+        while self._round and self.checker.free_workers > 0:
+            path = self._round.pop(0)
+            if path not in self._paths or self.checker.pending(path):
+                continue
+            self._in_flight.add(path)
+            self.checker.check(path, self._on_checked)
+
+    def _on_timer(self):
+        self.scan()
+        return True
+
+    def _on_idle(self):
+        # scan() 은 예약 수를 돌려주므로 그대로 idle 콜백으로 쓰면 계속 반복됨
+        self.scan()
+        return False
+
+    def _on_checked(self, path, result):
+        self._in_flight.discard(path)
+        self._submit()
+        if path in self._paths:
+            was_reachable = self.is_reachable(path)
+            self._states[path] = (result, time.monotonic())
+            if self.is_reachable(path) != was_reachable:
+                self._changed.add(path)
+        # 작업 스레드가 적어 결과가 하나씩 오므로, 더 기다릴 확인이 없을 때 한 번에 알림
+        if self._changed and not self._in_flight and self._notify_source is None:
+            self._notify_source = GLib.idle_add(self._notify)
+
+    def _notify(self):
+        self._notify_source = None
+        changed, self._changed = self._changed, set()
+        if changed:
+            self.on_change(changed)
+        return False
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Icon / pixbuf cache for Baro Path Quick Access Indicator
+"""
+
+import os
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+import gi
+gi.require_version('Gtk', '3.0')
+gi.require_version('GdkPixbuf', '2.0')
+from gi.repository import Gtk, GLib
+
+
+class IconCache:
+    """아이콘을 한 번만 디코딩하고 크기별 pixbuf 를 공유하는 캐시
+
+    - 내장 아이콘 (icons/ 아래 파일 이름): 항상 캐시에 유지
+    - 경로별 사용자 아이콘 (절대 경로): LRU 방식으로 max_custom 개까지 유지
+    """
+
+    LOGO_SIZE = 128  # About 대화상자 로고 크기
+
+    def __init__(self, icons_dir: str, max_custom: int = 64):
+        self.icons_dir = icons_dir
+        self.max_custom = max_custom
+        self._menu_size: Optional[int] = None
+        self._builtin: Dict[Tuple[str, int], Optional["GdkPixbuf.Pixbuf"]] = {}
+        self._custom: "OrderedDict[Tuple[str, int], Optional[GdkPixbuf.Pixbuf]]" = OrderedDict()
+
+    @property
+    def menu_size(self) -> int:
+        """메뉴 아이콘 크기 (px)"""
+        if self._menu_size is None:
+            ok, width, height = Gtk.icon_size_lookup(Gtk.IconSize.MENU)
+            self._menu_size = max(width, height) if ok else 16
+        return self._menu_size
+
+    def _load(self, path: str, size: int) -> Optional["GdkPixbuf.Pixbuf"]:
+        """파일을 디코딩하여 size 에 맞게 축소 (없거나 깨진 파일은 None)"""
+        if not os.path.exists(path):
+            return None
+        # GdkPixbuf 는 처음 아이콘을 디코딩할 때 로드 (시작 시간 단축)
+        from gi.repository import GdkPixbuf
+        try:
+            return GdkPixbuf.Pixbuf.new_from_file_at_scale(path, size, size, True)
+        except GLib.Error as e:
+            print(f"아이콘 로드 오류: {path}: {e}")
+            return None
+
+    def get_pixbuf(self, icon: str, size: Optional[int] = None) -> Optional["GdkPixbuf.Pixbuf"]:
+        """아이콘 pixbuf 반환 (icon: 내장 아이콘 파일 이름 또는 절대 경로)"""
+        if size is None:
+            size = self.menu_size
+        key = (icon, size)
+
+        if not os.path.isabs(icon):
+            if key not in self._builtin:
+                self._builtin[key] = self._load(os.path.join(self.icons_dir, icon), size)
+            return self._builtin[key]
+
+        if key in self._custom:
+            self._custom.move_to_end(key)
+            return self._custom[key]
+        pixbuf = self._load(icon, size)
+        self._custom[key] = pixbuf
+        while len(self._custom) > self.max_custom:
+            self._custom.popitem(last=False)
+        return pixbuf
+
+    def new_image(self, icon: str, size: Optional[int] = None) -> Optional[Gtk.Image]:
+        """캐시된 pixbuf 를 공유하는 Gtk.Image 생성 (아이콘이 없으면 None)"""
+        pixbuf = self.get_pixbuf(icon, size)
+        if pixbuf is None:
+            return None
+        return Gtk.Image.new_from_pixbuf(pixbuf)
+
+    def invalidate(self, icon: Optional[str] = None):
+        """캐시 비우기 (icon 지정 시 해당 아이콘만)"""
+        if icon is None:
+            self._builtin.clear()
+            self._custom.clear()
+            self._menu_size = None
+            return
+        for cache in (self._builtin, self._custom):
+            for key in [k for k in cache if k[0] == icon]:
+                del cache[key]
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Launcher registry (terminals / file managers) for Baro Path Quick Access Indicator
+"""
+
+import os
+import shutil
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# 터미널별 작업 디렉토리 인자 템플릿 (설정값에 이름이 포함되면 적용, 위에서부터 검사)
+TERMINALS: Dict[str, Tuple[str, ...]] = {
+    "gnome-terminal": ("--working-directory", "{path}"),
+    "konsole": ("--workdir", "{path}"),
+    "xfce4-terminal": ("--working-directory", "{path}"),
+    "tilix": ("--directory", "{path}"),
+    "alacritty": ("--working-directory", "{path}"),
+    "kitty": ("--directory", "{path}"),
+}
+
+# GVFS 경로를 열 때 시도하는 파일 관리자 (우선순위 순)
+FILE_MANAGERS: Dict[str, Tuple[str, ...]] = {
+    "nautilus": ("{path}",),
+    "nemo": ("{path}",),
+    "thunar": ("{path}",),
+    "dolphin": ("{path}",),
+    "pcmanfm": ("{path}",),
+}
+
+
+class Launch(NamedTuple):
+    """실행할 명령 (argv) 과 작업 디렉토리"""
+    argv: List[str]
+    cwd: Optional[str] = None
+
+
+def is_gvfs_path(path: str) -> bool:
+    """GVFS 경로 (sftp, smb 등) 여부"""
+    return path.startswith("/run/user/") and "/gvfs/" in path
+
+
+class LauncherRegistry:
+    """사용 가능한 터미널/파일 관리자를 한 번만 찾아 두고 명령을 만들어 주는 클래스
+
+    PATH 검색 결과와 설정값별로 해석한 명령 템플릿을 캐시하며,
+    PATH 환경 변수가 바뀌면 다시 검색한다. 설정값이 바뀌면 새 값으로
+    캐시를 찾으므로 따로 무효화할 필요가 없다.
+    """
+
+    def __init__(self):
+        self._path_env: Optional[str] = None
+        self._which: Dict[str, Optional[str]] = {}
+        self._gvfs_file_manager: Optional[Tuple[str, Tuple[str, ...]]] = None
+        self._resolved: Dict[Tuple[str, str], Tuple[str, Optional[Tuple[str, ...]]]] = {}
+        self.refresh()
+
+    def refresh(self):
+        """PATH 에서 알려진 실행 파일을 다시 검색"""
+        self._path_env = os.environ.get("PATH", "")
+        self._which = {name: shutil.which(name)
+                       for name in list(TERMINALS) + list(FILE_MANAGERS) + ["xdg-open"]}
+        self._resolved.clear()
+        self._gvfs_file_manager = None
+        for name, template in FILE_MANAGERS.items():
+            if self._which[name]:
+                self._gvfs_file_manager = (self._which[name], template)
+                break
+
+    def _check_path_env(self):
+        if os.environ.get("PATH", "") != self._path_env:
+            self.refresh()
+
+    def which(self, command: str) -> Optional[str]:
+        """명령의 실행 파일 경로 (캐시됨)"""
+        self._check_path_env()
+        if command not in self._which:
+            self._which[command] = shutil.which(command)
+        return self._which[command]
+
+    def available_terminals(self) -> List[str]:
+        """설치된 알려진 터미널 목록"""
+        return [name for name in TERMINALS if self.which(name)]
+
+    def available_file_managers(self) -> List[str]:
+        """설치된 알려진 파일 관리자 목록"""
+        return [name for name in FILE_MANAGERS if self.which(name)]
+
+    def _resolve(self, kind: str, command: str, table: Dict[str, Tuple[str, ...]]):
+        """설정값을 (실행 파일, 인자 템플릿) 으로 해석 (캐시됨)"""
+        self._check_path_env()
+        key = (kind, command)
+        if key not in self._resolved:
+            template = None
+            for name, args in table.items():
+                if name in command:
+                    template = args
+                    break
+            self._resolved[key] = (self.which(command) or command, template)
+        return self._resolved[key]
+
+    def folder_command(self, path: str, file_manager: str) -> Launch:
+        """폴더를 여는 명령"""
+        self._check_path_env()
+        if is_gvfs_path(path):
+            # GVFS 경로는 파일 관리자를 직접 호출 (가장 확실한 방법)
+            if self._gvfs_file_manager:
+                exe, template = self._gvfs_file_manager
+                return Launch([exe] + [arg.format(path=path) for arg in template])
+            # 최후의 수단: xdg-open with file:// URI
+            return Launch([self._which.get("xdg-open") or "xdg-open", "file://" + path])
+
+        exe, _ = self._resolve("file_manager", file_manager, {})
+        return Launch([exe, path])
+
+    def terminal_command(self, path: str, terminal: str) -> Launch:
+        """해당 경로에서 터미널을 여는 명령"""
+        exe, template = self._resolve("terminal", terminal, TERMINALS)
+        if template is None:
+            # 기본: 해당 디렉토리로 이동 후 터미널 실행
+            return Launch(["/bin/sh", "-c", terminal], cwd=path)
+        return Launch([exe] + [arg.format(path=path) for arg in template])
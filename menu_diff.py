@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Keyed incremental menu updates for Baro Path Quick Access Indicator
+"""
+
+from bisect import bisect_left
+from typing import Any, Callable, Dict, Hashable, List, Sequence, Tuple
+
+
+def stable_keys(keys: Sequence[Hashable]) -> List[Hashable]:
+    """위치 변경이 필요 없는 키 목록 (최장 증가 부분 수열) 반환"""
+    # keys 는 새 순서, 값은 이전 순서에서의 인덱스로 비교
+    tails: List[int] = []
+    tail_idx: List[int] = []
+    prev: List[int] = [-1] * len(keys)
+    positions = [k[1] for k in keys]
+    for i, pos in enumerate(positions):
+        j = bisect_left(tails, pos)
+        if j == len(tails):
+            tails.append(pos)
+            tail_idx.append(i)
+        else:
+            tails[j] = pos
+            tail_idx[j] = i
+        prev[i] = tail_idx[j - 1] if j > 0 else -1
+
+    result = []
+    i = tail_idx[-1] if tail_idx else -1
+    while i >= 0:
+        result.append(keys[i][0])
+        i = prev[i]
+    return result
+
+
+class KeyedMenu:
+    """키(별칭 등)로 식별되는 메뉴 항목을 증분 갱신하는 클래스
+
+    sync() 에 원하는 (key, spec) 목록을 넘기면 바뀐 항목만
+    추가/삭제/라벨 변경/순서 변경하고 나머지 위젯은 그대로 둔다.
+    """
+
+    def __init__(self, menu, create_item: Callable[[Hashable, Any], Any],
+                 update_item: Callable[[Any, Any, Any], None], offset: int = 0):
+        self.menu = menu
+        self._create_item = create_item
+        self._update_item = update_item
+        self._offset = offset  # 부모 메뉴에서 이 구역이 시작하는 위치
+        self._keys: List[Hashable] = []
+        self._items: Dict[Hashable, Tuple[Any, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __contains__(self, key) -> bool:
+        return key in self._items
+
+    def keys(self) -> List[Hashable]:
+        """현재 순서대로 키 목록 반환"""
+        return list(self._keys)
+
+    def spec_for(self, key):
+        """키에 해당하는 현재 항목 정보 반환"""
+        item = self._items.get(key)
+        return item[1] if item else None
+
+    def widget_for(self, key):
+        """키에 해당하는 위젯 반환"""
+        item = self._items.get(key)
+        return item[0] if item else None
+
+    def sync(self, entries: Sequence[Tuple[Hashable, Any]]) -> Dict[str, int]:
+        """원하는 항목 목록과 현재 메뉴를 비교하여 바뀐 부분만 반영"""
+        stats = {"inserted": 0, "removed": 0, "updated": 0, "moved": 0}
+        new_keys = [key for key, _ in entries]
+        new_set = set(new_keys)
+        if len(new_set) != len(new_keys):
+            raise ValueError("menu keys must be unique")
+
+        # 1. 사라진 항목 제거
+        for key in self._keys:
+            if key not in new_set:
+                widget, _ = self._items.pop(key)
+                self.menu.remove(widget)
+                widget.destroy()
+                stats["removed"] += 1
+        current = [key for key in self._keys if key in self._items]
+
+        # 2. 남아 있는 항목 중 내용이 바뀐 것만 갱신
+        for key, spec in entries:
+            item = self._items.get(key)
+            if item is not None and item[1] != spec:
+                self._update_item(item[0], spec, item[1])
+                self._items[key] = (item[0], spec)
+                stats["updated"] += 1
+
+        # 3. 순서 맞추기 (제자리에 있는 최장 부분 수열은 건드리지 않음)
+        old_pos = {key: i for i, key in enumerate(current)}
+        stable = set(stable_keys(
+            [(key, old_pos[key]) for key in new_keys if key in old_pos]
+        ))
+
+        # 마지막 stable 항목보다 앞에 있는 옮길 항목을 구역 끝으로 보내 두면 앞쪽에는
+        # stable 항목만 순서대로 남으므로, 새 순서대로 한 번 훑으면서 i 번째 자리에
+        # 놓기만 하면 된다 (목록 탐색 없음)
+        stable_end = max((i + 1 for i, key in enumerate(current) if key in stable), default=0)
+        last = self._offset + len(current) - 1
+        for key in current[:stable_end]:
+            if key not in stable:
+                self.menu.reorder_child(self._items[key][0], last)
+
+        for i, (key, spec) in enumerate(entries):
+            if key in stable:
+                continue
+            if key in old_pos:
+                self.menu.reorder_child(self._items[key][0], self._offset + i)
+                stats["moved"] += 1
+            else:
+                widget = self._create_item(key, spec)
+                self._items[key] = (widget, spec)
+                self.menu.insert(widget, self._offset + i)
+                stats["inserted"] += 1
+
+        self._keys = new_keys
+        return stats
+
+    def clear(self):
+        """모든 항목 제거"""
+        self.sync([])
+
+
+def keyed_entries(paths: Sequence[Dict], make_spec: Callable[[Dict], Any]) -> List[Tuple[Hashable, Any]]:
+    """경로 목록을 (key, spec) 목록으로 변환 (중복 별칭은 순번으로 구분)"""
+    seen: Dict[str, int] = {}
+    entries = []
+    for path_item in paths:
+        alias = path_item.get("alias", "")
+        n = seen.get(alias, 0)
+        seen[alias] = n + 1
+        entries.append(((alias, n), make_spec(path_item)))
+    return entries
+
+
+class LazyMenu:
+    """처음 열릴 때 항목을 채우는 서브메뉴
+
+    set_entries() 는 목록만 기억해 두고(무효화), 실제 위젯은 서브메뉴가
+    열릴 때 materialize() 에서 KeyedMenu 로 생성/갱신한다.
+    """
+
+    def __init__(self, parent_item, section: KeyedMenu, placeholder):
+        self.parent_item = parent_item
+        self.section = section
+        self.placeholder = placeholder  # 아직 채워지지 않았을 때 보이는 항목
+        self._entries: Sequence[Tuple[Hashable, Any]] = []
+        self._stale = True
+
+        section.menu.append(placeholder)
+        placeholder.set_sensitive(False)
+        placeholder.show()
+        parent_item.set_submenu(section.menu)
+
+        parent_item.connect("activate", self._on_open)
+        parent_item.connect("select", self._on_open)
+        section.menu.connect("show", self._on_open)
+
+    @property
+    def materialized(self) -> bool:
+        return not self._stale
+
+    def set_entries(self, entries: Sequence[Tuple[Hashable, Any]]):
+        """항목 목록 설정 (이미 열려 있으면 즉시, 아니면 다음에 열릴 때 반영)"""
+        self._entries = entries
+        self._stale = True
+        if self.section.menu.get_visible():
+            self.materialize()
+
+    def materialize(self) -> Dict[str, int]:
+        """보류 중인 항목 목록을 위젯에 반영"""
+        if not self._stale:
+            return {}
+        stats = self.section.sync(self._entries)
+        self.placeholder.set_visible(not self._entries)
+        self._stale = False
+        return stats
+
+    def _on_open(self, *args):
+        self.materialize()
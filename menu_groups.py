@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Menu grouping and pagination for Baro Path Quick Access Indicator
+(gi/Gtk 를 import 하지 않음)
+"""
+
+import os
+from typing import Any, Callable, Dict, Hashable, List, Sequence, Tuple
+
+# 그룹/더 보기 (및 그 안의 페이지) 항목의 키 두 번째 값 (경로 항목은 0 이상의 순번)
+GROUP_KEY = -1
+MORE_KEY = -2
+
+
+class MenuGroup:
+    """서브메뉴로 묶인 항목 (그룹 또는 "더 보기" 페이지)
+
+    만들 때 하위 항목까지 포함한 digest 를 한 번 계산해 두므로, 상위 메뉴의
+    비교 (KeyedMenu.sync 의 spec 비교 등) 에서 바뀐 그룹은 바로 걸러진다. digest 가
+    같으면 (hash 충돌일 수 있으므로) 하위 항목을 직접 비교한다.
+    """
+
+    __slots__ = ("label", "entries", "digest")
+
+    def __init__(self, label: str, entries: Tuple[Tuple[Hashable, Any], ...]):
+        self.label = label
+        self.entries = entries
+        # 하위 MenuGroup 의 hash 는 미리 계산한 digest 이므로 각 단계는 자기 항목만 hash
+        self.digest = hash((label, entries))
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, MenuGroup):
+            return False
+        # 그룹은 여러 단계로 중첩될 수 있으므로 재귀 대신 스택으로 비교
+        pending = [(self, other)]
+        while pending:
+            a, b = pending.pop()
+            if a is b:
+                continue
+            if a.digest != b.digest or a.label != b.label or len(a.entries) != len(b.entries):
+                return False
+            for (key_a, spec_a), (key_b, spec_b) in zip(a.entries, b.entries):
+                if key_a != key_b:
+                    return False
+                if isinstance(spec_a, MenuGroup) and isinstance(spec_b, MenuGroup):
+                    pending.append((spec_a, spec_b))
+                elif spec_a != spec_b:
+                    return False
+        return True
+
+    def __hash__(self) -> int:
+        return self.digest
+
+    def __repr__(self) -> str:
+        return f"MenuGroup({self.label!r}, {len(self.entries)} entries)"
+
+
+class _Node:
+    __slots__ = ("items", "children")
+
+    def __init__(self):
+        self.items: List[Tuple[Hashable, Any]] = []
+        self.children: Dict[str, "_Node"] = {}
+
+    def child(self, name: str) -> "_Node":
+        node = self.children.get(name)
+        if node is None:
+            node = self.children[name] = _Node()
+            # 그룹은 첫 번째 항목이 있던 자리에 표시
+            self.items.append(((name, GROUP_KEY), node))
+        return node
+
+
+def paginate(entries: Sequence[Tuple[Hashable, Any]], cap: int,
+             more_label: str = "…") -> List[Tuple[Hashable, Any]]:
+    """cap 개를 넘으면 앞의 cap - 1 개와 나머지를 담은 "더 보기" 항목으로 나눔 (cap 0 = 제한 없음)
+
+    나머지가 cap 개를 넘으면 "더 보기" 안에 cap 개씩 "30–59" 처럼 순번 범위를 이름으로 한
+    페이지를 나란히 두므로, 항목이 아무리 많아도 "더 보기" 아래는 두 단계까지만 생긴다.
+    """
+    if cap <= 0 or len(entries) <= cap:
+        return list(entries)
+    step = max(cap, 2) - 1
+    rest = entries[step:]
+    if len(rest) <= cap:
+        pages = tuple(rest)
+    else:
+        # 페이지 키는 페이지 순번이므로 항목이 바뀌어도 페이지 위젯은 그대로 두고 내용만 갱신
+        pages = []
+        for start in range(0, len(rest), cap):
+            page = tuple(rest[start:start + cap])
+            label = _range_label(step + start + 1, step + start + len(page))
+            pages.append(((start // cap, MORE_KEY), MenuGroup(label, page)))
+        pages = tuple(pages)
+    return list(entries[:step]) + [(("", MORE_KEY), MenuGroup(more_label, pages))]
+
+
+def _range_label(first: int, last: int) -> str:
+    return f"{first}–{last}" if last > first else str(first)
+
+
+def group_entries(entries: Sequence[Tuple[Hashable, Any]], groups: Dict[Hashable, Sequence[str]],
+                  cap: int = 0, more_label: str = "…") -> List[Tuple[Hashable, Any]]:
+    """(key, spec) 목록을 groups[key] (중첩 그룹 이름) 에 따라 MenuGroup 으로 묶고 단계마다 cap 적용
+
+    그룹이 없는 항목은 그 자리에 남고, 그룹은 첫 항목의 순서 위치에 놓인다.
+    """
+    if not groups:
+        return paginate(entries, cap, more_label)
+    root = _Node()
+    for key, spec in entries:
+        node = root
+        for name in groups.get(key, ()):
+            node = node.child(name)
+        node.items.append((key, spec))
+
+    def flatten(node: _Node) -> List[Tuple[Hashable, Any]]:
+        result = []
+        for key, value in node.items:
+            if isinstance(value, _Node):
+                value = MenuGroup(key[0], tuple(flatten(value)))
+            result.append((key, value))
+        return paginate(result, cap, more_label)
+
+    return flatten(root)
+
+
+def field_groups(paths: Sequence[Dict], keys: Sequence[Hashable]) -> Dict[Hashable, List[str]]:
+    """항목의 "group" 필드로 그룹 지정 ("업무/고객" 처럼 / 로 중첩)"""
+    groups = {}
+    for key, path_item in zip(keys, paths):
+        group = path_item.get("group")
+        if isinstance(group, str):
+            names = [name.strip() for name in group.split("/") if name.strip()]
+            if names:
+                groups[key] = names
+    return groups
+
+
+def prefix_groups(paths: Sequence[Dict], keys: Sequence[Hashable],
+                  shorten: Callable[[str], str] = lambda p: p) -> Dict[Hashable, List[str]]:
+    """같은 상위 폴더에 있는 항목이 2 개 이상이면 그 폴더로 묶음 (혼자인 항목은 그대로)"""
+    parents = {}
+    for key, path_item in zip(keys, paths):
+        path = path_item.get("path", "").rstrip("/")
+        parent = os.path.dirname(path)
+        if parent and parent != path:
+            parents[key] = parent
+    counts: Dict[str, int] = {}
+    for parent in parents.values():
+        counts[parent] = counts.get(parent, 0) + 1
+    return {key: [shorten(parent)] for key, parent in parents.items() if counts[parent] > 1}
+
+
+def home_shorten(path: str) -> str:
+    """홈 폴더를 ~ 로 줄여 표시"""
+    home = os.path.expanduser("~").rstrip("/")
+    if home and (path == home or path.startswith(home + "/")):
+        return "~" + path[len(home):]
+    return path
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Tray menu model for Baro Path Quick Access Indicator
+(gi/Gtk 를 import 하지 않음)
+"""
+
+from typing import Any, Callable, Dict, Hashable, List, NamedTuple, Optional, Sequence, Tuple
+
+from menu_diff import keyed_entries
+from menu_groups import group_entries, field_groups, prefix_groups, home_shorten
+from i18n import t
+
+
+class PathItem(NamedTuple):
+    """경로 항목 (폴더 메뉴와 터미널 서브메뉴에서 공통으로 사용)"""
+    label: str
+    path: str
+    icon: Optional[str]  # 사용자 아이콘 (없으면 기본 아이콘)
+    browse: int  # 하위 폴더 메뉴 단계 수 (0 = 없음)
+    reachable: bool
+
+
+class FixedLabels(NamedTuple):
+    """고정 메뉴 항목의 (번역된) 라벨"""
+    no_paths: str
+    quick_switch: str
+    terminal: str
+    settings: str
+    refresh: str
+    diagnostics: str
+    quit: str
+
+
+class MenuModel:
+    """트레이 메뉴 전체를 나타내는 변경 불가 트리
+
+    folders / terminal 은 (key, PathItem 또는 MenuGroup) 목록이고, paths 는 그룹
+    안의 항목까지 포함한 키 -> PathItem 표이다. digest 는 만들 때 한 번 계산해 두고
+    비교할 때 다르면 바로 False 를 돌려주며, 같으면 (hash 충돌일 수 있으므로) 구조를
+    직접 비교한다 (항목 수에 비례).
+    diagnostics 는 "진단" 항목 표시 여부 (계측이 켜져 있을 때).
+    """
+
+    __slots__ = ("folders", "terminal", "paths", "labels", "diagnostics", "digest")
+
+    def __init__(self, folders: Sequence[Tuple[Hashable, Any]], terminal: Sequence[Tuple[Hashable, Any]],
+                 paths: Dict[Hashable, PathItem], labels: FixedLabels, diagnostics: bool = False):
+        self.folders = tuple(folders)
+        self.terminal = tuple(terminal)
+        self.paths = paths
+        self.labels = labels
+        self.diagnostics = diagnostics
+        self.digest = hash((self.folders, self.terminal, labels, diagnostics))
+
+    @property
+    def has_paths(self) -> bool:
+        return bool(self.paths)
+
+    def __eq__(self, other) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, MenuModel) or self.digest != other.digest:
+            return False
+        return (self.folders == other.folders and self.terminal == other.terminal
+                and self.labels == other.labels and self.diagnostics == other.diagnostics)
+
+    def __hash__(self) -> int:
+        return self.digest
+
+    def __repr__(self) -> str:
+        return f"MenuModel({len(self.paths)} paths, digest={self.digest:#x})"
+
+
+def menu_groups(settings, paths: Sequence[Dict], keys: Sequence[Hashable]) -> Dict[Hashable, List[str]]:
+    """메뉴 묶기 설정에 따른 항목별 그룹 이름"""
+    mode = settings.menu_grouping
+    if mode == "group":
+        return field_groups(paths, keys)
+    if mode == "prefix":
+        return prefix_groups(paths, keys, home_shorten)
+    return {}
+
+
+def build_model(settings, reachable: Callable[[str], bool] = lambda path: True,
+                translate: Callable[[str], str] = t, diagnostics: bool = False) -> MenuModel:
+    """설정 (정렬, 묶기, 항목 수 제한, 하위 폴더 메뉴) 과 현재 언어로 메뉴 모델 생성"""
+    paths = settings.get_sorted_paths()
+    depth = settings.browse_depth
+    entries = keyed_entries(
+        paths, lambda p: PathItem(p.get("alias", ""), p.get("path", ""), p.get("icon"),
+                                  depth if p.get("browse") else 0, reachable(p.get("path", "")))
+    )
+
+    # 그룹으로 묶고 단계마다 최대 항목 수를 넘으면 "더 보기" 로 넘김
+    groups = menu_groups(settings, paths, [key for key, _ in entries])
+    cap, more = settings.menu_item_cap, translate("menu_more")
+    terminal = [(key, PathItem(item.label, item.path, "terminal.png", 0, item.reachable))
+                for key, item in entries]
+
+    labels = FixedLabels(
+        translate("menu_no_paths"), translate("menu_quick_switch"), translate("menu_open_in_terminal"),
+        translate("menu_settings"), translate("menu_refresh"), translate("menu_diagnostics"),
+        translate("menu_quit"),
+    )
+    return MenuModel(
+        group_entries(entries, groups, cap, more), group_entries(terminal, groups, cap, more),
+        dict(entries), labels, diagnostics,
+    )
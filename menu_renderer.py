@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Gtk renderer for the Baro tray menu model
+"""
+
+from typing import Callable, Dict, Optional
+
+import gi
+gi.require_version('Gtk', '3.0')
+from gi.repository import Gtk
+
+from menu_diff import KeyedMenu, LazyMenu
+from menu_groups import MenuGroup, MORE_KEY
+from menu_model import MenuModel, PathItem
+from icon_cache import IconCache
+
+
+class MenuRenderer:
+    """MenuModel 을 Gtk.Menu 위젯에 반영하는 클래스
+
+    고정 항목이 있는 골격은 한 번만 만들고, render() 때마다 이전 모델과 비교해
+    (digest 가 다르면 바로, 같으면 구조까지) 같으면 아무것도 하지 않는다. 경로 구역은 KeyedMenu 로 바뀐 항목만
+    갱신하며, 그룹/더 보기/터미널 서브메뉴는 처음 열릴 때 위젯을 만든다.
+
+    actions: {"open_folder": fn(widget, path), "open_terminal": fn(widget, path),
+              "quick_switch"/"settings"/"refresh"/"diagnostics"/"about"/"quit": fn(widget)}
+    """
+
+    def __init__(self, icons: IconCache, actions: Dict[str, Callable]):
+        self.icons = icons
+        self.actions = actions
+        self.model: Optional[MenuModel] = None
+        self._dir_lister = None  # 하위 폴더 메뉴용 (처음 사용할 때 생성)
+        self.menu = self._create_menu()
+
+    def _create_image_item(self, label, icon_name):
+        """아이콘이 있는 메뉴 항목 생성 (아이콘은 캐시된 pixbuf 공유)"""
+        item = Gtk.ImageMenuItem()
+        item.set_label(label)
+        item.set_always_show_image(True)
+        icon = self.icons.new_image(icon_name)
+        if icon is not None:
+            item.set_image(icon)
+        return item
+
+    def _create_menu(self):
+        """고정 항목을 포함한 메뉴 골격 생성 (라벨은 첫 render() 에서 설정)"""
+        menu = Gtk.Menu()
+
+        # 경로 목록 구역 (메뉴 맨 앞, KeyedMenu 가 관리)
+        self.folder_section = KeyedMenu(
+            menu, self._create_folder_item, self._update_folder_item
+        )
+
+        # 경로가 없을 때
+        self._empty_item = Gtk.MenuItem(label="")
+        self._empty_item.set_sensitive(False)
+        menu.append(self._empty_item)
+
+        # 구분선
+        menu.append(Gtk.SeparatorMenuItem())
+
+        # 빠른 전환 (검색 창)
+        self._switch_item = Gtk.MenuItem(label="")
+        self._switch_item.connect("activate", self.actions["quick_switch"])
+        menu.append(self._switch_item)
+
+        # 터미널 서브메뉴 (처음 열릴 때 항목 생성)
+        self._term_menu_item = self._create_image_item("", "terminal.png")
+        self.terminal_section = KeyedMenu(
+            Gtk.Menu(), self._create_terminal_item, self._update_path_item
+        )
+        self.terminal_menu = LazyMenu(
+            self._term_menu_item, self.terminal_section, Gtk.MenuItem(label="…")
+        )
+        menu.append(self._term_menu_item)
+
+        # 구분선
+        self._term_separator = Gtk.SeparatorMenuItem()
+        menu.append(self._term_separator)
+
+        # 설정 메뉴
+        self._settings_item = self._create_image_item("", "settings.png")
+        self._settings_item.connect("activate", self.actions["settings"])
+        menu.append(self._settings_item)
+
+        # 새로고침 메뉴
+        self._refresh_item = self._create_image_item("", "refresh.png")
+        self._refresh_item.connect("activate", self.actions["refresh"])
+        menu.append(self._refresh_item)
+
+        # 진단 메뉴 (계측이 켜져 있을 때만 표시)
+        self._diagnostics_item = Gtk.MenuItem(label="")
+        self._diagnostics_item.connect("activate", self.actions["diagnostics"])
+        menu.append(self._diagnostics_item)
+
+        # 정보 메뉴 (About)
+        # 아이콘은 appicon 사용 (작게)
+        about_item = self._create_image_item("About Baro", "appicon.png")
+        about_item.connect("activate", self.actions["about"])
+        menu.append(about_item)
+
+        # 구분선
+        menu.append(Gtk.SeparatorMenuItem())
+
+        # 종료 메뉴
+        self._quit_item = self._create_image_item("", "quit.png")
+        self._quit_item.connect("activate", self.actions["quit"])
+        menu.append(self._quit_item)
+
+        menu.show_all()
+        self._diagnostics_item.hide()
+        return menu
+
+    def destroy(self):
+        """메뉴와 모든 하위 위젯 해제 (렌더러를 다시 만들 때)"""
+        self.folder_section = self.terminal_section = self.terminal_menu = None
+        self.model = None
+        self.menu.destroy()
+
+    def render(self, model: MenuModel) -> bool:
+        """모델을 위젯에 반영 (이전 모델과 같으면 False)"""
+        if model == self.model:
+            return False
+        self.model = model
+
+        self.folder_section.sync(model.folders)
+        self.terminal_menu.set_entries(model.terminal)
+
+        has_paths = model.has_paths
+        self._empty_item.set_visible(not has_paths)
+        self._term_menu_item.set_visible(has_paths)
+        self._term_separator.set_visible(has_paths)
+        self._diagnostics_item.set_visible(model.diagnostics)
+
+        # 언어가 바뀌었을 수 있으므로 고정 항목 라벨 갱신
+        labels = model.labels
+        self._set_label(self._empty_item, labels.no_paths)
+        self._set_label(self._switch_item, labels.quick_switch)
+        self._set_label(self._term_menu_item, labels.terminal)
+        self._set_label(self._settings_item, labels.settings)
+        self._set_label(self._refresh_item, labels.refresh)
+        self._set_label(self._diagnostics_item, labels.diagnostics)
+        self._set_label(self._quit_item, labels.quit)
+        return True
+
+    def _create_group_item(self, key, spec: MenuGroup, create_item, update_item):
+        """그룹/더 보기 서브메뉴 항목 생성 (하위 항목은 서브메뉴가 처음 열릴 때 생성)"""
+        if key[1] == MORE_KEY:
+            item = Gtk.MenuItem(label=spec.label)
+        else:
+            item = self._create_image_item(spec.label, "folder.png")
+        section = KeyedMenu(Gtk.Menu(), create_item, update_item)
+        item.lazy_menu = LazyMenu(item, section, Gtk.MenuItem(label="…"))
+        item.lazy_menu.set_entries(spec.entries)
+        item.show()
+        return item
+
+    def _update_group_item(self, item, spec: MenuGroup, old_spec: MenuGroup):
+        """그룹 라벨 갱신, 하위 항목은 다음에 열릴 때 반영"""
+        self._set_label(item, spec.label)
+        if spec.entries != old_spec.entries:
+            item.lazy_menu.set_entries(spec.entries)
+
+    def _create_folder_item(self, key, spec):
+        """경로 항목 생성: 별칭 (클릭 시 파일 브라우저 열기)"""
+        if isinstance(spec, MenuGroup):
+            return self._create_group_item(key, spec, self._create_folder_item, self._update_folder_item)
+        item = self._create_image_item(spec.label, spec.icon or "folder.png")
+        item.set_sensitive(spec.reachable)
+        item.connect("activate", self._on_folder_item_activate, key)
+        item.browse_menu = None
+        if spec.browse:
+            self._attach_browse_menu(item, spec)
+        item.show()
+        return item
+
+    def _attach_browse_menu(self, item, spec: PathItem):
+        """하위 폴더 서브메뉴 연결/제거 (spec.browse = 표시할 단계 수, 0 이면 제거)"""
+        from browse_menu import BrowseMenu
+        old_menu = item.get_submenu()
+        if spec.browse:
+            if self._dir_lister is None:
+                from dir_lister import DirLister
+                self._dir_lister = DirLister()
+            item.browse_menu = BrowseMenu(
+                item, spec.path, spec.browse, self._dir_lister,
+                lambda path: self.actions["open_folder"](None, path), self._create_image_item
+            )
+        else:
+            item.set_submenu(None)
+            item.browse_menu = None
+        if old_menu is not None:
+            old_menu.destroy()
+
+    def _create_terminal_item(self, key, spec):
+        """터미널 서브메뉴 항목 생성"""
+        if isinstance(spec, MenuGroup):
+            return self._create_group_item(key, spec, self._create_terminal_item, self._update_path_item)
+        item = self._create_image_item(spec.label, spec.icon)
+        item.set_sensitive(spec.reachable)
+        item.connect("activate", self._on_terminal_item_activate, key)
+        item.show()
+        return item
+
+    def _update_path_item(self, item, spec, old_spec):
+        """기존 경로 항목의 라벨 및 접근 가능 상태 갱신 (경로는 활성화 시점에 조회)"""
+        if isinstance(spec, MenuGroup):
+            self._update_group_item(item, spec, old_spec)
+            return
+        self._set_label(item, spec.label)
+        if spec.reachable != old_spec.reachable:
+            item.set_sensitive(spec.reachable)
+
+    def _update_folder_item(self, item, spec, old_spec):
+        """기존 폴더 항목의 라벨, 사용자 아이콘, 하위 폴더 메뉴 및 접근 가능 상태 갱신"""
+        self._update_path_item(item, spec, old_spec)
+        if isinstance(spec, MenuGroup):
+            return
+        if spec.icon != old_spec.icon:
+            self._replace_image(item, spec.icon or "folder.png")
+        if spec.browse != old_spec.browse:
+            self._attach_browse_menu(item, spec)
+        elif spec.browse and spec.path != old_spec.path:
+            item.browse_menu.set_path(spec.path)
+
+    def _replace_image(self, item, icon_name):
+        """항목 아이콘 교체 (이전 Gtk.Image 는 바로 해제)"""
+        old_image = item.get_image()
+        item.set_image(self.icons.new_image(icon_name))
+        if old_image is not None:
+            old_image.destroy()
+
+    @staticmethod
+    def _set_label(item, label):
+        """라벨이 바뀐 경우에만 설정 (불필요한 dbusmenu 갱신 방지)"""
+        if item.get_label() != label:
+            item.set_label(label)
+
+    def _on_folder_item_activate(self, widget, key):
+        spec = self.model.paths.get(key) if self.model is not None else None
+        # 하위 폴더 메뉴가 있는 항목은 서브메뉴가 열릴 때도 activate 되므로 "이 폴더 열기" 로만 연다
+        if spec and not spec.browse:
+            self.actions["open_folder"](widget, spec.path)
+
+    def _on_terminal_item_activate(self, widget, key):
+        spec = self.model.paths.get(key) if self.model is not None else None
+        if spec:
+            self.actions["open_terminal"](widget, spec.path)
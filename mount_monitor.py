@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Mount table (GVFS and removable media) for Baro Path Quick Access Indicator
+"""
+
+import os
+from typing import Callable, Dict, List, Optional, Set
+
+from gi.repository import Gio
+
+from launchers import is_gvfs_path
+
+
+def gvfs_mount_root(path: str) -> str:
+    """GVFS 경로의 마운트 루트 (/run/user/<uid>/gvfs/<마운트 이름>)"""
+    head, sep, rest = path.partition("/gvfs/")
+    return head + sep + rest.split("/", 1)[0]
+
+
+class MountTable:
+    """Gio.VolumeMonitor 의 mount-added / mount-removed 이벤트로 현재 마운트 목록을 유지하는 클래스
+
+    북마크가 지금 접근 가능한지를 파일 시스템에 접근하지 않고 이 표만으로 답하므로
+    응답 없는 네트워크 마운트에서도 멈추지 않는다. 마운트가 생기거나 사라지면
+    on_change(바뀐 마운트 루트 집합) 으로 알린다.
+    """
+
+    ROOT_CACHE_SIZE = 8192  # 넘으면 경로 -> 루트 캐시를 비움
+
+    def __init__(self, on_change: Callable[[Set[str]], None]):
+        self.on_change = on_change
+        self._monitor = None
+        self._handlers: List[int] = []
+        self._mounts: Dict[str, str] = {}  # 마운트 루트 -> 이름
+        self._seen: Set[str] = set()  # 한 번이라도 마운트되었던 루트 (해제되면 접근 불가로 판단)
+        self._roots: Dict[str, Optional[str]] = {}  # 경로 -> 마운트 루트 (캐시)
+
+    def start(self):
+        """현재 마운트 목록을 읽고 이벤트 구독 시작"""
+        self.stop()
+        self._monitor = Gio.VolumeMonitor.get()
+        for mount in self._monitor.get_mounts():
+            self._add(mount)
+        self._handlers = [
+            self._monitor.connect("mount-added", self._on_mount_added),
+            self._monitor.connect("mount-removed", self._on_mount_removed),
+        ]
+
+    def stop(self):
+        """이벤트 구독 중지"""
+        if self._monitor is not None:
+            for handler in self._handlers:
+                self._monitor.disconnect(handler)
+            self._handlers = []
+            self._monitor = None
+
+    @property
+    def mounts(self) -> Dict[str, str]:
+        """현재 마운트 (루트 -> 이름)"""
+        return dict(self._mounts)
+
+    def mount_root(self, path: str) -> Optional[str]:
+        """경로가 속한 마운트 루트 (GVFS 이거나 이번 실행 중 본 마운트 아래가 아니면 None)"""
+        try:
+            return self._roots[path]
+        except KeyError:
+            pass
+        if is_gvfs_path(path):
+            root = gvfs_mount_root(path)
+        else:
+            root = None
+            current = os.path.normpath(path) if path else ""
+            while current:
+                if current in self._seen:
+                    root = current
+                    break
+                parent = os.path.dirname(current)
+                if parent == current:
+                    break
+                current = parent
+        if len(self._roots) >= self.ROOT_CACHE_SIZE:
+            self._roots.clear()
+        self._roots[path] = root
+        return root
+
+    def reachability(self, path: str) -> Optional[bool]:
+        """마운트 표로 판단한 접근 가능 여부 (마운트와 관계없는 경로는 None)"""
+        root = self.mount_root(path)
+        if root is None:
+            return None
+        return root in self._mounts
+
+    @staticmethod
+    def _root_path(mount) -> Optional[str]:
+        """마운트의 로컬 루트 경로 (GVFS 는 gvfsd-fuse 경로, 없으면 None)"""
+        root = mount.get_root()
+        path = root.get_path() if root is not None else None
+        if not path:
+            return None
+        path = os.path.normpath(path)
+        return path if path != "/" else None
+
+    def _add(self, mount) -> Optional[str]:
+        root = self._root_path(mount)
+        if root is None:
+            return None
+        self._mounts[root] = mount.get_name()
+        if root not in self._seen:
+            # 새 마운트 루트 아래의 경로는 다시 판단해야 하므로 캐시 비움
+            self._seen.add(root)
+            self._roots.clear()
+        return root
+
+    def _on_mount_added(self, monitor, mount):
+        root = self._add(mount)
+        if root is not None:
+            self.on_change({root})
+
+    def _on_mount_removed(self, monitor, mount):
+        root = self._root_path(mount)
+        if root is not None and self._mounts.pop(root, None) is not None:
+            self.on_change({root})
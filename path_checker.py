@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Non-blocking path existence checks for Baro Path Quick Access Indicator
+"""
+
+import os
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from gi.repository import GLib
+
+from worker_pool import WorkerPool
+
+# 결과: True(존재), False(없음), None(시간 초과 - 응답 없는 마운트)
+CheckCallback = Callable[[str, Optional[bool]], None]
+
+
+class PathChecker:
+    """경로 존재 여부를 작업 스레드에서 확인하고 결과를 메인 루프로 전달하는 클래스
+
+    NFS/SSHFS 등 응답 없는 마운트에서 os.stat 이 오래 멈추더라도 GTK 메인
+    루프는 막히지 않는다. 결과는 cache_ttl 초 동안 캐시되어 같은 경로를
+    반복해서 눌러도 즉시 응답한다. 시간 초과된 stat 의 스레드는 포기하고 새
+    스레드로 대신하므로 (최대 max_abandoned 개) 멈춘 경로가 다른 경로의 확인을 막지 않는다.
+    """
+
+    def __init__(self, timeout: float = 2.0, cache_ttl: float = 10.0, workers: int = 4,
+                 max_abandoned: int = 8, name: str = "baro-stat"):
+        self.timeout = timeout
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[str, Tuple[Optional[bool], float]] = {}
+        self._waiters: Dict[str, List[CheckCallback]] = {}
+        self._timeouts: Dict[str, int] = {}  # 경로별 시간 초과 타이머 source id
+        self._pool = WorkerPool(name, self._stat, self._resolve, workers, max_abandoned)
+
+    def cached(self, path: str) -> Tuple[bool, Optional[bool]]:
+        """캐시된 결과 반환: (캐시 유효 여부, 결과)"""
+        entry = self._cache.get(path)
+        if entry is not None and time.monotonic() - entry[1] < self.cache_ttl:
+            return True, entry[0]
+        return False, None
+
+    def invalidate(self, path: Optional[str] = None):
+        """캐시 무효화 (path 지정 시 해당 경로만)"""
+        if path is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(path, None)
+
+    def pending(self, path: str) -> bool:
+        """path 의 stat 이 아직 끝나지 않았는지 (시간 초과로 포기한 경우 포함)"""
+        return self._pool.pending(path)
+
+    @property
+    def free_workers(self) -> int:
+        """바로 stat 을 시작할 수 있는 작업 스레드 수"""
+        return self._pool.free
+
+    def check(self, path: str, callback: CheckCallback):
+        """경로 확인 요청 (callback 은 항상 메인 루프에서 호출)"""
+        hit, result = self.cached(path)
+        if hit:
+            callback(path, result)
+            return
+
+        if path in self._waiters:
+            # 이미 확인 중이면 결과를 함께 기다림
+            self._waiters[path].append(callback)
+            return
+        self._waiters[path] = [callback]
+
+        # 아직 stat 중이면 (시간 초과 후에도) 그 결과를 기다림
+        self._pool.put(path)
+        self._timeouts[path] = GLib.timeout_add(int(self.timeout * 1000), self._on_timeout, path)
+
+    def _stat(self, path) -> bool:
+        try:
+            return os.path.exists(path)
+        except Exception:
+            return False
+
+    def _on_timeout(self, path):
+        self._timeouts.pop(path, None)
+        # 멈춘 stat 의 스레드는 돌아오지 않을 수 있으므로 새 스레드로 대신
+        self._pool.abandon(path)
+        self._resolve(path, None)
+        return False
+
+    def _resolve(self, path, result):
+        """결과를 캐시하고 대기 중인 콜백 호출
+
+        시간 초과 후 늦게 도착한 실제 결과는 캐시만 갱신한다.
+        """
+        if result is None and path not in self._waiters:
+            return False
+        source = self._timeouts.pop(path, None)
+        if source is not None:
+            GLib.source_remove(source)
+        self._cache[path] = (result, time.monotonic())
+        for callback in self._waiters.pop(path, []):
+            callback(path, result)
+        return False
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Built-in timing instrumentation for Baro Path Quick Access Indicator
+
+BARO_PROFILE=1 (또는 설정의 "profiling": true) 이면 주요 경로의 소요 시간을 기록하고,
+BARO_PROFILE=cprofile 이면 cProfile 도 함께 실행한다. 꺼져 있으면 시간을 재지 않는다.
+"""
+
+import functools
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Dict, List, Optional
+
+ENV_VAR = "BARO_PROFILE"
+
+
+class _Span:
+    """with 블록의 소요 시간을 기록"""
+
+    __slots__ = ("_profiler", "_name", "_start")
+
+    def __init__(self, profiler: "Profiler", name: str):
+        self._profiler = profiler
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._profiler.record(self._name, (time.perf_counter() - self._start) * 1000)
+        return False
+
+
+class _NullSpan:
+    """계측이 꺼져 있을 때 사용 (아무것도 하지 않음)"""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Profiler:
+    """이름별 소요 시간 (ms) 을 최근 history 개씩 링 버퍼에 보관하는 계측기
+
+    record() 는 작업 스레드 (설정 저장 등) 에서도 호출되므로 잠금으로 보호한다.
+    """
+
+    def __init__(self, history: int = 256):
+        self.enabled = False
+        self.history = history
+        self._samples: Dict[str, "deque[float]"] = {}
+        self._lock = threading.Lock()
+        self._cprofile = None
+
+    @property
+    def cprofile_running(self) -> bool:
+        return self._cprofile is not None
+
+    def configure(self, enabled: bool, cprofile: bool = False):
+        """계측 켜기/끄기 (cprofile=True 면 cProfile 도 실행)"""
+        self.enabled = enabled or cprofile
+        if cprofile and self._cprofile is None:
+            import cProfile
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+        elif not cprofile and self._cprofile is not None:
+            self._cprofile.disable()
+            self._cprofile = None
+
+    def configure_from_env(self, setting: bool = False):
+        """BARO_PROFILE 환경 변수 (1/cprofile) 와 설정 값으로 켜기/끄기 (환경 변수 우선)"""
+        value = os.environ.get(ENV_VAR, "").strip().lower()
+        if value in ("", "0", "false", "no", "off"):
+            self.configure(setting)
+        else:
+            self.configure(True, cprofile=value == "cprofile")
+
+    def span(self, name: str):
+        """with PROFILER.span("이름"): ... 형태로 구간 시간 기록"""
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name)
+
+    def record(self, name: str, ms: float):
+        """측정값 (ms) 추가"""
+        if not self.enabled:
+            return
+        with self._lock:
+            samples = self._samples.get(name)
+            if samples is None:
+                samples = self._samples[name] = deque(maxlen=self.history)
+            samples.append(ms)
+
+    def reset(self):
+        with self._lock:
+            self._samples.clear()
+
+    def stats(self, name: str) -> Dict[str, float]:
+        """측정값 통계 (ms): count, last, mean, p50, p95, p99, max"""
+        with self._lock:
+            values = list(self._samples.get(name, ()))
+        if not values:
+            return {"count": 0}
+        ordered = sorted(values)
+        last = len(ordered) - 1
+        return {
+            "count": len(values),
+            "last": values[-1],
+            "mean": sum(values) / len(values),
+            "p50": ordered[last // 2],
+            "p95": ordered[min(last, int(len(ordered) * 0.95))],
+            "p99": ordered[min(last, int(len(ordered) * 0.99))],
+            "max": ordered[-1],
+        }
+
+    def names(self) -> List[str]:
+        with self._lock:
+            return sorted(self._samples)
+
+    def summary(self) -> List[str]:
+        """이름별 통계 표 (한 줄씩)"""
+        lines = [f"{'':<20} {'n':>5} {'last':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8}"]
+        for name in self.names():
+            s = self.stats(name)
+            lines.append(f"{name:<20} {s['count']:>5} {s['last']:>8.2f} {s['p50']:>8.2f} "
+                         f"{s['p95']:>8.2f} {s['p99']:>8.2f} {s['max']:>8.2f}")
+        return lines
+
+    def dump(self, path: Path) -> Optional[Path]:
+        """cProfile 결과를 pstats 파일로 저장 (실행 중이 아니면 None)
+
+        python3 -m pstats <파일> 로 확인할 수 있다.
+        """
+        if self._cprofile is None:
+            return None
+        try:
+            self._cprofile.dump_stats(str(path))
+        except OSError as e:
+            print(f"프로파일 저장 오류: {e}")
+            return None
+        return path
+
+
+PROFILER = Profiler()
+PROFILER.configure_from_env()
+
+
+def timed(name: str):
+    """함수 소요 시간을 name 으로 기록하는 데코레이터 (꺼져 있으면 바로 호출)"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                PROFILER.record(name, (time.perf_counter() - start) * 1000)
+        return wrapper
+    return decorator
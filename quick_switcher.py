@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Quick switcher window for Baro Path Quick Access Indicator
+"""
+
+from typing import Callable
+
+import gi
+gi.require_version('Gtk', '3.0')
+from gi.repository import Gtk, Gdk, Pango
+
+from search_index import SearchIndex
+from i18n import t, add_language_listener, remove_language_listener
+
+
+class QuickSwitcher(Gtk.Window):
+    """입력하는 대로 별칭/경로를 찾아 여는 창
+
+    Enter: 파일 관리자로 열기, Ctrl+Enter: 터미널로 열기, Esc/포커스 잃음: 닫기 (숨김)
+    창은 한 번만 만들고 popup() 으로 다시 보여준다.
+    """
+
+    MAX_RESULTS = 50
+
+    def __init__(self, index: SearchIndex, on_activate: Callable[[str, bool], None]):
+        super().__init__(title=t("switcher_title"))
+        self.index = index
+        self.on_activate = on_activate
+
+        self.set_default_size(520, 360)
+        self.set_position(Gtk.WindowPosition.CENTER)
+        self.set_type_hint(Gdk.WindowTypeHint.DIALOG)
+        self.set_keep_above(True)
+        self.set_skip_taskbar_hint(True)
+
+        box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
+        box.set_margin_start(10)
+        box.set_margin_end(10)
+        box.set_margin_top(10)
+        box.set_margin_bottom(10)
+        self.add(box)
+
+        # 검색 입력 (search-changed 는 GTK 가 입력을 잠시 모아서 보냄)
+        self.entry = Gtk.SearchEntry()
+        self.entry.set_placeholder_text(t("switcher_placeholder"))
+        self.entry.connect("search-changed", self._on_search_changed)
+        self.entry.connect("activate", lambda w: self._activate_selected(False))
+        box.pack_start(self.entry, False, False, 0)
+
+        # 결과 목록: 별칭, 경로
+        self.store = Gtk.ListStore(str, str)
+        self.treeview = Gtk.TreeView(model=self.store)
+        self.treeview.set_headers_visible(False)
+        self.treeview.set_enable_search(False)
+        self.treeview.connect("row-activated", lambda w, path, col: self._activate_selected(False))
+        for i, weight in ((0, 700), (1, 400)):
+            renderer = Gtk.CellRendererText(weight=weight)
+            if i == 1:
+                renderer.set_property("ellipsize", Pango.EllipsizeMode.START)
+            self.treeview.append_column(Gtk.TreeViewColumn("", renderer, text=i))
+
+        scrolled = Gtk.ScrolledWindow()
+        scrolled.set_policy(Gtk.PolicyType.NEVER, Gtk.PolicyType.AUTOMATIC)
+        scrolled.add(self.treeview)
+        box.pack_start(scrolled, True, True, 0)
+
+        self.hint = Gtk.Label(label=t("switcher_hint"))
+        self.hint.get_style_context().add_class("dim-label")
+        box.pack_start(self.hint, False, False, 0)
+
+        self.connect("key-press-event", self._on_key_press)
+        self.connect("focus-out-event", lambda w, e: self.hide())
+        self.connect("delete-event", lambda w, e: w.hide() or True)
+
+        # 언어가 바뀌면 라벨만 다시 씀
+        add_language_listener(self._relabel)
+        self.connect("destroy", lambda w: remove_language_listener(self._relabel))
+
+    def _relabel(self, language: str):
+        self.set_title(t("switcher_title"))
+        self.entry.set_placeholder_text(t("switcher_placeholder"))
+        self.hint.set_label(t("switcher_hint"))
+
+    def popup(self):
+        """입력을 비우고 창 표시"""
+        self.entry.set_text("")
+        self.refresh()
+        self.show_all()
+        self.present()
+        self.entry.grab_focus()
+
+    def refresh(self):
+        """현재 검색어로 결과 목록 다시 채우기"""
+        self.store.clear()
+        for entry in self.index.search(self.entry.get_text(), self.MAX_RESULTS):
+            self.store.append([entry.get("alias", ""), entry.get("path", "")])
+        if len(self.store):
+            self.treeview.set_cursor(Gtk.TreePath.new_first(), None, False)
+
+    def _on_search_changed(self, entry):
+        self.refresh()
+
+    def _move_selection(self, step: int):
+        count = len(self.store)
+        if not count:
+            return
+        path, _ = self.treeview.get_cursor()
+        row = path.get_indices()[0] if path is not None else -1
+        row = max(0, min(count - 1, row + step))
+        self.treeview.set_cursor(Gtk.TreePath.new_from_indices([row]), None, False)
+
+    def _on_key_press(self, widget, event):
+        key = event.keyval
+        if key == Gdk.KEY_Escape:
+            self.hide()
+            return True
+        if key in (Gdk.KEY_Down, Gdk.KEY_Up):
+            self._move_selection(1 if key == Gdk.KEY_Down else -1)
+            return True
+        if key in (Gdk.KEY_Return, Gdk.KEY_KP_Enter) and event.state & Gdk.ModifierType.CONTROL_MASK:
+            self._activate_selected(True)
+            return True
+        return False
+
+    def _activate_selected(self, terminal: bool):
+        """선택된 항목 열기 (선택이 없으면 첫 번째 결과)"""
+        path, _ = self.treeview.get_cursor()
+        if path is None:
+            if not len(self.store):
+                return
+            path = Gtk.TreePath.new_first()
+        alias = self.store[path][0]
+        self.hide()
+        self.on_activate(alias, terminal)
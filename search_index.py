@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+In-memory bookmark search index for Baro Path Quick Access Indicator
+(gi/Gtk 를 import 하지 않음)
+"""
+
+import heapq
+import re
+from bisect import bisect_left, insort
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# 단어 구분자: 공백, 경로 구분자, 밑줄, 하이픈, 점
+_WORD_SPLIT = re.compile(r"[\s/\\_.\-]+")
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class SearchIndex:
+    """별칭/경로를 입력하는 대로 찾기 위한 색인
+
+    - 별칭 정렬 목록: 별칭이 검색어로 시작하는 항목을 이분 탐색으로 바로 찾음
+    - 단어 접두어 색인: 단어를 정렬된 목록으로 보관 (1~2 글자 검색)
+    - 3-gram 색인: 3 글자 이상 검색어는 3-gram 집합의 교집합으로 후보를 좁힌 뒤 확인
+    단어/3-gram 색인은 별칭용과 전체 (별칭 + 경로) 용을 따로 두어, 대부분의 항목에
+    맞는 검색어 (예: "/home") 도 별칭 순서대로 limit 개만 확인하고 멈출 수 있게 한다.
+    항목은 별칭으로 식별하며 (중복 별칭은 첫 번째만), add/remove 로 증분 갱신한다.
+    """
+
+    # 경로에만 맞는 후보가 이보다 많으면 집합 대신 별칭 순서대로 훑으며 limit 개에서 멈춤
+    DENSE_RATIO = 0.05
+
+    def __init__(self, entries: Iterable[Dict] = ()):
+        self.reset(entries)
+
+    def reset(self, entries: Iterable[Dict]):
+        """색인 전체 재구성 (정렬 목록은 마지막에 한 번만 정렬)"""
+        self._docs: Dict[int, _Doc] = {}
+        self._ids: Dict[str, int] = {}
+        self._aliases: List[Tuple[str, int]] = []
+        self._words: List[Tuple[str, int]] = []
+        self._alias_words: List[Tuple[str, int]] = []
+        self._grams: Dict[str, Set[int]] = {}
+        self._alias_grams: Dict[str, Set[int]] = {}
+        self._next_id = 0
+        for entry in entries:
+            if entry.get("alias", "") not in self._ids:
+                self._insert(entry, bulk=True)
+        self._aliases.sort()
+        self._words.sort()
+        self._alias_words.sort()
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def __contains__(self, alias: str) -> bool:
+        return alias in self._ids
+
+    # 변경
+    def add(self, entry: Dict):
+        """항목 추가 (같은 별칭이 있으면 교체)"""
+        self.remove(entry.get("alias", ""))
+        self._insert(entry, bulk=False)
+
+    def _insert(self, entry: Dict, bulk: bool):
+        alias = entry.get("alias", "")
+        doc = self._next_id
+        self._next_id += 1
+        info = _Doc(entry)
+        self._docs[doc] = info
+        self._ids[alias] = doc
+        add = list.append if bulk else insort
+        add(self._aliases, (info.alias, doc))
+        for word in info.words:
+            add(self._words, (word, doc))
+        for word in info.alias_words:
+            add(self._alias_words, (word, doc))
+        for gram in _trigrams(info.text):
+            self._grams.setdefault(gram, set()).add(doc)
+        for gram in _trigrams(info.alias):
+            self._alias_grams.setdefault(gram, set()).add(doc)
+
+    def remove(self, alias: str) -> bool:
+        """별칭으로 항목 삭제"""
+        doc = self._ids.pop(alias, None)
+        if doc is None:
+            return False
+        info = self._docs.pop(doc)
+        _discard(self._aliases, (info.alias, doc))
+        for word in info.words:
+            _discard(self._words, (word, doc))
+        for word in info.alias_words:
+            _discard(self._alias_words, (word, doc))
+        for grams, text in ((self._grams, info.text), (self._alias_grams, info.alias)):
+            for gram in _trigrams(text):
+                docs = grams[gram]
+                docs.discard(doc)
+                if not docs:
+                    del grams[gram]
+        return True
+
+    def sync(self, changes, settings):
+        """SettingsManager 의 ChangeSet 반영 (바뀐 별칭만 다시 색인)"""
+        if changes.replaced:
+            self.reset(settings.paths)
+            return
+        for alias in changes.removed:
+            self.remove(alias)
+        for alias in changes.added | changes.updated:
+            entry = settings.get_path(alias)
+            if entry is None:
+                self.remove(alias)
+            else:
+                self.add(entry)
+
+    # 검색
+    @staticmethod
+    def _prefix_range(words: List[Tuple[str, int]], term: str) -> Tuple[int, int]:
+        """term 으로 시작하는 단어의 정렬 목록 범위"""
+        return bisect_left(words, (term, -1)), bisect_left(words, (term + "\U0010ffff", -1))
+
+    def _term_docs(self, term: str, words, grams) -> Set[int]:
+        """검색어 하나에 맞는 항목 (짧으면 단어 접두어, 3 글자 이상은 부분 문자열)"""
+        if len(term) < 3:
+            lo, hi = self._prefix_range(words, term)
+            return {doc for _, doc in words[lo:hi]}
+        candidates: Optional[Set[int]] = None
+        for gram in sorted(_trigrams(term), key=lambda g: len(grams.get(g, ()))):
+            docs = grams.get(gram)
+            if not docs:
+                return set()
+            candidates = set(docs) if candidates is None else candidates & docs
+            if not candidates:
+                return set()
+        return candidates
+
+    def _estimate(self, term: str, words, grams, prefix: bool = False) -> int:
+        """term 에 맞는 항목 수의 상한 (색인 크기만 보고 계산)"""
+        if prefix or len(term) < 3:
+            lo, hi = self._prefix_range(words, term)
+            return hi - lo
+        return min(len(grams.get(g, ())) for g in _trigrams(term))
+
+    def _candidates(self, term: str, words, grams, prefix: bool = False) -> Set[int]:
+        if prefix:
+            lo, hi = self._prefix_range(words, term)
+            return {doc for _, doc in words[lo:hi]}
+        return self._term_docs(term, words, grams)
+
+    def _take(self, need: int, term: str, words, grams, predicate, prefix: bool = False) -> List[int]:
+        """predicate 를 만족하는 항목을 별칭 이름순으로 need 개까지
+
+        후보가 많으면 (검색어가 대부분의 항목에 맞으면) 별칭 정렬 목록을 앞에서부터
+        확인하다 need 개에서 멈춘다. 후보 수만큼 확인해도 다 채우지 못하면 (다른
+        검색어 때문에 드문 경우) 후보 집합에서 가장 앞선 need 개를 고른다.
+        """
+        docs = self._docs
+        estimate = self._estimate(term, words, grams, prefix)
+        if estimate > self.DENSE_RATIO * len(docs):
+            found = []
+            for checked, (_, doc) in enumerate(self._aliases):
+                if checked > estimate:
+                    break
+                if predicate(doc):
+                    found.append(doc)
+                    if len(found) == need:
+                        return found
+            else:
+                return found
+        return heapq.nsmallest(
+            need, (d for d in self._candidates(term, words, grams, prefix) if predicate(d)),
+            key=lambda d: docs[d].alias
+        )
+
+    def search(self, query: str, limit: int = 50) -> List[Dict]:
+        """검색어의 모든 단어가 별칭 또는 경로에 맞는 항목 (관련도 순, 최대 limit 개)
+
+        순위: 별칭이 검색어로 시작 > 별칭 단어가 검색어로 시작 > 별칭에 포함 > 경로에만 포함
+        (첫 검색어 기준, 같은 순위는 별칭 이름순). 앞 순위에서 limit 을 채우면 멈춘다.
+        """
+        terms = query.lower().split()
+        docs = self._docs
+        if not terms:
+            return [docs[d].entry for _, d in self._aliases[:limit]]
+        first, rest = terms[0], terms[1:]
+
+        def accept(doc):
+            if not rest:
+                return True
+            info = docs[doc]
+            return all(info.matches(t) for t in rest)
+
+        def rank(doc):
+            return docs[doc].alias_rank(first), docs[doc].alias
+
+        # 뒤쪽 검색어가 훨씬 적은 항목에 맞으면 그 색인으로 후보를 좁혀 한 번에 정렬
+        if rest:
+            narrow = min(rest, key=lambda t: self._estimate(t, self._words, self._grams))
+            if (self._estimate(narrow, self._words, self._grams)
+                    < self._estimate(first, self._words, self._grams) // 4):
+                candidates = self._term_docs(narrow, self._words, self._grams)
+                matched = (d for d in candidates if docs[d].matches(first) and accept(d))
+                return [docs[d].entry for d in heapq.nsmallest(limit, matched, key=rank)]
+
+        # 0 순위: 별칭 정렬 목록에서 바로
+        found: List[int] = []
+        aliases = self._aliases
+        i = bisect_left(aliases, (first, -1))
+        while i < len(aliases) and aliases[i][0].startswith(first) and len(found) < limit:
+            if accept(aliases[i][1]):
+                found.append(aliases[i][1])
+            i += 1
+
+        # 1~3 순위: 순위마다 해당 색인에서 별칭 이름순으로
+        # (1: 별칭 단어 접두어, 2: 별칭 부분 문자열, 3: 경로에만 포함)
+        levels = ((1, self._alias_words, self._alias_grams, True),
+                  (2, self._alias_words, self._alias_grams, False),
+                  (3, self._words, self._grams, False))
+        for level, words, grams, prefix in levels:
+            if len(found) == limit:
+                break
+            if level == 2 and len(first) < 3:
+                continue
+            found.extend(self._take(
+                limit - len(found), first, words, grams,
+                lambda d, level=level: (docs[d].alias_rank(first) == level
+                                        and docs[d].matches(first) and accept(d)),
+                prefix
+            ))
+        return [docs[d].entry for d in found]
+
+
+class _Doc:
+    """색인된 항목 하나 (검색용 소문자 문자열과 단어)"""
+
+    __slots__ = ("entry", "alias", "text", "words", "alias_words", "_word_text", "_alias_word_text")
+
+    def __init__(self, entry: Dict):
+        self.entry = entry
+        self.alias = entry.get("alias", "").lower()
+        self.text = f"{self.alias}\n{entry.get('path', '').lower()}"
+        self.alias_words = {w for w in _WORD_SPLIT.split(self.alias) if w}
+        self.words = {w for w in _WORD_SPLIT.split(self.text) if w}
+        # 단어 접두어 비교를 부분 문자열 검색 한 번으로 하기 위한 "\n단어\n단어..." 문자열
+        self._word_text = "\n" + "\n".join(self.words)
+        self._alias_word_text = "\n" + "\n".join(self.alias_words)
+
+    def matches(self, term: str) -> bool:
+        """3 글자 이상은 부분 문자열, 그보다 짧으면 단어 접두어로 비교"""
+        if len(term) >= 3:
+            return term in self.text
+        return "\n" + term in self._word_text
+
+    def alias_rank(self, term: str) -> int:
+        """0: 별칭이 term 으로 시작, 1: 별칭 단어가 term 으로 시작, 2: 별칭에 포함, 3: 그 외"""
+        if self.alias.startswith(term):
+            return 0
+        if "\n" + term in self._alias_word_text:
+            return 1
+        if len(term) >= 3 and term in self.alias:
+            return 2
+        return 3
+
+
+def _discard(items: List[Tuple[str, int]], item: Tuple[str, int]):
+    """정렬 목록에서 항목 제거"""
+    i = bisect_left(items, item)
+    if i < len(items) and items[i] == item:
+        del items[i]
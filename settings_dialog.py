@@ -11,14 +11,14 @@ import gi
 gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk, Gdk, GdkPixbuf
 
-from settings_manager import SettingsManager
+from settings_manager import SettingsManager, SettingsValidationError
 from i18n import t, set_language, get_language, get_languages
 
 
 class PathEditDialog(Gtk.Dialog):
     """경로 추가/수정 다이얼로그"""
     
-    def __init__(self, parent, is_edit=False, alias="", path=""):
+    def __init__(self, parent, is_edit=False, alias="", path="", group="", browse=False):
         title = t("path_edit_title") if is_edit else t("path_add_title")
         super().__init__(title=title, transient_for=parent, modal=True)
         self.add_buttons(
@@ -62,6 +62,23 @@ class PathEditDialog(Gtk.Dialog):
         path_box.pack_start(browse_btn, False, False, 0)
         content.pack_start(path_box, False, False, 0)
         
+        # 그룹 입력 (메뉴 묶기가 "그룹별" 일 때 사용, "업무/고객" 처럼 / 로 중첩)
+        group_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        group_label = Gtk.Label(label=t("path_group"))
+        group_label.set_xalign(0)
+        group_label.set_width_chars(8)
+        self.group_entry = Gtk.Entry()
+        self.group_entry.set_text(group)
+        self.group_entry.set_hexpand(True)
+        group_box.pack_start(group_label, False, False, 0)
+        group_box.pack_start(self.group_entry, True, True, 0)
+        content.pack_start(group_box, False, False, 0)
+        
+        # 하위 폴더 메뉴 표시
+        self.browse_check = Gtk.CheckButton(label=t("path_browse_subfolders"))
+        self.browse_check.set_active(browse)
+        content.pack_start(self.browse_check, False, False, 0)
+        
         self.show_all()
     
     def on_browse(self, button):
@@ -86,7 +103,8 @@ class PathEditDialog(Gtk.Dialog):
     
     def get_values(self):
         """입력값 반환"""
-        return self.alias_entry.get_text().strip(), self.path_entry.get_text().strip()
+        return (self.alias_entry.get_text().strip(), self.path_entry.get_text().strip(),
+                self.group_entry.get_text().strip(), self.browse_check.get_active())
 
 
 class SettingsDialog(Gtk.Window):
@@ -130,6 +148,7 @@ class SettingsDialog(Gtk.Window):
         self.sort_combo = Gtk.ComboBoxText()
         self.sort_combo.append("custom", t("settings_sort_custom"))
         self.sort_combo.append("name", t("settings_sort_name"))
+        self.sort_combo.append("frecency", t("settings_sort_frecency"))
         self.sort_combo.set_active_id(self.settings.sort_mode)
         sort_box.pack_start(sort_label, False, False, 0)
         sort_box.pack_start(self.sort_combo, False, False, 0)
@@ -137,6 +156,22 @@ class SettingsDialog(Gtk.Window):
         
         main_box.pack_start(options_box, False, False, 0)
         
+        # 메뉴 묶기 및 메뉴당 항목 수
+        menu_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        grouping_label = Gtk.Label(label=t("settings_grouping"))
+        self.grouping_combo = Gtk.ComboBoxText()
+        for mode in ("none", "group", "prefix"):
+            self.grouping_combo.append(mode, t(f"settings_grouping_{mode}"))
+        self.grouping_combo.set_active_id(self.settings.menu_grouping)
+        cap_label = Gtk.Label(label=t("settings_item_cap"))
+        self.cap_spin = Gtk.SpinButton.new_with_range(0, 500, 5)
+        self.cap_spin.set_value(self.settings.menu_item_cap)
+        menu_box.pack_start(grouping_label, False, False, 0)
+        menu_box.pack_start(self.grouping_combo, False, False, 0)
+        menu_box.pack_start(cap_label, False, False, 10)
+        menu_box.pack_start(self.cap_spin, False, False, 0)
+        main_box.pack_start(menu_box, False, False, 0)
+        
         # 중간: 경로 목록
         list_frame = Gtk.Frame(label=t("settings_paths"))
         list_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
@@ -151,8 +186,8 @@ class SettingsDialog(Gtk.Window):
         scroll.set_policy(Gtk.PolicyType.AUTOMATIC, Gtk.PolicyType.AUTOMATIC)
         scroll.set_min_content_height(250)
         
-        # ListStore: alias, path, order
-        self.store = Gtk.ListStore(str, str, int)
+        # ListStore: alias, path, 원래 목록 (self._originals) 에서의 인덱스 (새 항목은 -1), group, browse
+        self.store = Gtk.ListStore(str, str, int, str, bool)
         self._load_paths()
         
         self.treeview = Gtk.TreeView(model=self.store)
@@ -171,6 +206,11 @@ class SettingsDialog(Gtk.Window):
         col_path.set_expand(True)
         self.treeview.append_column(col_path)
         
+        renderer = Gtk.CellRendererText()
+        col_group = Gtk.TreeViewColumn(t("path_group").replace(":", ""), renderer, text=3)
+        col_group.set_resizable(True)
+        self.treeview.append_column(col_group)
+        
         scroll.add(self.treeview)
         list_box.pack_start(scroll, True, True, 0)
         
@@ -231,10 +271,16 @@ class SettingsDialog(Gtk.Window):
         self.show_all()
     
     def _load_paths(self):
-        """설정에서 경로 목록 로드"""
+        """설정에서 경로 목록 로드
+
+        창이 열려 있는 동안 설정이 다시 로드되어도 행의 인덱스가 가리키는 항목이
+        바뀌지 않도록, 불러온 시점의 항목을 복사해 두고 저장할 때 사용한다.
+        """
         self.store.clear()
-        for i, p in enumerate(self.settings.paths):
-            self.store.append([p.get("alias", ""), p.get("path", ""), i])
+        self._originals = [dict(p) for p in self.settings.paths]
+        for i, p in enumerate(self._originals):
+            self.store.append([p.get("alias", ""), p.get("path", ""), i, p.get("group") or "",
+                               bool(p.get("browse"))])
     
     def _get_selected(self):
         """선택된 항목 반환"""
@@ -253,10 +299,9 @@ class SettingsDialog(Gtk.Window):
         """경로 추가"""
         dialog = PathEditDialog(self, is_edit=False)
         if dialog.run() == Gtk.ResponseType.OK:
-            alias, path = dialog.get_values()
+            alias, path, group, browse = dialog.get_values()
             if alias and path:
-                order = len(self.store)
-                self.store.append([alias, path, order])
+                self.store.append([alias, path, -1, group, browse])
         dialog.destroy()
     
     def on_edit(self, button):
@@ -268,13 +313,17 @@ class SettingsDialog(Gtk.Window):
         
         alias = model[iter_][0]
         path = model[iter_][1]
+        group = model[iter_][3]
+        browse = model[iter_][4]
         
-        dialog = PathEditDialog(self, is_edit=True, alias=alias, path=path)
+        dialog = PathEditDialog(self, is_edit=True, alias=alias, path=path, group=group, browse=browse)
         if dialog.run() == Gtk.ResponseType.OK:
-            new_alias, new_path = dialog.get_values()
+            new_alias, new_path, new_group, new_browse = dialog.get_values()
             if new_alias and new_path:
                 model[iter_][0] = new_alias
                 model[iter_][1] = new_path
+                model[iter_][3] = new_group
+                model[iter_][4] = new_browse
         dialog.destroy()
     
     def on_delete(self, button):
@@ -318,28 +367,42 @@ class SettingsDialog(Gtk.Window):
             model.swap(iter_, next_iter)
     
     def on_save(self, button):
-        """설정 저장"""
-        # 언어 저장
+        """설정 저장 (하나의 batch 로 커밋, 검증 실패 시 아무것도 바뀌지 않음)"""
         new_lang = self.lang_combo.get_active_id()
-        self.settings.language = new_lang
-        set_language(new_lang)
-        
-        # 정렬 모드 저장
-        self.settings.sort_mode = self.sort_combo.get_active_id()
-        
-        # 터미널 저장
-        self.settings.terminal = self.term_entry.get_text().strip()
         
-        # 경로 목록 저장
+        # 경로 목록 (아이콘 등 추가 필드는 원래 항목에서 유지)
+        originals = self._originals
         paths = []
         for i, row in enumerate(self.store):
-            paths.append({
+            entry = dict(originals[row[2]]) if 0 <= row[2] < len(originals) else {}
+            entry.update({
                 "alias": row[0],
                 "path": row[1],
                 "order": i
             })
-        self.settings.set_paths(paths)
-        self.settings.save()
+            if row[3]:
+                entry["group"] = row[3]
+            else:
+                entry.pop("group", None)
+            if row[4]:
+                entry["browse"] = True
+            else:
+                entry.pop("browse", None)
+            paths.append(entry)
+        
+        try:
+            with self.settings.batch():
+                self.settings.language = new_lang
+                self.settings.sort_mode = self.sort_combo.get_active_id()
+                self.settings.menu_grouping = self.grouping_combo.get_active_id()
+                self.settings.menu_item_cap = self.cap_spin.get_value_as_int()
+                self.settings.terminal = self.term_entry.get_text().strip()
+                self.settings.set_paths(paths)
+                self.settings.save()
+        except SettingsValidationError as e:
+            self._show_message(t(e.key, e.alias))
+            return
+        set_language(new_lang)
         
         # 콜백 호출
         if self.on_save_callback:
@@ -7,10 +7,128 @@ Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
 Settings Manager for Baro Path Quick Access Indicator
 """
 
+import atexit
+import contextlib
+import copy
+import functools
+import hashlib
 import json
 import os
+import shutil
+import threading
+import time
+import weakref
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import Callable, Iterator, List, Dict, Optional, Set, Tuple
+
+from bookmark_index import BookmarkIndex
+from profiling import PROFILER, timed
+
+
+def _locked(method):
+    """설정 변경 메서드를 잠금 안에서 실행 (백그라운드 저장과의 충돌 방지)"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            return method(self, *args, **kwargs)
+    return wrapper
+
+
+class SettingsValidationError(ValueError):
+    """batch 커밋 시 검증 실패 (key: i18n 메시지 키, alias: 문제가 된 별칭)"""
+    
+    def __init__(self, key: str, alias: str):
+        super().__init__(f"{key}: {alias!r}")
+        self.key = key
+        self.alias = alias
+
+
+class ChangeSet:
+    """한 번의 변경 (또는 batch 전체) 으로 바뀐 내용
+    
+    별칭 기준의 최종 결과만 담는다 (추가 후 삭제 = 변경 없음,
+    삭제 후 다시 추가 = updated). 이름 변경은 removed + added 로 나타난다.
+    목록 전체가 교체된 경우 (replaced) moved 에는 위치가 바뀐 항목이 모두
+    들어 있지 않으므로 reordered 만 믿을 수 있다.
+    """
+    
+    def __init__(self):
+        self.added: Set[str] = set()
+        self.removed: Set[str] = set()
+        self.updated: Set[str] = set()
+        self.moved: Set[str] = set()  # 자리를 바꾼 항목
+        self.reordered = False
+        self.replaced = False  # set_paths/외부 변경으로 목록 전체가 교체됨
+        self.settings: Set[str] = set()  # 바뀐 일반 설정 키
+    
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.updated or self.reordered or self.settings)
+    
+    def __repr__(self) -> str:
+        return (f"ChangeSet(added={sorted(self.added)}, removed={sorted(self.removed)}, "
+                f"updated={sorted(self.updated)}, moved={sorted(self.moved)}, "
+                f"reordered={self.reordered}, replaced={self.replaced}, "
+                f"settings={sorted(self.settings)})")
+    
+    @property
+    def paths_changed(self) -> bool:
+        """경로 목록 (메뉴 항목) 에 영향이 있는지 여부"""
+        return bool(self.added or self.removed or self.updated or self.reordered)
+    
+    def add(self, alias: str):
+        if alias in self.removed:
+            self.removed.discard(alias)
+            self.updated.add(alias)
+        else:
+            self.added.add(alias)
+    
+    def move(self, alias: str, other: str):
+        self.moved.update((alias, other))
+        self.reordered = True
+    
+    def remove(self, alias: str):
+        self.updated.discard(alias)
+        self.moved.discard(alias)
+        if alias in self.added:
+            self.added.discard(alias)
+        else:
+            self.removed.add(alias)
+    
+    def update(self, alias: str):
+        if alias not in self.added:
+            self.updated.add(alias)
+    
+    def replace(self, old: List[Dict], new: List[Dict]):
+        """목록 전체 교체를 별칭 단위 변경으로 기록"""
+        self.replaced = True
+        def by_alias(entries):
+            table, counts = {}, {}
+            for entry in entries:
+                alias = entry.get("alias", "")
+                fields = {k: v for k, v in entry.items() if k != "order"}
+                table.setdefault(alias, fields)
+                counts[alias] = counts.get(alias, 0) + 1
+            return table, counts
+        
+        (old_table, old_counts), (new_table, new_counts) = by_alias(old), by_alias(new)
+        for alias in old_table.keys() - new_table.keys():
+            self.remove(alias)
+        for alias in new_table.keys() - old_table.keys():
+            self.add(alias)
+        for alias in old_table.keys() & new_table.keys():
+            if old_table[alias] != new_table[alias] or old_counts[alias] != new_counts[alias]:
+                self.update(alias)
+        old_order = [a for a in old_table if a in new_table]
+        new_order = [a for a in new_table if a in old_table]
+        if old_order != new_order:
+            self.reordered = True
+
+
+def _flush_at_exit(ref):
+    manager = ref()
+    if manager is not None:
+        manager.flush()
+
 
 class SettingsManager:
     """경로 별칭 및 설정을 관리하는 클래스"""
@@ -18,48 +136,383 @@ class SettingsManager:
     CONFIG_DIR = Path.home() / ".config" / "baro"
     CONFIG_FILE = CONFIG_DIR / "settings.json"
     
+    SAVE_DELAY = 0.5  # 저장 전 대기 시간 (초)
+    BACKUP_COUNT = 3  # 보관할 백업 파일 수
+    
     DEFAULT_SETTINGS = {
         "language": "en",  # 언어 설정
-        "sort_mode": "custom",  # "custom" or "name"
+        "sort_mode": "custom",  # "custom", "name" or "frecency"
         "terminal": "gnome-terminal",
         "file_manager": "xdg-open",
+        "path_check_timeout": 2.0,  # 경로 확인 제한 시간 (초)
+        "health_scan_interval": 60,  # 경로 상태 확인 주기 (초, 0 = 사용 안 함)
+        "menu_grouping": "none",  # "none", "group" (항목의 group 필드) or "prefix" (상위 폴더)
+        "menu_item_cap": 0,  # 메뉴 단계마다 보일 최대 항목 수 (넘으면 "더 보기", 0 = 제한 없음)
+        "browse_depth": 3,  # "browse" 가 켜진 항목의 하위 폴더 메뉴 단계 수
+        "profiling": False,  # 소요 시간 기록 및 "진단" 메뉴 (BARO_PROFILE 환경 변수로도 켤 수 있음)
         "paths": []
     }
     
-    def __init__(self):
+    def __init__(self, backend: Optional[str] = None):
+        """backend: "json" 또는 "sqlite" (None 이면 settings.db 가 있을 때 sqlite)"""
+        self.db_file = self.CONFIG_FILE.with_name("settings.db")
+        if backend is None:
+            backend = "sqlite" if self.db_file.exists() else "json"
+        self.backend = backend
+        self._store = None
+        self._usage = None
         self._settings: Dict = {}
+        self._index = BookmarkIndex()  # 경로 목록 (별칭/경로 색인 포함)
+        self._fingerprint: Optional[Tuple[int, int]] = None
+        self._content_hash: Optional[str] = None
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._save_deadline = 0.0
+        self._save_thread: Optional[threading.Thread] = None
+        self.write_count = 0  # 실제 파일 쓰기 횟수
+        self._listeners: List[Callable[[ChangeSet], None]] = []
+        self._batch_depth = 0
+        self._batch_changes: Optional[ChangeSet] = None
+        self._batch_snapshot: Optional[Tuple[Dict, List[Dict]]] = None
+        self._batch_save = False
+        self._unsaved = ChangeSet()  # 마지막 저장 이후 변경 (SQLite 증분 저장용)
+        atexit.register(_flush_at_exit, weakref.ref(self))
         self._ensure_config_dir()
+        if backend == "sqlite":
+            # 북마크가 많은 환경용 저장소 (JSON 사용 시에는 sqlite3 를 import 하지 않음)
+            from sqlite_store import SQLiteStore
+            self._store = SQLiteStore(self.db_file)
         self.load()
     
     def _ensure_config_dir(self):
         """설정 디렉토리가 없으면 생성"""
         self.CONFIG_DIR.mkdir(parents=True, exist_ok=True)
     
+    @property
+    def storage_file(self) -> Path:
+        """외부 변경 감시 대상 파일 (SQLite 는 커밋이 기록되는 WAL 파일)"""
+        if self._store is not None:
+            return self.db_file.with_name(self.db_file.name + "-wal")
+        return self.CONFIG_FILE
+    
+    @timed("settings.load")
+    @_locked
     def load(self) -> Dict:
         """설정 파일 로드"""
-        if self.CONFIG_FILE.exists():
+        if self._store is not None:
+            if self._store.is_empty():
+                self._set_settings(copy.deepcopy(self.DEFAULT_SETTINGS))
+                self.save()
+                self.flush()
+            else:
+                self._set_settings(self._with_defaults(self._store.load()))
+        elif self.CONFIG_FILE.exists():
             try:
-                with open(self.CONFIG_FILE, 'r', encoding='utf-8') as f:
-                    self._settings = json.load(f)
-                # 기본값 병합 (새 키가 추가된 경우 대비)
-                for key, value in self.DEFAULT_SETTINGS.items():
-                    if key not in self._settings:
-                        self._settings[key] = value
-            except (json.JSONDecodeError, IOError) as e:
+                fingerprint = self._stat_fingerprint()
+                data = self.CONFIG_FILE.read_bytes()
+                self._set_settings(self._parse(data))
+                self._fingerprint = fingerprint
+                self._content_hash = hashlib.sha1(data).hexdigest()
+            except (ValueError, IOError) as e:
                 print(f"설정 로드 오류: {e}")
-                self._settings = self.DEFAULT_SETTINGS.copy()
+                self._set_settings(copy.deepcopy(self.DEFAULT_SETTINGS))
         else:
-            self._settings = self.DEFAULT_SETTINGS.copy()
+            self._set_settings(copy.deepcopy(self.DEFAULT_SETTINGS))
             self.save()
+            self.flush()
         return self._settings
     
+    def _parse(self, data: bytes) -> Dict:
+        """JSON 파싱 및 기본값 병합"""
+        settings = json.loads(data.decode('utf-8'))
+        if not isinstance(settings, dict):
+            raise ValueError("settings must be a JSON object")
+        return self._with_defaults(settings)
+    
+    def _with_defaults(self, settings: Dict) -> Dict:
+        """기본값 병합 (새 키가 추가된 경우 대비)"""
+        for key, value in self.DEFAULT_SETTINGS.items():
+            if key not in settings:
+                settings[key] = copy.deepcopy(value)
+        return settings
+    
+    def _set_settings(self, settings: Dict):
+        """설정 교체 및 경로 색인 재구성"""
+        self._settings = settings
+        self._index.reset(settings.get("paths") or [])
+        self._unsaved = ChangeSet()
+    
+    def _stat_fingerprint(self) -> Optional[Tuple[int, int]]:
+        """설정 파일의 (mtime_ns, size) 반환 (파일이 없으면 None)"""
+        try:
+            st = os.stat(self.CONFIG_FILE)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+    
+    @_locked
+    def reload_if_changed(self) -> bool:
+        """설정 파일 내용이 실제로 바뀐 경우에만 다시 로드 (바뀌었으면 True)
+        
+        mtime/크기가 같으면 파일을 읽지 않고, 내용 해시가 같으면 파싱하지 않는다.
+        """
+        if self._dirty:
+            # 아직 저장하지 않은 변경이 있으면 그대로 유지 (곧 파일을 덮어씀)
+            return False
+        if self._store is not None:
+            if not self._store.changed_externally():
+                return False
+            self._replace_settings(self._with_defaults(self._store.load()))
+            return True
+        
+        fingerprint = self._stat_fingerprint()
+        if fingerprint is None or fingerprint == self._fingerprint:
+            return False
+        try:
+            data = self.CONFIG_FILE.read_bytes()
+        except IOError:
+            return False
+        
+        digest = hashlib.sha1(data).hexdigest()
+        if digest == self._content_hash:
+            self._fingerprint = fingerprint
+            return False
+        
+        try:
+            settings = self._parse(data)
+        except ValueError as e:
+            # 다른 프로그램이 쓰는 중일 수 있음: 다음 변경 이벤트에서 다시 시도
+            print(f"설정 로드 오류: {e}")
+            return False
+        
+        self._replace_settings(settings)
+        self._fingerprint = fingerprint
+        self._content_hash = digest
+        return True
+    
+    def _replace_settings(self, settings: Dict):
+        """외부에서 읽은 설정으로 교체하고 차이를 알림"""
+        old_settings, old_paths = self._settings, [dict(p) for p in self._index]
+        self._set_settings(settings)
+        
+        changes = ChangeSet()
+        changes.replace(old_paths, self._index.to_list())
+        for key in old_settings.keys() | settings.keys():
+            if key != "paths" and old_settings.get(key) != settings.get(key):
+                changes.settings.add(key)
+        self._emit(changes)
+    
     def save(self):
-        """설정 파일 저장"""
+        """설정 저장 예약
+        
+        실제 쓰기는 마지막 save() 호출 후 SAVE_DELAY 초 동안 추가 변경이
+        없을 때 한 번만 수행된다 (여러 변경을 한 번의 쓰기로 합침).
+        즉시 써야 하면 flush() 를 호출한다.
+        """
+        with self._lock:
+            if self._batch_depth:
+                # batch 안에서는 커밋할 때 한 번만 예약
+                self._batch_save = True
+                return
+            self._dirty = True
+            self._save_deadline = time.monotonic() + self.SAVE_DELAY
+            if self._save_thread is None:
+                self._save_thread = threading.Thread(
+                    target=self._save_worker, name="baro-save", daemon=True
+                )
+                self._save_thread.start()
+    
+    def _save_worker(self):
+        """마지막 save() 후 SAVE_DELAY 가 지나면 flush"""
+        while True:
+            with self._lock:
+                remaining = self._save_deadline - time.monotonic()
+                if remaining <= 0 or not self._dirty:
+                    self._save_thread = None
+                    break
+            time.sleep(remaining)
+        self.flush()
+    
+    def flush(self) -> bool:
+        """예약된 저장을 즉시 파일에 기록 (기록했으면 True)"""
+        with self._lock:
+            if not self._dirty:
+                return False
+            with PROFILER.span("settings.save"):
+                self._settings["paths"] = self._index.to_list()
+                if self._store is not None:
+                    return self._flush_store()
+                return self._flush_json()
+    
+    def _flush_json(self) -> bool:
+        """settings.json 에 전체 설정 기록"""
+        data = json.dumps(self._settings, ensure_ascii=False, indent=2).encode('utf-8')
+        self._unsaved = ChangeSet()
+        self._dirty = False
+        try:
+            self._write_atomic(data)
+        except OSError as e:
+            print(f"설정 저장 오류: {e}")
+            self._dirty = True
+            return False
+        # 자신이 저장한 내용은 변경 감지에서 제외
+        self._fingerprint = self._stat_fingerprint()
+        self._content_hash = hashlib.sha1(data).hexdigest()
+        self.write_count += 1
+        return True
+    
+    def _flush_store(self) -> bool:
+        """SQLite 저장소에 바뀐 행만 기록"""
+        import sqlite3
+        changes, self._unsaved = self._unsaved, ChangeSet()
+        if self._index.has_duplicate_aliases():
+            changes = None  # 중복 별칭이 있으면 별칭으로 행을 찾을 수 없어 전체 비교
+        self._dirty = False
         try:
-            with open(self.CONFIG_FILE, 'w', encoding='utf-8') as f:
-                json.dump(self._settings, f, ensure_ascii=False, indent=2)
-        except IOError as e:
+            self._store.save(self._settings, changes)
+        except sqlite3.Error as e:
             print(f"설정 저장 오류: {e}")
+            self._unsaved.replaced = True
+            self._dirty = True
+            return False
+        self.write_count += 1
+        return True
+    
+    def to_dict(self) -> Dict:
+        """settings.json 형식의 설정 전체 사본 (내보내기/마이그레이션용)"""
+        with self._lock:
+            settings = copy.deepcopy({k: v for k, v in self._settings.items() if k != "paths"})
+            settings["paths"] = copy.deepcopy(self._index.to_list())
+            return settings
+    
+    def _write_atomic(self, data: bytes):
+        """임시 파일에 쓰고 fsync 후 rename (중간에 중단되어도 기존 파일 유지)"""
+        tmp_file = self.CONFIG_FILE.with_name(self.CONFIG_FILE.name + ".tmp")
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        
+        if self.CONFIG_FILE.exists():
+            self._rotate_backups()
+        os.replace(tmp_file, self.CONFIG_FILE)
+        
+        # rename 자체도 디스크에 반영되도록 디렉토리 fsync
+        dir_fd = os.open(self.CONFIG_DIR, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+    
+    def _rotate_backups(self):
+        """settings.json.bak.1 (가장 최근) ~ .bak.N 백업 회전"""
+        def backup(i):
+            return self.CONFIG_FILE.with_name(f"{self.CONFIG_FILE.name}.bak.{i}")
+        
+        for i in range(self.BACKUP_COUNT - 1, 0, -1):
+            if backup(i).exists():
+                os.replace(backup(i), backup(i + 1))
+        # 현재 파일은 하드 링크로 보존 (rename 전까지 settings.json 이 항상 존재)
+        try:
+            os.link(self.CONFIG_FILE, backup(1))
+        except OSError:
+            shutil.copy2(self.CONFIG_FILE, backup(1))
+    
+    # 변경 알림 / batch
+    def add_listener(self, callback: Callable[[ChangeSet], None]):
+        """변경 리스너 등록 (변경 또는 batch 커밋마다 ChangeSet 하나로 호출)"""
+        self._listeners.append(callback)
+    
+    def remove_listener(self, callback: Callable[[ChangeSet], None]):
+        """변경 리스너 해제"""
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+    
+    def _emit(self, changes: ChangeSet):
+        if not changes:
+            return
+        for callback in list(self._listeners):
+            try:
+                callback(changes)
+            except Exception as e:
+                print(f"설정 변경 리스너 오류: {e}")
+    
+    def _record(self, apply: Callable[[ChangeSet], None]):
+        """변경 기록 (batch 밖이면 바로 알림)"""
+        apply(self._unsaved)
+        if self._batch_depth:
+            apply(self._batch_changes)
+            return
+        changes = ChangeSet()
+        apply(changes)
+        self._emit(changes)
+    
+    def _set_value(self, key: str, value):
+        """일반 설정 값 변경 및 기록"""
+        if self._settings.get(key) == value:
+            return
+        self._settings[key] = value
+        self._record(lambda c: c.settings.add(key))
+    
+    @contextlib.contextmanager
+    def batch(self) -> Iterator["SettingsManager"]:
+        """여러 변경을 하나의 트랜잭션으로 묶음
+        
+        with settings.batch():
+            settings.add_path(...)
+            settings.remove_path(...)
+            settings.save()
+        
+        블록 안의 저장 예약과 변경 알림은 커밋 때 한 번만 수행되고, 예외가
+        발생하거나 커밋 시 검증 (빈 별칭/경로, 중복 별칭) 에 실패하면 블록
+        시작 전 상태로 되돌린 뒤 예외를 다시 던진다. 중첩된 batch 는 가장
+        바깥 batch 에 합쳐진다.
+        """
+        with self._lock:
+            self._batch_depth += 1
+            outermost = self._batch_depth == 1
+            if outermost:
+                self._batch_changes = ChangeSet()
+                self._batch_save = False
+                self._batch_snapshot = (
+                    copy.deepcopy({k: v for k, v in self._settings.items() if k != "paths"}),
+                    [dict(p) for p in self._index],
+                )
+            try:
+                yield self
+                if outermost:
+                    self._validate(self._batch_changes)
+            except BaseException:
+                if outermost:
+                    settings, paths = self._batch_snapshot
+                    settings["paths"] = paths
+                    self._set_settings(settings)
+                    self._unsaved.replaced = True
+                    self._batch_changes = None
+                raise
+            finally:
+                self._batch_depth -= 1
+                if outermost:
+                    self._batch_snapshot = None
+            
+            if not outermost:
+                return
+            changes, self._batch_changes = self._batch_changes, None
+            if self._batch_save:
+                self._batch_save = False
+                self.save()
+        self._emit(changes)
+    
+    def _validate(self, changes: ChangeSet):
+        """batch 에서 추가/수정된 항목 검증"""
+        for alias in sorted(changes.added | changes.updated):
+            entry = self._index.get(alias)
+            if entry is None:
+                continue
+            if not alias or not entry.get("path"):
+                raise SettingsValidationError("msg_invalid_path_entry", alias)
+            if self._index.count_alias(alias) > 1:
+                raise SettingsValidationError("msg_duplicate_alias", alias)
     
     @property
     def language(self) -> str:
@@ -67,20 +520,22 @@ class SettingsManager:
         return self._settings.get("language", "en")
     
     @language.setter
+    @_locked
     def language(self, value: str):
         """언어 설정"""
-        self._settings["language"] = value
+        self._set_value("language", value)
     
     @property
     def sort_mode(self) -> str:
-        """정렬 모드 반환 ('custom' 또는 'name')"""
+        """정렬 모드 반환 ('custom', 'name' 또는 'frecency')"""
         return self._settings.get("sort_mode", "custom")
     
     @sort_mode.setter
+    @_locked
     def sort_mode(self, value: str):
         """정렬 모드 설정"""
-        if value in ("custom", "name"):
-            self._settings["sort_mode"] = value
+        if value in ("custom", "name", "frecency"):
+            self._set_value("sort_mode", value)
     
     @property
     def terminal(self) -> str:
@@ -88,9 +543,10 @@ class SettingsManager:
         return self._settings.get("terminal", "gnome-terminal")
     
     @terminal.setter
+    @_locked
     def terminal(self, value: str):
         """터미널 명령어 설정"""
-        self._settings["terminal"] = value
+        self._set_value("terminal", value)
     
     @property
     def file_manager(self) -> str:
@@ -98,82 +554,189 @@ class SettingsManager:
         return self._settings.get("file_manager", "xdg-open")
     
     @file_manager.setter
+    @_locked
     def file_manager(self, value: str):
         """파일 관리자 명령어 설정"""
-        self._settings["file_manager"] = value
+        self._set_value("file_manager", value)
+    
+    @property
+    def path_check_timeout(self) -> float:
+        """경로 존재 확인 제한 시간 (초) 반환"""
+        try:
+            return max(0.1, float(self._settings.get("path_check_timeout", 2.0)))
+        except (TypeError, ValueError):
+            return 2.0
+    
+    @path_check_timeout.setter
+    @_locked
+    def path_check_timeout(self, value: float):
+        """경로 존재 확인 제한 시간 설정"""
+        self._set_value("path_check_timeout", value)
+    
+    @property
+    def health_scan_interval(self) -> int:
+        """경로 상태 확인 주기 (초) 반환"""
+        try:
+            return max(0, int(self._settings.get("health_scan_interval", 60)))
+        except (TypeError, ValueError):
+            return 60
+    
+    @health_scan_interval.setter
+    @_locked
+    def health_scan_interval(self, value: int):
+        """경로 상태 확인 주기 설정"""
+        self._set_value("health_scan_interval", value)
+    
+    @property
+    def menu_grouping(self) -> str:
+        """메뉴 묶기 방식 반환 ('none', 'group' 또는 'prefix')"""
+        value = self._settings.get("menu_grouping", "none")
+        return value if value in ("none", "group", "prefix") else "none"
+    
+    @menu_grouping.setter
+    @_locked
+    def menu_grouping(self, value: str):
+        """메뉴 묶기 방식 설정"""
+        if value in ("none", "group", "prefix"):
+            self._set_value("menu_grouping", value)
+    
+    @property
+    def menu_item_cap(self) -> int:
+        """메뉴 단계마다 보일 최대 항목 수 반환 (0 = 제한 없음)"""
+        try:
+            return max(0, int(self._settings.get("menu_item_cap", 0)))
+        except (TypeError, ValueError):
+            return 0
+    
+    @menu_item_cap.setter
+    @_locked
+    def menu_item_cap(self, value: int):
+        """메뉴 단계마다 보일 최대 항목 수 설정"""
+        self._set_value("menu_item_cap", value)
+    
+    @property
+    def browse_depth(self) -> int:
+        """하위 폴더 메뉴 단계 수 반환 (1 ~ 8)"""
+        try:
+            return min(8, max(1, int(self._settings.get("browse_depth", 3))))
+        except (TypeError, ValueError):
+            return 3
+    
+    @browse_depth.setter
+    @_locked
+    def browse_depth(self, value: int):
+        """하위 폴더 메뉴 단계 수 설정"""
+        self._set_value("browse_depth", value)
+    
+    @property
+    def profiling(self) -> bool:
+        """소요 시간 기록 사용 여부 반환"""
+        return bool(self._settings.get("profiling", False))
+    
+    @profiling.setter
+    @_locked
+    def profiling(self, value: bool):
+        """소요 시간 기록 사용 여부 설정"""
+        self._set_value("profiling", bool(value))
     
     @property
     def paths(self) -> List[Dict]:
-        """경로 목록 반환"""
-        return self._settings.get("paths", [])
+        """경로 목록 반환 (사용자 정렬 순서)"""
+        return self._index.to_list()
+    
+    def get_path(self, alias: str) -> Optional[Dict]:
+        """별칭으로 경로 항목 조회"""
+        return self._index.get(alias)
+    
+    def has_path(self, path: str) -> bool:
+        """같은 경로(정규화 비교)가 이미 등록되어 있는지 여부"""
+        return self._index.has_path(path)
+    
+    @property
+    def usage(self) -> "UsageLog":
+        """경로 사용 기록 (frecency 정렬용, 처음 사용할 때 로드)"""
+        if self._usage is None:
+            from usage_log import UsageLog
+            self._usage = UsageLog(self.CONFIG_FILE.with_name("usage.log"))
+        return self._usage
+    
+    def record_usage(self, path: str):
+        """경로를 연 기록 추가"""
+        self.usage.record(path)
     
     def get_sorted_paths(self) -> List[Dict]:
         """정렬된 경로 목록 반환"""
         paths = self.paths.copy()
         if self.sort_mode == "name":
             paths.sort(key=lambda x: x.get("alias", "").lower())
-        else:
-            paths.sort(key=lambda x: x.get("order", 0))
+        elif self.sort_mode == "frecency":
+            # 점수가 같으면 사용자 정렬 순서 유지 (안정 정렬)
+            usage = self.usage
+            usage.refresh()
+            paths.sort(key=lambda x: usage.rank(x.get("path", "")), reverse=True)
         return paths
     
+    @_locked
     def add_path(self, alias: str, path: str) -> bool:
         """새 경로 추가"""
         if not alias or not path:
             return False
         
         # 중복 검사
-        for p in self.paths:
-            if p.get("alias") == alias:
-                return False
+        if self._index.has_alias(alias):
+            return False
         
-        order = len(self.paths)
-        self._settings["paths"].append({
+        self._index.append({
             "alias": alias,
             "path": path,
-            "order": order
         })
+        self._record(lambda c: c.add(alias))
         return True
     
+    @_locked
     def update_path(self, old_alias: str, new_alias: str, new_path: str) -> bool:
         """경로 수정"""
-        for p in self._settings["paths"]:
-            if p.get("alias") == old_alias:
-                p["alias"] = new_alias
-                p["path"] = new_path
-                return True
-        return False
+        if self._index.update(old_alias, new_alias, new_path) is None:
+            return False
+        
+        def apply(changes):
+            if new_alias == old_alias:
+                changes.update(old_alias)
+            else:
+                if self._index.has_alias(old_alias):
+                    changes.update(old_alias)
+                else:
+                    changes.remove(old_alias)
+                changes.add(new_alias)
+        self._record(apply)
+        return True
     
+    @_locked
     def remove_path(self, alias: str) -> bool:
         """경로 삭제"""
-        for i, p in enumerate(self._settings["paths"]):
-            if p.get("alias") == alias:
-                del self._settings["paths"][i]
-                self._reorder_paths()
-                return True
-        return False
+        if self._index.remove(alias) is None:
+            return False
+        # 중복 별칭 중 하나만 지운 경우는 남은 항목의 변경으로 기록
+        self._record(lambda c: c.update(alias) if self._index.has_alias(alias) else c.remove(alias))
+        return True
     
+    @_locked
     def move_path(self, alias: str, direction: int) -> bool:
         """경로 순서 변경 (direction: -1 = 위로, 1 = 아래로)"""
-        paths = self._settings["paths"]
-        for i, p in enumerate(paths):
-            if p.get("alias") == alias:
-                new_index = i + direction
-                if 0 <= new_index < len(paths):
-                    paths[i], paths[new_index] = paths[new_index], paths[i]
-                    self._reorder_paths()
-                    return True
-                return False
-        return False
-    
-    def _reorder_paths(self):
-        """경로 순서 재정렬"""
-        for i, p in enumerate(self._settings["paths"]):
-            p["order"] = i
+        other = self._index.move(alias, direction)
+        if other is None:
+            return False
+        self._record(lambda c: c.move(alias, other.get("alias", "")))
+        return True
     
+    @_locked
     def set_paths(self, paths: List[Dict]):
-        """경로 목록 전체 설정"""
-        self._settings["paths"] = paths
-        self._reorder_paths()
+        """경로 목록 전체 설정 (목록 순서대로)"""
+        old_paths = [dict(p) for p in self._index]
+        for i, p in enumerate(paths):
+            p["order"] = i
+        self._index.reset(paths)
+        self._record(lambda c: c.replace(old_paths, paths))
 
 
 # 테스트용 코드
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Asynchronous process spawning for Baro Path Quick Access Indicator
+"""
+
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+from gi.repository import GLib
+
+from profiling import PROFILER
+
+ErrorCallback = Callable[[str], None]
+
+
+class Spawner:
+    """GLib.spawn_async 로 프로그램을 실행하고 종료된 자식 프로세스를 회수하는 클래스
+
+    DO_NOT_REAP_CHILD + child_watch 로 좀비 프로세스를 남기지 않으며,
+    실행 실패는 메인 루프 idle 콜백으로 비동기 보고한다.
+    클릭부터 exec 완료까지의 지연 시간은 latency_stats() 로 확인할 수 있다.
+    """
+
+    def __init__(self, history: int = 100):
+        self._latencies: "deque[float]" = deque(maxlen=history)  # ms
+        self._children: Dict[int, List[str]] = {}
+
+    @property
+    def running(self) -> int:
+        """아직 종료되지 않은 자식 프로세스 수"""
+        return len(self._children)
+
+    def spawn(self, argv: List[str], cwd: Optional[str] = None,
+              started_at: Optional[float] = None,
+              on_error: Optional[ErrorCallback] = None,
+              name: str = "launch") -> Optional[int]:
+        """프로그램 실행 (성공 시 pid, 실패 시 None 반환 후 on_error 비동기 호출)
+
+        started_at: 사용자가 클릭한 시각 (time.monotonic())
+        name: 계측이 켜져 있을 때 지연 시간을 기록할 이름
+        """
+        if started_at is None:
+            started_at = time.monotonic()
+        flags = GLib.SpawnFlags.SEARCH_PATH | GLib.SpawnFlags.DO_NOT_REAP_CHILD
+        try:
+            # spawn_async 는 exec 성공 여부를 확인한 뒤 반환한다
+            pid, _, _, _ = GLib.spawn_async(argv, working_directory=cwd, flags=flags)
+        except GLib.Error as e:
+            if on_error is not None:
+                GLib.idle_add(self._report_error, on_error, e.message)
+            return None
+
+        latency = (time.monotonic() - started_at) * 1000
+        self._latencies.append(latency)
+        PROFILER.record(name, latency)
+        self._children[int(pid)] = argv
+        GLib.child_watch_add(GLib.PRIORITY_DEFAULT, pid, self._on_child_exit)
+        return int(pid)
+
+    def _on_child_exit(self, pid, status, *user_data):
+        """자식 프로세스 종료 시 회수"""
+        self._children.pop(int(pid), None)
+        GLib.spawn_close_pid(pid)
+
+    @staticmethod
+    def _report_error(on_error, message):
+        on_error(message)
+        return False
+
+    def latency_stats(self) -> Dict[str, float]:
+        """실행 지연 시간 통계 (ms): count, last, mean, p50, p95, max"""
+        values = list(self._latencies)
+        if not values:
+            return {"count": 0}
+        ordered = sorted(values)
+        return {
+            "count": len(values),
+            "last": values[-1],
+            "mean": sum(values) / len(values),
+            "p50": ordered[len(ordered) // 2],
+            "p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+            "max": ordered[-1],
+        }
@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+SQLite storage backend for Baro Path Quick Access Indicator
+(북마크가 많은 경우용, gi/Gtk 를 import 하지 않음)
+"""
+
+import json
+import sqlite3
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from menu_diff import keyed_entries, stable_keys
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS settings (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bookmarks (
+    id       INTEGER PRIMARY KEY,
+    position REAL NOT NULL,
+    alias    TEXT NOT NULL,
+    path     TEXT NOT NULL,
+    extra    TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS bookmarks_alias ON bookmarks (alias);
+CREATE INDEX IF NOT EXISTS bookmarks_path ON bookmarks (path);
+CREATE INDEX IF NOT EXISTS bookmarks_position ON bookmarks (position);
+"""
+
+# 위치 값 사이 간격이 이보다 작아지면 전체 위치를 다시 매김
+MIN_GAP = 1e-6
+
+
+def _encode(value) -> str:
+    return json.dumps(value, ensure_ascii=False, sort_keys=True)
+
+
+def _spread(lo: Optional[float], hi: Optional[float], count: int) -> Optional[List[float]]:
+    """lo 와 hi 사이 (없으면 끝 쪽으로) 에 count 개의 position 을 균등 배치
+
+    간격이 MIN_GAP 보다 좁아지면 None (전체 위치를 다시 매겨야 함)
+    """
+    if lo is None and hi is None:
+        return [float(n) for n in range(count)]
+    if hi is None:
+        return [lo + n + 1 for n in range(count)]
+    if lo is None:
+        return [hi - (count - n) for n in range(count)]
+    step = (hi - lo) / (count + 1)
+    if step < MIN_GAP:
+        return None
+    return [lo + step * (n + 1) for n in range(count)]
+
+
+def _row_fields(entry: Dict) -> Tuple[str, str, str]:
+    """항목을 (alias, path, extra) 로 분리 (icon 등 나머지 필드는 extra 에 보존)"""
+    extra = {k: v for k, v in entry.items() if k not in ("alias", "path", "order")}
+    return entry.get("alias", ""), entry.get("path", ""), _encode(extra)
+
+
+class SQLiteStore:
+    """설정과 북마크를 SQLite (WAL) 에 보관하는 저장소
+
+    마지막으로 읽거나 쓴 행을 메모리에 기억해 두고, save() 에서는 실제로
+    바뀐 행만 INSERT/UPDATE/DELETE 한다. 순서는 실수 position 으로 저장하여
+    이동한 항목만 주변 항목 사이의 값으로 옮긴다 (나머지 행은 그대로).
+    save() 에 ChangeSet 을 넘기면 바뀐 별칭의 행만 비교하고, 없으면 전체 목록을
+    기억해 둔 행과 비교한다.
+    연결은 여러 스레드에서 쓰일 수 있으므로 호출하는 쪽에서 잠금을 잡는다.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = str(db_path)
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+        self._settings: Dict[str, str] = {}
+        # (alias, 순번) -> (id, position, path, extra)
+        self._rows: Dict[Hashable, Tuple[int, float, str, str]] = {}
+        self._data_version: Optional[int] = None
+
+    def close(self):
+        self._conn.close()
+
+    def data_version(self) -> int:
+        """다른 연결이 커밋할 때마다 바뀌는 값 (외부 변경 감지용)"""
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def changed_externally(self) -> bool:
+        """마지막 load()/save() 이후 다른 프로세스가 DB 를 바꿨는지 여부"""
+        return self.data_version() != self._data_version
+
+    def is_empty(self) -> bool:
+        return self._conn.execute("SELECT 1 FROM settings LIMIT 1").fetchone() is None
+
+    def load(self) -> Dict:
+        """설정 전체를 settings.json 과 같은 형태의 dict 로 읽음"""
+        settings = {}
+        self._settings = {}
+        for key, value in self._conn.execute("SELECT key, value FROM settings"):
+            self._settings[key] = value
+            settings[key] = json.loads(value)
+
+        rows = self._conn.execute(
+            "SELECT id, position, alias, path, extra FROM bookmarks ORDER BY position, id"
+        ).fetchall()
+        paths = []
+        for i, (_, _, alias, path, extra) in enumerate(rows):
+            entry = {"alias": alias, "path": path}
+            if extra != "{}":
+                entry.update(json.loads(extra))
+            entry["order"] = i
+            paths.append(entry)
+        self._rows = {
+            key: (row[0], row[1], row[3], row[4])
+            for (key, _), row in zip(keyed_entries(paths, lambda p: None), rows)
+        }
+        settings["paths"] = paths
+        self._data_version = self.data_version()
+        return settings
+
+    def save(self, settings: Dict, changes=None) -> int:
+        """바뀐 설정 키와 북마크 행만 기록 (기록한 행 수 반환)
+
+        changes: 마지막 save() 이후의 ChangeSet (별칭이 모두 유일한 경우에만)
+        """
+        paths = settings.get("paths") or []
+        written = 0
+        with self._conn:
+            written += self._save_settings(settings)
+            if changes is None or changes.replaced:
+                written += self._save_paths(paths)
+            else:
+                written += self._save_changed(paths, changes)
+        self._data_version = self.data_version()
+        return written
+
+    def _save_settings(self, settings: Dict) -> int:
+        values = {k: _encode(v) for k, v in settings.items() if k != "paths"}
+        changed = [(k, v) for k, v in values.items() if self._settings.get(k) != v]
+        removed = [(k,) for k in self._settings.keys() - values.keys()]
+        self._conn.executemany(
+            "INSERT INTO settings (key, value) VALUES (?, ?) "
+            "ON CONFLICT (key) DO UPDATE SET value = excluded.value", changed
+        )
+        self._conn.executemany("DELETE FROM settings WHERE key = ?", removed)
+        self._settings = values
+        return len(changed) + len(removed)
+
+    def _save_paths(self, paths: List[Dict]) -> int:
+        entries = keyed_entries(paths, _row_fields)
+        keys = [key for key, _ in entries]
+        old = self._rows
+
+        removed = old.keys() - set(keys)
+        self._conn.executemany("DELETE FROM bookmarks WHERE id = ?", [(old[k][0],) for k in removed])
+        written = len(removed)
+
+        for key in removed:
+            del old[key]
+        for (key, fields), position in zip(entries, self._positions(keys)):
+            written += self._write_row(key, fields, position)
+        return written
+
+    def _write_row(self, key: Hashable, fields: Tuple[str, str, str], position: float) -> bool:
+        """행 추가 또는 갱신 (바뀐 것이 없으면 False)"""
+        alias, path, extra = fields
+        row = self._rows.get(key)
+        if row is None:
+            cursor = self._conn.execute(
+                "INSERT INTO bookmarks (position, alias, path, extra) VALUES (?, ?, ?, ?)",
+                (position, alias, path, extra)
+            )
+            self._rows[key] = (cursor.lastrowid, position, path, extra)
+            return True
+        if row[1:] == (position, path, extra):
+            return False
+        self._conn.execute(
+            "UPDATE bookmarks SET position = ?, path = ?, extra = ? WHERE id = ?",
+            (position, path, extra, row[0])
+        )
+        self._rows[key] = (row[0], position, path, extra)
+        return True
+
+    def _save_changed(self, paths: List[Dict], changes) -> int:
+        """ChangeSet 에 있는 별칭의 행만 기록 (나머지 행의 상대 순서는 그대로)"""
+        touched = changes.added | changes.updated | changes.moved
+        written = 0
+        for alias in changes.removed | touched:
+            n = 0 if alias in changes.removed else 1
+            while (alias, n) in self._rows:
+                row = self._rows.pop((alias, n))
+                self._conn.execute("DELETE FROM bookmarks WHERE id = ?", (row[0],))
+                written += 1
+                n += 1
+        if not touched:
+            return written
+
+        index = {p.get("alias", ""): i for i, p in enumerate(paths)}
+        dirty = sorted(index[a] for a in touched if a in index)
+        # 연속된 위치끼리 묶어 앞뒤의 그대로인 행 사이에 배치
+        start = 0
+        while start < len(dirty):
+            end = start
+            while end + 1 < len(dirty) and dirty[end + 1] == dirty[end] + 1:
+                end += 1
+            first, last = dirty[start], dirty[end]
+            lo = hi = None
+            if first > 0:
+                row = self._rows.get((paths[first - 1].get("alias", ""), 0))
+                if row is None:
+                    return written + self._save_paths(paths)
+                lo = row[1]
+            if last + 1 < len(paths):
+                row = self._rows.get((paths[last + 1].get("alias", ""), 0))
+                if row is None:
+                    return written + self._save_paths(paths)
+                hi = row[1]
+            positions = _spread(lo, hi, last - first + 1)
+            if positions is None:
+                return written + self._save_paths(paths)
+            for i, position in zip(range(first, last + 1), positions):
+                entry = paths[i]
+                written += self._write_row((entry.get("alias", ""), 0), _row_fields(entry), position)
+            start = end + 1
+        return written
+
+    def _positions(self, keys: List[Hashable]) -> List[float]:
+        """새 순서의 position 목록 (순서가 유지된 행은 기존 값 그대로)"""
+        old = self._rows
+        kept = set(stable_keys([(k, old[k][1]) for k in keys if k in old]))
+        positions: List[Optional[float]] = [old[k][1] if k in kept else None for k in keys]
+
+        # 기존 값을 유지하는 행 사이의 빈 자리를 균등하게 채움
+        i = 0
+        while i < len(keys):
+            if positions[i] is not None:
+                i += 1
+                continue
+            j = i
+            while j < len(keys) and positions[j] is None:
+                j += 1
+            spread = _spread(positions[i - 1] if i > 0 else None,
+                             positions[j] if j < len(keys) else None, j - i)
+            if spread is None:
+                return [float(n) for n in range(len(keys))]
+            positions[i:j] = spread
+            i = j
+        return positions
+
+    def import_settings(self, settings: Dict):
+        """settings.json 내용 전체로 DB 교체 (마이그레이션)"""
+        with self._conn:
+            self._conn.execute("DELETE FROM settings")
+            self._conn.execute("DELETE FROM bookmarks")
+        self._settings = {}
+        self._rows = {}
+        self.save(settings)
+
+    def export_settings(self) -> Dict:
+        """settings.json 형식으로 내보낼 dict"""
+        return self.load()
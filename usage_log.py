@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Usage log and frecency scores for Baro Path Quick Access Indicator
+(gi/Gtk 를 import 하지 않음)
+
+로그 한 줄: "<unix 시각>\\t<가중치>\\t<경로>"
+열 때마다 가중치 1 인 줄을 덧붙이고, 압축하면 경로마다 현재 점수를 담은 한 줄만 남는다.
+"""
+
+import fcntl
+import os
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+from bookmark_index import normalize_path
+
+
+class UsageLog:
+    """추가 전용 사용 기록과 시간 감쇠 점수 (frecency)
+
+    점수는 기준 시각 ref 로 정규화한 값 Σ w·2^((t - ref) / half_life) 로 보관한다.
+    현재 점수는 모든 경로에 같은 배율이 곱해질 뿐이므로, 정렬에는 저장된 값을
+    그대로 쓰고 기록할 때마다 해당 경로의 값 하나만 더한다 (기록 재계산 없음).
+    """
+
+    HALF_LIFE = 14 * 86400  # 점수가 절반이 되는 시간 (초)
+    MIN_SCORE = 0.01  # 압축 시 이보다 낮은 점수는 버림
+    MAX_EXPONENT = 512  # 정규화 값이 너무 커지기 전에 기준 시각을 옮김
+
+    def __init__(self, path, half_life: float = HALF_LIFE, compact_lines: int = 512):
+        self.path = Path(path)
+        self.half_life = half_life
+        self.compact_lines = compact_lines
+        self.version = 0  # 점수가 바뀔 때마다 증가
+        self._reset()
+        self.refresh()
+
+    def _reset(self):
+        self._scores: Dict[str, float] = {}
+        self._ref: Optional[float] = None
+        self._offset = 0
+        self._inode: Optional[int] = None
+        self._lines = 0
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    # 점수
+    def _add(self, path: str, when: float, weight: float):
+        if self._ref is None:
+            self._ref = when
+        exponent = (when - self._ref) / self.half_life
+        if exponent > self.MAX_EXPONENT:
+            self._rebase(when)
+            exponent = 0.0
+        self._scores[path] = self._scores.get(path, 0.0) + weight * 2.0 ** exponent
+
+    def _rebase(self, when: float):
+        factor = 2.0 ** (-(when - self._ref) / self.half_life)
+        for path in self._scores:
+            self._scores[path] *= factor
+        self._ref = when
+
+    def rank(self, path: str) -> float:
+        """정렬용 값 (현재 점수에 비례, 높을수록 자주/최근 사용)"""
+        return self._scores.get(normalize_path(path), 0.0)
+
+    def score(self, path: str, now: Optional[float] = None) -> float:
+        """현재 시각 기준 감쇠 점수 (방금 한 번 연 경로 = 1.0)"""
+        raw = self.rank(path)
+        if not raw:
+            return 0.0
+        if now is None:
+            now = time.time()
+        return raw * 2.0 ** ((self._ref - now) / self.half_life)
+
+    # 기록
+    def record(self, path: str, when: Optional[float] = None):
+        """경로를 연 기록 추가"""
+        key = normalize_path(path)
+        if not key or "\n" in key:
+            return
+        if when is None:
+            when = time.time()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        line = f"{when:.0f}\t1\t{key}\n".encode("utf-8")
+        while True:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                # 기다리는 동안 압축으로 파일이 교체되었으면 새 파일에 다시 씀
+                if os.fstat(fd).st_ino == os.stat(self.path).st_ino:
+                    os.write(fd, line)
+                    break
+            finally:
+                os.close(fd)
+        self.refresh()
+
+    def refresh(self) -> bool:
+        """다른 프로세스 (CLI 등) 가 덧붙인 줄만 읽어 반영 (점수가 바뀌었으면 True)"""
+        changed = self._read_tail()
+        if changed and self._lines > max(self.compact_lines, 4 * len(self._scores)):
+            self.compact()
+        return changed
+
+    def _read_tail(self) -> bool:
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            if self._scores:
+                self._reset()
+                self.version += 1
+                return True
+            return False
+        if st.st_ino != self._inode or st.st_size < self._offset:
+            # 압축되어 파일이 교체됨: 처음부터 다시 읽음
+            self._reset()
+            self._inode = st.st_ino
+        if st.st_size == self._offset:
+            return False
+
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            data = f.read(st.st_size - self._offset)
+        # 쓰는 중인 마지막 줄은 다음에 읽음
+        end = data.rfind(b"\n") + 1
+        if end == 0:
+            return False
+        self._offset += end
+        for line in data[:end].decode("utf-8", "replace").splitlines():
+            parts = line.split("\t", 2)
+            if len(parts) != 3:
+                continue
+            try:
+                self._add(parts[2], float(parts[0]), float(parts[1]))
+            except ValueError:
+                continue
+            self._lines += 1
+        self.version += 1
+        return True
+
+    def compact(self, keep: Optional[Iterable[str]] = None):
+        """경로마다 현재 점수 한 줄만 남기도록 로그 재작성 (keep 지정 시 해당 경로만 유지)"""
+        if keep is not None:
+            keep = {normalize_path(p) for p in keep}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        fd = os.open(self.path, os.O_RDONLY | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            # 잠금 전에 덧붙은 줄까지 반영한 뒤 교체
+            self._read_tail()
+            now = time.time()
+            lines = []
+            for path in self._scores:
+                value = self.score(path, now)
+                if value >= self.MIN_SCORE and (keep is None or path in keep):
+                    lines.append(f"{now:.0f}\t{value:.6g}\t{path}\n")
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.writelines(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+        finally:
+            os.close(fd)
+        self._reset()
+        self._read_tail()
+        self.version += 1
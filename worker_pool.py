@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Created by DINKIssTyle on 2026.
+Copyright (C) 2026 DINKI'ssTyle. All rights reserved.
+
+Self-healing worker threads for Baro Path Quick Access Indicator
+"""
+
+import itertools
+import queue
+import threading
+from typing import Any, Callable, Dict, Hashable, Set
+
+from gi.repository import GLib
+
+
+class WorkerPool:
+    """키 단위 작업을 데몬 스레드 workers 개에서 처리하는 작업 스레드 묶음
+
+    작업 스레드에서 work(key, *args) 를 실행하고 결과는 메인 루프에서
+    done(key, result) 로 전달한다. 같은 키는 대기/처리 중에 다시 넣지 않는다.
+
+    응답 없는 마운트에서 stat/scandir 이 멈추면 그 스레드는 돌아오지 않으므로,
+    시간 초과 때 abandon(key) 를 부르면 해당 스레드를 포기한 것으로 세고 새 스레드를
+    띄워 다른 키의 작업이 계속 처리되게 한다. 포기한 스레드는 작업이 끝나면 스스로
+    종료하며, 동시에 max_abandoned 개까지만 대신한다.
+    """
+
+    def __init__(self, name: str, work: Callable[..., Any], done: Callable[[Hashable, Any], None],
+                 workers: int = 2, max_abandoned: int = 8):
+        self.name = name
+        self.max_abandoned = max_abandoned
+        self._work = work
+        self._done = done
+        self._queue: "queue.Queue[tuple]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending: Set[Hashable] = set()  # 대기 중이거나 처리 중인 키
+        self._running: Dict[Hashable, threading.Thread] = {}  # 키 -> 처리 중인 스레드
+        self._abandoned: Set[threading.Thread] = set()
+        self._idle = 0  # 다음 작업을 받을 수 있는 스레드 수
+        self._ids = itertools.count()
+        for _ in range(workers):
+            self._spawn()
+
+    @property
+    def abandoned(self) -> int:
+        """포기한 (아직 멈춰 있는) 스레드 수"""
+        with self._lock:
+            return len(self._abandoned)
+
+    def put(self, key: Hashable, *args) -> bool:
+        """작업 추가 (이미 대기/처리 중인 키면 False)"""
+        with self._lock:
+            if key in self._pending:
+                return False
+            self._pending.add(key)
+        self._queue.put((key, args))
+        return True
+
+    @property
+    def free(self) -> int:
+        """새 작업을 바로 시작할 수 있는 스레드 수 (대기 중인 작업 제외)"""
+        with self._lock:
+            return max(0, self._idle - (len(self._pending) - len(self._running)))
+
+    def pending(self, key: Hashable) -> bool:
+        """key 작업이 아직 끝나지 않았는지 (포기한 스레드에서 처리 중인 경우 포함)"""
+        with self._lock:
+            return key in self._pending
+
+    def abandon(self, key: Hashable) -> bool:
+        """key 를 처리 중인 스레드를 포기하고 새 스레드로 대신 (대신했으면 True)"""
+        with self._lock:
+            thread = self._running.get(key)
+            if (thread is None or thread in self._abandoned
+                    or len(self._abandoned) >= self.max_abandoned):
+                return False
+            self._abandoned.add(thread)
+        self._spawn()
+        return True
+
+    def _spawn(self):
+        with self._lock:
+            self._idle += 1
+        # 멈춘 작업이 종료를 막지 않도록 데몬 스레드 사용
+        worker = threading.Thread(target=self._worker, name=f"{self.name}-{next(self._ids)}", daemon=True)
+        worker.start()
+
+    def _worker(self):
+        me = threading.current_thread()
+        while True:
+            key, args = self._queue.get()
+            with self._lock:
+                self._idle -= 1
+                self._running[key] = me
+            result = self._work(key, *args)
+            # done() 보다 먼저 정리해야 done() 안에서 같은 키를 다시 넣을 수 있음
+            with self._lock:
+                del self._running[key]
+                self._pending.discard(key)
+                abandoned = me in self._abandoned
+                self._abandoned.discard(me)
+                if not abandoned:
+                    self._idle += 1
+            GLib.idle_add(self._done, key, result)
+            if abandoned:
+                # 이미 다른 스레드가 대신하고 있으므로 종료
+                return